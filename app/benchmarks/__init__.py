@@ -0,0 +1,7 @@
+"""In-process performance tooling for the catalogue.
+
+The modules in this package exercise the application's own code paths
+against canned upstream payloads so that CPU and memory costs can be
+measured without access to Rosetta, Wagtail or the delivery options service.
+They are used by management commands and are never imported by the views.
+"""
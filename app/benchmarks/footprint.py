@@ -0,0 +1,124 @@
+"""Memory retained by module-level data loaded at import time.
+
+Each target is measured in a fresh interpreter so that modules imported by an
+earlier target are not shared with, and hidden from, a later one. Run as
+`python -m app.benchmarks.footprint <target>`, it prints the measurement as
+JSON; use `measure_footprint()` to run every target in a subprocess.
+
+This module deliberately imports nothing from the application at module
+level, anything it imported would be loaded before measuring.
+"""
+
+import gc
+import importlib
+import json
+import os
+import subprocess
+import sys
+import tracemalloc
+
+
+def _load_collection_names():
+    importlib.import_module("app.search.collection_names")
+
+
+def _load_department_details():
+    importlib.import_module("app.deliveryoptions.departments")
+
+
+def _prepare_delivery_options_json():
+    importlib.import_module("app.deliveryoptions.delivery_options")
+
+
+def _load_delivery_options_json():
+    from app.deliveryoptions.constants import DELIVERY_OPTIONS_CONFIG
+    from app.deliveryoptions.delivery_options import read_delivery_options
+
+    read_delivery_options(DELIVERY_OPTIONS_CONFIG)
+
+
+def _load_jinja_environment():
+    from django.template import engines
+
+    _ = engines["jinja2"].env
+
+
+# target: (description, untraced preparation, traced load)
+FOOTPRINT_TARGETS = {
+    "collection_names": (
+        "COLLECTION_NAMES and COLLECTION_CHOICES",
+        None,
+        _load_collection_names,
+    ),
+    "department_details": (
+        "DEPARTMENT_DETAILS",
+        None,
+        _load_department_details,
+    ),
+    "delivery_options_json": (
+        "delivery_options.json read through read_delivery_options()",
+        _prepare_delivery_options_json,
+        _load_delivery_options_json,
+    ),
+    "jinja_environment": (
+        "Jinja2 template engine environment",
+        None,
+        _load_jinja_environment,
+    ),
+}
+
+
+def measure_in_process(target: str) -> dict:
+    """Measures a target in the current interpreter after django.setup()."""
+
+    import django
+
+    django.setup()
+
+    description, prepare, load = FOOTPRINT_TARGETS[target]
+    if prepare:
+        prepare()
+
+    gc.collect()
+    tracemalloc.start()
+    baseline, _ = tracemalloc.get_traced_memory()
+    load()
+    gc.collect()
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return {
+        "target": target,
+        "description": description,
+        "retained_kib": (current - baseline) / 1024,
+        "peak_kib": (peak - baseline) / 1024,
+    }
+
+
+def measure_footprint(targets: list[str] | None = None) -> list[dict]:
+    """Measures each target in its own subprocess, from the project directory."""
+
+    from django.conf import settings
+
+    env = os.environ | {
+        "DJANGO_SETTINGS_MODULE": os.environ.get(
+            "DJANGO_SETTINGS_MODULE", "config.settings.production"
+        )
+    }
+    results = []
+    for target in targets or FOOTPRINT_TARGETS:
+        completed = subprocess.run(
+            [sys.executable, "-m", __name__, target],
+            cwd=settings.BASE_DIR,
+            env=env,
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        # the measurement is the last line, anything before it is logging
+        results.append(json.loads(completed.stdout.strip().splitlines()[-1]))
+    return results
+
+
+if __name__ == "__main__":
+    print(json.dumps(measure_in_process(sys.argv[1])))
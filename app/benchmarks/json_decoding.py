@@ -0,0 +1,88 @@
+"""Benchmark harness for decoding API responses.
+
+Decodes canned `get` and `search` payloads, serialised as Rosetta sends them,
+with each available JSON decoder, against the text decoding and stdlib parse
+of requests' `Response.json()`.
+"""
+
+import gc
+import json
+import tracemalloc
+from collections.abc import Callable
+
+from app.lib.json_decoder import DECODERS, decode_json
+from app.search.buckets import Aggregation
+
+from .payloads import (
+    LONG_FILTER_ENTRIES,
+    SEARCH_RESULTS,
+    long_filter_payload,
+    record_payload,
+    search_payload,
+)
+from .profiler import StageProfiler
+
+RESPONSE_JSON = "response.json()"
+
+
+def default_payloads(
+    results: int = SEARCH_RESULTS, entries: int = LONG_FILTER_ENTRIES
+) -> dict[str, bytes]:
+    return {
+        name: json.dumps(payload).encode()
+        for name, payload in (
+            ("get", record_payload()),
+            ("search", search_payload(results=results)),
+            (
+                "search:longCollection",
+                long_filter_payload(Aggregation.COLLECTION, entries=entries),
+            ),
+            (
+                "search:longSubject",
+                long_filter_payload(Aggregation.SUBJECT, entries=entries),
+            ),
+        )
+    }
+
+
+def decoders() -> dict[str, Callable[[bytes], object]]:
+    """Returns the decoders to compare, by stage name."""
+
+    return {RESPONSE_JSON: lambda content: json.loads(content.decode("utf-8"))} | {
+        name: lambda content, name=name: decode_json(content, decoder=name)
+        for name in DECODERS
+    }
+
+
+def benchmark_json_decoding(
+    payloads: dict[str, bytes],
+    iterations: int = 50,
+    warmup: int = 5,
+    trace_memory: bool = True,
+) -> dict[str, StageProfiler]:
+    """Returns a profiler per payload, with a stage per decoder."""
+
+    results = {}
+    for name, content in payloads.items():
+        profiler = StageProfiler()
+        for decoder_name, decode in decoders().items():
+            for _ in range(warmup):
+                decode(content)
+            for _ in range(iterations):
+                with profiler.stage(decoder_name):
+                    decode(content)
+
+        if trace_memory:
+            memory_profiler = StageProfiler(trace_memory=True)
+            gc.collect()
+            tracemalloc.start()
+            try:
+                for decoder_name, decode in decoders().items():
+                    with memory_profiler.stage(decoder_name):
+                        decode(content)
+            finally:
+                tracemalloc.stop()
+            profiler.merge(memory_profiler)
+
+        results[f"{name} ({len(content) / 1024:.0f} KiB)"] = profiler
+    return results
@@ -0,0 +1,231 @@
+"""Open-loop load test driving the ASGI application against stub upstreams.
+
+Requests are started at a fixed rate regardless of how quickly earlier ones
+complete, so queueing inside the application shows up in the latencies.
+"""
+
+import asyncio
+import random
+import statistics
+import time
+from collections import Counter
+from dataclasses import dataclass, field
+from urllib.parse import urlencode
+
+from django.conf import settings
+from django.core.handlers.asgi import ASGIHandler
+from django.test import override_settings
+
+from app.search.buckets import Aggregation
+from app.search.constants import FieldsConstant
+
+from .payloads import subject_names
+from .profiler import percentile
+from .stubs import StubUpstreams, UpstreamProfile, stub_upstreams
+
+LOADTEST_HOST = "loadtest.local"
+
+# relative weights of each request kind in the default traffic mix
+DEFAULT_MIX = {
+    "record": 6,
+    "search": 3,
+    "filter_list": 1,
+}
+
+
+def record_url() -> str:
+    return f"/catalogue/id/C{random.randint(100000, 100999)}/"
+
+
+def search_url() -> str:
+    params = {
+        FieldsConstant.Q: random.choice(subject_names(50)),
+        "page": random.randint(1, 5),
+    }
+    return f"/catalogue/search/?{urlencode(params)}"
+
+
+def filter_list_url() -> str:
+    long_aggs = random.choice([agg.long_aggs for agg in Aggregation if agg.long_aggs])
+    group = "nonTna" if long_aggs == Aggregation.HELD_BY.long_aggs else "tna"
+    params = {FieldsConstant.GROUP: group, FieldsConstant.FILTER_LIST: long_aggs}
+    return f"/catalogue/search/?{urlencode(params)}"
+
+
+URL_BUILDERS = {
+    "record": record_url,
+    "search": search_url,
+    "filter_list": filter_list_url,
+}
+
+
+@dataclass
+class RequestResult:
+    kind: str
+    status: int
+    latency: float
+
+
+@dataclass
+class LoadTestResult:
+    duration: float
+    results: list[RequestResult] = field(default_factory=list)
+    upstream_calls: dict[str, int] = field(default_factory=dict)
+    upstream_errors: dict[str, int] = field(default_factory=dict)
+
+    def _latency_summary(self, results: list[RequestResult]) -> dict:
+        latencies = [result.latency * 1000 for result in results]
+        return {
+            "requests": len(results),
+            "mean_ms": statistics.fmean(latencies) if latencies else 0,
+            "p50_ms": percentile(latencies, 50),
+            "p90_ms": percentile(latencies, 90),
+            "p95_ms": percentile(latencies, 95),
+            "p99_ms": percentile(latencies, 99),
+            "max_ms": max(latencies, default=0),
+        }
+
+    def report(self) -> dict:
+        total = len(self.results)
+        upstream_total = sum(self.upstream_calls.values())
+        return {
+            "requests": total,
+            "duration_s": self.duration,
+            "throughput_rps": total / self.duration if self.duration else 0,
+            "statuses": dict(Counter(result.status for result in self.results)),
+            "latency": self._latency_summary(self.results),
+            "latency_by_kind": {
+                kind: self._latency_summary(
+                    [result for result in self.results if result.kind == kind]
+                )
+                for kind in sorted({result.kind for result in self.results})
+            },
+            "upstream_calls": self.upstream_calls,
+            "upstream_errors": self.upstream_errors,
+            # upstream requests made per application request
+            "amplification": {
+                name: calls / total if total else 0
+                for name, calls in (
+                    self.upstream_calls | {"total": upstream_total}
+                ).items()
+            },
+        }
+
+
+async def asgi_get(application, url: str) -> int:
+    """Sends a GET for url through the ASGI application, returns the status."""
+
+    path, _, query_string = url.partition("?")
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "GET",
+        "scheme": "http",
+        "path": path,
+        "raw_path": path.encode(),
+        "query_string": query_string.encode(),
+        "root_path": "",
+        "headers": [
+            (b"host", LOADTEST_HOST.encode()),
+            (b"user-agent", b"catalogue-loadtest"),
+        ],
+        "client": ("127.0.0.1", 0),
+        "server": (LOADTEST_HOST, 80),
+    }
+    request_sent = False
+    disconnected = asyncio.Event()
+    status = 0
+
+    async def receive():
+        nonlocal request_sent
+        if not request_sent:
+            request_sent = True
+            return {"type": "http.request", "body": b"", "more_body": False}
+        await disconnected.wait()
+        return {"type": "http.disconnect"}
+
+    async def send(message):
+        nonlocal status
+        if message["type"] == "http.response.start":
+            status = message["status"]
+
+    try:
+        await application(scope, receive, send)
+    finally:
+        disconnected.set()
+    return status
+
+
+async def _drive(
+    application, rps: float, duration: float, mix: dict[str, int]
+) -> list[RequestResult]:
+    kinds = list(mix)
+    weights = [mix[kind] for kind in kinds]
+    results = []
+
+    async def timed_request(kind: str):
+        url = URL_BUILDERS[kind]()
+        start = time.perf_counter()
+        status = await asgi_get(application, url)
+        results.append(RequestResult(kind, status, time.perf_counter() - start))
+
+    tasks = []
+    interval = 1 / rps
+    start = time.perf_counter()
+    scheduled = 0
+    while (next_start := scheduled * interval) < duration:
+        delay = start + next_start - time.perf_counter()
+        if delay > 0:
+            await asyncio.sleep(delay)
+        kind = random.choices(kinds, weights)[0]
+        tasks.append(asyncio.create_task(timed_request(kind)))
+        scheduled += 1
+    await asyncio.gather(*tasks)
+    return results
+
+
+def run_load_test(
+    rps: float = 10,
+    duration: float = 10,
+    mix: dict[str, int] | None = None,
+    profiles: dict[str, UpstreamProfile] | None = None,
+    warmup: int = 3,
+    seed: int | None = None,
+) -> LoadTestResult:
+    """Runs the load test against freshly started stub upstreams.
+
+    warmup: requests of each kind sent, and excluded from the results, before
+    measuring so lazily built state (templates, caches) does not skew latency.
+    """
+
+    mix = mix or DEFAULT_MIX
+    random.seed(seed)
+    with stub_upstreams(profiles) as upstreams:
+        with override_settings(**_settings_for(upstreams)):
+            application = ASGIHandler()
+
+            async def warm_up():
+                for kind in mix:
+                    for _ in range(warmup):
+                        await asgi_get(application, URL_BUILDERS[kind]())
+
+            asyncio.run(warm_up())
+            upstreams.reset_counts()
+
+            start = time.perf_counter()
+            results = asyncio.run(_drive(application, rps, duration, mix))
+            elapsed = time.perf_counter() - start
+
+        return LoadTestResult(
+            duration=elapsed,
+            results=results,
+            upstream_calls={upstream.name: upstream.calls for upstream in upstreams},
+            upstream_errors={upstream.name: upstream.errors for upstream in upstreams},
+        )
+
+
+def _settings_for(upstreams: StubUpstreams) -> dict:
+    return upstreams.settings | {
+        "ALLOWED_HOSTS": [*settings.ALLOWED_HOSTS, LOADTEST_HOST],
+    }
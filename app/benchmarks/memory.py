@@ -0,0 +1,159 @@
+"""Per-request memory profiling with tracemalloc.
+
+Each request kind is sent through the full Django stack with the upstream
+services answered in-process by the stub responders, and measured for:
+- peak: the high-water mark of memory allocated while handling the request
+- retained: memory still allocated once the response is discarded and garbage
+  collected, a non-zero value after warm-up suggests a cache growing or a leak
+
+The Django cache is replaced with a dummy cache so every request takes the
+uncached path, measuring the worst case.
+"""
+
+import gc
+import re
+import statistics
+import tracemalloc
+from dataclasses import dataclass, field
+
+import responses
+from django.conf import settings
+from django.test import Client, override_settings
+
+from .stubs import ROSETTA_PATH, upstream_responders
+
+# peak memory, in KiB, a single request of each kind is expected to stay within
+DEFAULT_BUDGETS_KIB = {
+    "record": 1024,
+    "search": 1024,
+    "filter_list": 12288,
+    "catalogue": 8192,
+}
+
+REQUEST_URLS = {
+    "record": "/catalogue/id/C100001/",
+    "search": "/catalogue/search/?q=army",
+    "filter_list": "/catalogue/search/?filter_list=longSubject",
+    "catalogue": "/catalogue/",
+}
+
+UPSTREAM_URLS = {
+    "rosetta": f"https://rosetta.memory.test{ROSETTA_PATH}",
+    "wagtail": "https://wagtail.memory.test",
+    "delivery_options": f"https://delivery-options.memory.test{ROSETTA_PATH}",
+}
+
+
+@dataclass
+class RequestMemory:
+    kind: str
+    budget_kib: float
+    peaks: list[float] = field(default_factory=list)
+    retained: list[float] = field(default_factory=list)
+
+    @property
+    def max_peak_kib(self) -> float:
+        return max(self.peaks, default=0)
+
+    @property
+    def over_budget(self) -> bool:
+        return self.max_peak_kib > self.budget_kib
+
+    def as_dict(self) -> dict:
+        return {
+            "kind": self.kind,
+            "iterations": len(self.peaks),
+            "mean_peak_kib": statistics.fmean(self.peaks) if self.peaks else 0,
+            "max_peak_kib": self.max_peak_kib,
+            "mean_retained_kib": (
+                statistics.fmean(self.retained) if self.retained else 0
+            ),
+            "max_retained_kib": max(self.retained, default=0),
+            "budget_kib": self.budget_kib,
+            "over_budget": self.over_budget,
+        }
+
+
+def _register_upstreams(mock: responses.RequestsMock):
+    """Answers requests to UPSTREAM_URLS with the stub responders."""
+
+    for name, responder in upstream_responders().items():
+        base_url = UPSTREAM_URLS[name]
+        prefix = base_url.removesuffix(ROSETTA_PATH)
+
+        def callback(request, responder=responder, prefix=prefix):
+            response = responder(request.method, request.url.removeprefix(prefix))
+            return response.status, response.headers, response.body
+
+        mock.add_callback(
+            responses.GET, re.compile(re.escape(prefix) + ".*"), callback=callback
+        )
+
+
+def _measure(
+    client: Client, mock: responses.RequestsMock, url: str
+) -> tuple[float, float]:
+    """Returns the peak and retained KiB for a single request."""
+
+    gc.collect()
+    tracemalloc.reset_peak()
+    baseline, _ = tracemalloc.get_traced_memory()
+    response = client.get(url)
+    _, peak = tracemalloc.get_traced_memory()
+    del response
+    # the mock records every upstream call, which is not application memory
+    mock.calls.reset()
+    for registered in mock.registered():
+        registered.calls.reset()
+    gc.collect()
+    current, _ = tracemalloc.get_traced_memory()
+    return (peak - baseline) / 1024, (current - baseline) / 1024
+
+
+def profile_requests(
+    kinds: list[str] | None = None,
+    iterations: int = 5,
+    warmup: int = 2,
+    budgets: dict[str, float] | None = None,
+) -> list[RequestMemory]:
+    """Measures the memory used by each request kind against its budget.
+
+    budgets: peak KiB keyed by request kind, overriding DEFAULT_BUDGETS_KIB
+    """
+
+    budgets = DEFAULT_BUDGETS_KIB | (budgets or {})
+    results = []
+    with (
+        override_settings(
+            ROSETTA_API_URL=UPSTREAM_URLS["rosetta"],
+            WAGTAIL_API_URL=UPSTREAM_URLS["wagtail"],
+            DELIVERY_OPTIONS_API_URL=UPSTREAM_URLS["delivery_options"],
+            ALLOWED_HOSTS=[*settings.ALLOWED_HOSTS, "testserver"],
+            CACHES={
+                "default": {
+                    "BACKEND": "django.core.cache.backends.dummy.DummyCache",
+                }
+            },
+        ),
+        responses.RequestsMock(assert_all_requests_are_fired=False) as mock,
+    ):
+        _register_upstreams(mock)
+        client = Client()
+        for kind in kinds or REQUEST_URLS:
+            url = REQUEST_URLS[kind]
+            # build lazily initialised state (compiled templates, lru caches)
+            # before measuring
+            for _ in range(warmup):
+                client.get(url)
+
+            result = RequestMemory(kind=kind, budget_kib=budgets[kind])
+            tracemalloc.start()
+            try:
+                for _ in range(iterations):
+                    peak, retained = _measure(client, mock, url)
+                    result.peaks.append(peak)
+                    result.retained.append(retained)
+            finally:
+                tracemalloc.stop()
+            results.append(result)
+    return results
@@ -0,0 +1,219 @@
+"""Canned Rosetta payloads shaped like the live `get` and `search` responses."""
+
+import itertools
+import string
+
+from app.search.buckets import Aggregation
+from app.search.collection_names import COLLECTION_NAMES
+
+SEARCH_RESULTS = 20
+LONG_FILTER_ENTRIES = 5000
+
+_SUBJECT_WORDS = (
+    "Army",
+    "Aviation",
+    "Colonies",
+    "Crime",
+    "Diplomacy",
+    "Education",
+    "Empire",
+    "Health",
+    "Industry",
+    "Intelligence",
+    "Land",
+    "Law",
+    "Maritime",
+    "Medals",
+    "Migration",
+    "Navy",
+    "Politics",
+    "Railways",
+    "Religion",
+    "Taxation",
+    "Trade",
+    "Transport",
+    "War",
+    "Welfare",
+)
+
+
+def record_details(index: int, is_tna: bool = True) -> dict:
+    """Returns the `details` for a single record."""
+
+    collection = sorted(COLLECTION_NAMES)[index % len(COLLECTION_NAMES)]
+    return {
+        "id": f"C{100000 + index}",
+        "source": "CAT",
+        "referenceNumber": f"{collection} {index}/{index % 97}",
+        "summaryTitle": f"Papers relating to <mark>item</mark> {index}",
+        "cleanTitle": f"Papers relating to item {index}",
+        "title": f"Papers relating to item {index}",
+        "cleanDescription": (
+            "Scope and content: correspondence, minutes and memoranda "
+            f"concerning matter number {index}. " * 4
+        ),
+        "description": {
+            "raw": f"<scopecontent><p>Correspondence about matter {index}.</p></scopecontent>",
+            "noHtml": f"Correspondence about matter {index}.",
+        },
+        "dateCovering": f"{1800 + index % 200} - {1801 + index % 200}",
+        "heldBy": (
+            "The National Archives, Kew" if is_tna else "London Metropolitan Archives"
+        ),
+        "heldById": "A13530124" if is_tna else "A13532152",
+        "heldByCount": 1000 + index,
+        "level": {"code": 6 if is_tna else 9},
+        "groupArray": [{"value": "tna" if is_tna else "nonTna"}],
+        "digitised": index % 3 == 0,
+        "subjects": [_SUBJECT_WORDS[index % len(_SUBJECT_WORDS)]],
+    }
+
+
+def hierarchy_item(id: str, reference_number: str, level_code: int, count: int):
+    return {
+        "@admin": {"id": id},
+        "identifier": [{"reference_number": reference_number}],
+        "level": {"code": level_code},
+        "source": {"value": "CAT"},
+        "summary": {"title": f"Records at level {level_code} for {reference_number}"},
+        "count": count,
+    }
+
+
+def record_payload(id: str = "C100001", is_tna: bool = True) -> dict:
+    """Returns a Rosetta `get` response for a single record with hierarchy."""
+
+    details = record_details(1, is_tna=is_tna) | {"id": id}
+    details["@hierarchy"] = [
+        hierarchy_item("C1", "DEFE", 1, 63282),
+        hierarchy_item("C2", "DEFE", 2, 3690),
+        hierarchy_item("C3", "DEFE 65", 3, 800),
+        hierarchy_item("C4", "DEFE 65/1", 4, 80),
+        hierarchy_item("C5", "DEFE 65/1/1", 5, 8),
+        hierarchy_item(id, details["referenceNumber"], 6, 1),
+    ]
+    details["@next"] = hierarchy_item("C100002", "DEFE 65/1/2", 6, 1)
+    details["@previous"] = hierarchy_item("C100000", "DEFE 65/1/0", 6, 1)
+    details["parent"] = hierarchy_item("C5", "DEFE 65/1/1", 5, 8)
+    return {"data": [{"@template": {"details": details}}]}
+
+
+def subject_names(count: int) -> list[str]:
+    """Returns `count` unique subject names spread across the alphabet."""
+
+    names = []
+    for suffix in itertools.count(1):
+        for letter in string.ascii_uppercase:
+            for word in _SUBJECT_WORDS:
+                if len(names) >= count:
+                    return names
+                names.append(f"{letter}{word.lower()} {suffix}")
+    return names
+
+
+def collection_codes(count: int) -> list[str]:
+    """Returns `count` collection codes, real lettercodes first."""
+
+    codes = sorted(COLLECTION_NAMES)
+    extra = (f"Z{index:04d}" for index in itertools.count(1))
+    while len(codes) < count:
+        codes.append(next(extra))
+    return codes[:count]
+
+
+def _entries(values: list[str]) -> list[dict]:
+    return [
+        {"value": value, "doc_count": (len(values) - index) * 7}
+        for index, value in enumerate(values)
+    ]
+
+
+def _group_buckets() -> list[dict]:
+    return [
+        {
+            "name": "group",
+            "entries": [
+                {"value": "tna", "count": 26008838},
+                {"value": "nonTna", "count": 9238478},
+            ],
+        }
+    ]
+
+
+def search_payload(results: int = SEARCH_RESULTS, is_tna: bool = True) -> dict:
+    """Returns a Rosetta `search` response with results and full aggregations."""
+
+    if is_tna:
+        aggregations = [
+            {
+                "name": Aggregation.LEVEL.aggs,
+                "entries": _entries(
+                    ["Item", "Piece", "Series", "Division", "Lettercode"]
+                ),
+                "other": 0,
+            },
+            {
+                "name": Aggregation.COLLECTION.aggs,
+                "entries": _entries(collection_codes(10)),
+                "other": 1250,
+            },
+            {
+                "name": Aggregation.CLOSURE.aggs,
+                "entries": _entries(
+                    [
+                        "Open Document, Open Description",
+                        "Closed Or Retained Document, Open Description",
+                        "Retained Until",
+                    ]
+                ),
+                "other": 0,
+            },
+            {
+                "name": Aggregation.SUBJECT.aggs,
+                "entries": _entries(subject_names(10)),
+                "other": 8500,
+            },
+        ]
+    else:
+        aggregations = [
+            {
+                "name": Aggregation.HELD_BY.aggs,
+                "entries": _entries([f"Archive {index}" for index in range(10)]),
+                "other": 3000,
+            }
+        ]
+    return {
+        "data": [
+            {"@template": {"details": record_details(index, is_tna=is_tna)}}
+            for index in range(results)
+        ],
+        "aggregations": aggregations,
+        "buckets": _group_buckets(),
+        "stats": {"total": 26008838, "results": results},
+    }
+
+
+def long_filter_payload(
+    aggregation: Aggregation, entries: int = LONG_FILTER_ENTRIES
+) -> dict:
+    """Returns a size-0 Rosetta `search` response for a long aggregation."""
+
+    if aggregation is Aggregation.COLLECTION:
+        values = collection_codes(entries)
+    elif aggregation is Aggregation.SUBJECT:
+        values = subject_names(entries)
+    else:
+        values = [f"Archive {index}" for index in range(entries)]
+    return {
+        "data": [],
+        "aggregations": [
+            {
+                "name": aggregation.long_aggs,
+                "entries": _entries(values),
+                "total": 28083703,
+                "other": 0,
+            }
+        ],
+        "buckets": _group_buckets(),
+        "stats": {"total": 10000, "results": 0},
+    }
@@ -0,0 +1,145 @@
+"""Per-stage timing and allocation measurement."""
+
+import statistics
+import time
+import tracemalloc
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+
+
+def percentile(values: list, percent: float):
+    """Returns the nearest-rank percentile of values, 0 when empty."""
+    if not values:
+        return 0
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, round(percent / 100 * (len(ordered) - 1)))
+    return ordered[index]
+
+
+@dataclass
+class StageStats:
+    """Measurements collected for a single named stage.
+
+    Timings are in seconds and allocations in bytes. A stage that is entered
+    from within another stage is measured inclusively, e.g. update_choices is
+    also part of process_api_result.
+    """
+
+    name: str
+    timings: list[float] = field(default_factory=list)
+    allocated: list[int] = field(default_factory=list)
+    peaks: list[int] = field(default_factory=list)
+
+    @property
+    def calls(self) -> int:
+        return max(len(self.timings), len(self.allocated))
+
+    def as_dict(self) -> dict:
+        return {
+            "stage": self.name,
+            "calls": self.calls,
+            "mean_ms": statistics.fmean(self.timings) * 1000 if self.timings else 0,
+            "median_ms": (
+                statistics.median(self.timings) * 1000 if self.timings else 0
+            ),
+            "p95_ms": percentile(self.timings, 95) * 1000,
+            "mean_allocated_kib": (
+                statistics.fmean(self.allocated) / 1024 if self.allocated else 0
+            ),
+            "max_peak_kib": max(self.peaks) / 1024 if self.peaks else 0,
+        }
+
+
+class StageProfiler:
+    """Collects timings, or allocations when tracing memory, for named stages.
+
+    Timings and allocations are collected in separate passes as tracemalloc
+    adds enough overhead to distort wall-clock measurements.
+
+    Usage:
+        profiler = StageProfiler()
+        with profiler.stage("render"):
+            response.render()
+    """
+
+    def __init__(self, trace_memory: bool = False):
+        self.trace_memory = trace_memory
+        self.stages: dict[str, StageStats] = {}
+        # peak traced memory of each running stage, from before the nested
+        # stages reset the tracemalloc peak
+        self._peaks: list[int] = []
+
+    def _stats_for(self, name: str) -> StageStats:
+        if name not in self.stages:
+            self.stages[name] = StageStats(name=name)
+        return self.stages[name]
+
+    @contextmanager
+    def stage(self, name: str):
+        stats = self._stats_for(name)
+        if self.trace_memory and tracemalloc.is_tracing():
+            # peak is reset per stage so nested stages report their own peak
+            # relative to the memory in use when they started, the peak so far
+            # is kept for the enclosing stage
+            current_before, peak_before = tracemalloc.get_traced_memory()
+            if self._peaks:
+                self._peaks[-1] = max(self._peaks[-1], peak_before)
+            tracemalloc.reset_peak()
+            self._peaks.append(0)
+            try:
+                yield
+            finally:
+                current_after, peak = tracemalloc.get_traced_memory()
+                peak = max(peak, self._peaks.pop())
+                if self._peaks:
+                    self._peaks[-1] = max(self._peaks[-1], peak)
+                stats.allocated.append(current_after - current_before)
+                stats.peaks.append(peak - current_before)
+        else:
+            start = time.perf_counter()
+            try:
+                yield
+            finally:
+                stats.timings.append(time.perf_counter() - start)
+
+    def wrap(self, name: str, func):
+        """Returns func wrapped so every call is measured as stage `name`."""
+
+        def wrapper(*args, **kwargs):
+            with self.stage(name):
+                return func(*args, **kwargs)
+
+        return wrapper
+
+    def merge(self, other: "StageProfiler") -> None:
+        """Merges the measurements from another profiler into this one."""
+        for name, other_stats in other.stages.items():
+            stats = self._stats_for(name)
+            stats.timings.extend(other_stats.timings)
+            stats.allocated.extend(other_stats.allocated)
+            stats.peaks.extend(other_stats.peaks)
+
+    def report(self) -> list[dict]:
+        return [stats.as_dict() for stats in self.stages.values()]
+
+
+def format_report(rows: list[dict], columns: list[str]) -> str:
+    """Formats a list of report rows as a plain text table."""
+
+    def render(value):
+        if isinstance(value, float):
+            return f"{value:.3f}"
+        return str(value)
+
+    widths = {
+        column: max([len(column)] + [len(render(row.get(column, ""))) for row in rows])
+        for column in columns
+    }
+    lines = ["  ".join(column.ljust(widths[column]) for column in columns)]
+    for row in rows:
+        lines.append(
+            "  ".join(
+                render(row.get(column, "")).ljust(widths[column]) for column in columns
+            )
+        )
+    return "\n".join(lines)
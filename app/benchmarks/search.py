@@ -0,0 +1,182 @@
+"""Benchmark harness for the catalogue search view pipeline.
+
+Runs CatalogueSearchView in-process against canned `search` payloads and
+measures each stage of the pipeline: form building, validation, API params,
+result processing, choice updates, selected filters, filter visibility and
+template rendering.
+"""
+
+import copy
+import gc
+import tracemalloc
+from dataclasses import dataclass
+from typing import Callable
+from unittest import mock
+
+from django.test import RequestFactory
+
+from app.lib.fields import DynamicMultipleChoiceField
+from app.search.buckets import Aggregation
+from app.search.constants import FieldsConstant
+from app.search.models import APISearchResponse
+from app.search.views import CatalogueSearchView
+
+from .payloads import (
+    LONG_FILTER_ENTRIES,
+    SEARCH_RESULTS,
+    long_filter_payload,
+    search_payload,
+)
+from .profiler import StageProfiler
+
+SEARCH_URL = "/catalogue/search/"
+
+
+@dataclass
+class SearchScenario:
+    """A request to benchmark and the canned payload to answer it with."""
+
+    name: str
+    params: dict
+    payload: Callable[[], dict]
+
+
+def default_scenarios(
+    results: int = SEARCH_RESULTS, entries: int = LONG_FILTER_ENTRIES
+) -> list[SearchScenario]:
+    return [
+        SearchScenario(
+            name="search",
+            params={
+                FieldsConstant.Q: "army",
+                FieldsConstant.LEVEL: ["Item", "Piece"],
+                FieldsConstant.COLLECTION: ["ADM", "WO"],
+                FieldsConstant.SUBJECT: ["Aarmy 1"],
+                f"{FieldsConstant.COVERING_DATE_FROM}-year": "1900",
+            },
+            payload=lambda: search_payload(results=results),
+        ),
+        SearchScenario(
+            name="filter_list:longCollection",
+            params={
+                FieldsConstant.Q: "army",
+                FieldsConstant.COLLECTION: ["ADM", "WO"],
+                FieldsConstant.FILTER_LIST: Aggregation.COLLECTION.long_aggs,
+            },
+            payload=lambda: long_filter_payload(Aggregation.COLLECTION, entries),
+        ),
+        SearchScenario(
+            name="filter_list:longSubject",
+            params={
+                FieldsConstant.Q: "army",
+                FieldsConstant.SUBJECT: ["Aarmy 1"],
+                FieldsConstant.FILTER_LIST: Aggregation.SUBJECT.long_aggs,
+            },
+            payload=lambda: long_filter_payload(Aggregation.SUBJECT, entries),
+        ),
+    ]
+
+
+class BenchmarkCatalogueSearchView(CatalogueSearchView):
+    """CatalogueSearchView with each pipeline stage measured by a profiler
+    and the upstream call answered from a canned payload."""
+
+    profiler: StageProfiler = None
+    payload: dict = None
+
+    def setup(self, request, *args, **kwargs):
+        with self.profiler.stage("setup (form building)"):
+            super().setup(request, *args, **kwargs)
+        for field in self.form.fields.values():
+            if isinstance(field, DynamicMultipleChoiceField):
+                field.update_choices = self.profiler.wrap(
+                    "update_choices", field.update_choices
+                )
+        self.form.is_valid = self.profiler.wrap("form.is_valid", self.form.is_valid)
+
+    def validate_suspicious_operation(self):
+        with self.profiler.stage("validate_suspicious_operation"):
+            return super().validate_suspicious_operation()
+
+    def get_api_result(self, query, results_per_page, page, sort, params):
+        with self.profiler.stage("get_api_result (canned)"):
+            return APISearchResponse(self.payload)
+
+    def get_api_params(self, form, current_bucket):
+        with self.profiler.stage("get_api_params"):
+            return super().get_api_params(form, current_bucket)
+
+    def process_api_result(self, form, api_result):
+        with self.profiler.stage("process_api_result"):
+            return super().process_api_result(form, api_result)
+
+    def build_selected_filters_list(self):
+        with self.profiler.stage("build_selected_filters_list"):
+            return super().build_selected_filters_list()
+
+    def _set_filters_visible_attr(self, context):
+        with self.profiler.stage("_set_filters_visible_attr"):
+            return super()._set_filters_visible_attr(context)
+
+    def get_context_data(self, **kwargs):
+        with self.profiler.stage("get_context_data"):
+            return super().get_context_data(**kwargs)
+
+
+def run_scenario(
+    scenario: SearchScenario, profiler: StageProfiler, request_factory=None
+):
+    """Runs a single request for the scenario through the view and renders it."""
+
+    request_factory = request_factory or RequestFactory()
+    request = request_factory.get(SEARCH_URL, scenario.params)
+    # the view mutates aggregation entries, so each run gets a fresh copy
+    payload = copy.deepcopy(scenario.payload())
+    view = BenchmarkCatalogueSearchView.as_view(profiler=profiler, payload=payload)
+    with profiler.stage("total"):
+        response = view(request)
+        with profiler.stage("render"):
+            response.render()
+    return response
+
+
+def benchmark_search(
+    scenarios: list[SearchScenario] | None = None,
+    iterations: int = 20,
+    warmup: int = 2,
+    trace_memory: bool = True,
+) -> dict[str, StageProfiler]:
+    """Benchmarks each scenario and returns a profiler per scenario.
+
+    A timing pass is followed, when trace_memory is set, by an allocation
+    pass under tracemalloc. Global notifications are stubbed out so no
+    request leaves the process.
+    """
+
+    scenarios = scenarios or default_scenarios()
+    request_factory = RequestFactory()
+    results = {}
+
+    with mock.patch("app.search.views.fetch_global_notifications", return_value=None):
+        for scenario in scenarios:
+            for _ in range(warmup):
+                run_scenario(scenario, StageProfiler(), request_factory)
+
+            timings = StageProfiler()
+            for _ in range(iterations):
+                run_scenario(scenario, timings, request_factory)
+
+            if trace_memory:
+                allocations = StageProfiler(trace_memory=True)
+                gc.collect()
+                tracemalloc.start()
+                try:
+                    for _ in range(iterations):
+                        run_scenario(scenario, allocations, request_factory)
+                finally:
+                    tracemalloc.stop()
+                timings.merge(allocations)
+
+            results[scenario.name] = timings
+
+    return results
@@ -0,0 +1,308 @@
+"""Local HTTP stand-ins for the upstream services.
+
+Each upstream gets its own server so calls can be counted per service:
+- rosetta: generated `get` and `search` responses from the canned payloads
+- wagtail: the WireMock mappings in `wiremock/mappings/wagtail-*`
+- delivery_options: the WireMock mappings in `wiremock/mappings/deliveryoptions`
+
+Every server can inject latency and an error rate to simulate a degraded
+upstream.
+"""
+
+import json
+import logging
+import os
+import random
+import re
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from functools import lru_cache
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+
+from django.conf import settings
+
+from app.search.buckets import Aggregation
+
+from .payloads import (
+    SEARCH_RESULTS,
+    long_filter_payload,
+    record_payload,
+    search_payload,
+)
+
+logger = logging.getLogger(__name__)
+
+WIREMOCK_MAPPINGS_DIR = os.path.join(settings.BASE_DIR, "wiremock", "mappings")
+
+ROSETTA_PATH = "/rosetta/data"
+
+
+@dataclass
+class UpstreamProfile:
+    """Behaviour injected into a stub upstream.
+
+    latency_ms: fixed delay added to every response
+    jitter_ms: random extra delay, uniformly distributed between 0 and jitter_ms
+    error_rate: fraction of requests (0-1) answered with 503
+    """
+
+    latency_ms: float = 0
+    jitter_ms: float = 0
+    error_rate: float = 0
+
+    def delay(self) -> float:
+        return (self.latency_ms + random.uniform(0, self.jitter_ms)) / 1000
+
+    def should_fail(self) -> bool:
+        return self.error_rate > 0 and random.random() < self.error_rate
+
+
+@dataclass
+class StubResponse:
+    status: int
+    body: bytes
+    headers: dict = field(default_factory=lambda: {"Content-Type": "application/json"})
+
+
+@dataclass
+class WireMockMapping:
+    """The subset of a WireMock stub mapping used by the repo's mappings."""
+
+    method: str
+    response: StubResponse
+    url: str = ""
+    url_path: str = ""
+    url_pattern: re.Pattern | None = None
+    url_path_pattern: re.Pattern | None = None
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "WireMockMapping":
+        request = data.get("request", {})
+        response = data.get("response", {})
+        if "jsonBody" in response:
+            body = json.dumps(response["jsonBody"]).encode()
+        else:
+            body = response.get("body", "").encode()
+        return cls(
+            method=request.get("method", "ANY"),
+            url=request.get("url", ""),
+            url_path=request.get("urlPath", ""),
+            url_pattern=(
+                re.compile(request["urlPattern"]) if "urlPattern" in request else None
+            ),
+            url_path_pattern=(
+                re.compile(request["urlPathPattern"])
+                if "urlPathPattern" in request
+                else None
+            ),
+            response=StubResponse(
+                status=response.get("status", HTTPStatus.OK),
+                body=body,
+                headers=response.get("headers", {}),
+            ),
+        )
+
+    def matches(self, method: str, url: str) -> bool:
+        if self.method not in ("ANY", method):
+            return False
+        path = urlsplit(url).path
+        if self.url:
+            return url == self.url
+        if self.url_path:
+            return path == self.url_path
+        if self.url_pattern:
+            return bool(self.url_pattern.fullmatch(url))
+        if self.url_path_pattern:
+            return bool(self.url_path_pattern.fullmatch(path))
+        return True
+
+
+def load_wiremock_mappings(*directories: str) -> list[WireMockMapping]:
+    """Loads the enabled (*.json) mappings from the given mapping directories."""
+
+    mappings = []
+    for directory in directories:
+        directory = os.path.join(WIREMOCK_MAPPINGS_DIR, directory)
+        for name in sorted(os.listdir(directory)):
+            if name.endswith(".json"):
+                with open(os.path.join(directory, name)) as mapping_file:
+                    mappings.append(WireMockMapping.from_dict(json.load(mapping_file)))
+    return mappings
+
+
+def wiremock_responder(mappings: list[WireMockMapping]):
+    def respond(method: str, url: str) -> StubResponse:
+        for mapping in mappings:
+            if mapping.matches(method, url):
+                return mapping.response
+        return StubResponse(status=HTTPStatus.NOT_FOUND, body=b"")
+
+    return respond
+
+
+@lru_cache(maxsize=4096)
+def _rosetta_get_body(id: str) -> bytes:
+    return json.dumps(record_payload(id=id)).encode()
+
+
+@lru_cache(maxsize=64)
+def _rosetta_search_body(size: int, is_tna: bool, long_aggs: str) -> bytes:
+    for aggregation in Aggregation:
+        if long_aggs and aggregation.long_aggs == long_aggs:
+            return json.dumps(long_filter_payload(aggregation)).encode()
+    return json.dumps(search_payload(results=size, is_tna=is_tna)).encode()
+
+
+def rosetta_responder(method: str, url: str) -> StubResponse:
+    """Answers Rosetta `get` and `search` with canned payloads."""
+
+    parts = urlsplit(url)
+    params = parse_qs(parts.query)
+    if parts.path == f"{ROSETTA_PATH}/get":
+        return StubResponse(
+            status=HTTPStatus.OK, body=_rosetta_get_body(params["id"][0])
+        )
+    if parts.path == f"{ROSETTA_PATH}/search":
+        size = int(params.get("size", [SEARCH_RESULTS])[0])
+        is_tna = "group:nonTna" not in params.get("filter", [])
+        long_aggs = next(
+            (value for value in params.get("aggs", []) if value.startswith("long")),
+            "",
+        )
+        return StubResponse(
+            status=HTTPStatus.OK, body=_rosetta_search_body(size, is_tna, long_aggs)
+        )
+    return StubResponse(status=HTTPStatus.NOT_FOUND, body=b"")
+
+
+class StubUpstream:
+    """A threaded HTTP server answering requests with a responder function."""
+
+    def __init__(self, name: str, responder, profile: UpstreamProfile | None = None):
+        self.name = name
+        self.responder = responder
+        self.profile = profile or UpstreamProfile()
+        self.calls = 0
+        self.errors = 0
+        self._lock = threading.Lock()
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), self._handler_class())
+        self._server.daemon_threads = True
+        self._thread = threading.Thread(
+            target=self._server.serve_forever, name=f"stub-{name}", daemon=True
+        )
+
+    @property
+    def base_url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self):
+        self._thread.start()
+
+    def stop(self):
+        self._server.shutdown()
+        self._server.server_close()
+
+    def reset_counts(self):
+        with self._lock:
+            self.calls = 0
+            self.errors = 0
+
+    def handle(self, method: str, url: str) -> StubResponse:
+        fail = self.profile.should_fail()
+        with self._lock:
+            self.calls += 1
+            if fail:
+                self.errors += 1
+        time.sleep(self.profile.delay())
+        if fail:
+            return StubResponse(status=HTTPStatus.SERVICE_UNAVAILABLE, body=b"")
+        return self.responder(method, url)
+
+    def _handler_class(self):
+        upstream = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def do_GET(self):
+                response = upstream.handle("GET", self.path)
+                self.send_response(response.status)
+                for key, value in response.headers.items():
+                    self.send_header(key, value)
+                self.send_header("Content-Length", str(len(response.body)))
+                self.end_headers()
+                self.wfile.write(response.body)
+
+            def log_message(self, format, *args):
+                pass
+
+        return Handler
+
+
+@dataclass
+class StubUpstreams:
+    rosetta: StubUpstream
+    wagtail: StubUpstream
+    delivery_options: StubUpstream
+
+    def __iter__(self):
+        yield from (self.rosetta, self.wagtail, self.delivery_options)
+
+    @property
+    def settings(self) -> dict:
+        """Settings pointing the application at the stub upstreams."""
+        return {
+            "ROSETTA_API_URL": f"{self.rosetta.base_url}{ROSETTA_PATH}",
+            "WAGTAIL_API_URL": self.wagtail.base_url,
+            "DELIVERY_OPTIONS_API_URL": f"{self.delivery_options.base_url}{ROSETTA_PATH}",
+        }
+
+    def reset_counts(self):
+        for upstream in self:
+            upstream.reset_counts()
+
+
+def upstream_responders() -> dict:
+    """Responder functions keyed by upstream name."""
+
+    return {
+        "rosetta": rosetta_responder,
+        "wagtail": wiremock_responder(
+            load_wiremock_mappings(
+                "wagtail-enrichment", "wagtail-landing", "wagtail-notifications"
+            )
+        ),
+        "delivery_options": wiremock_responder(
+            load_wiremock_mappings("deliveryoptions")
+        ),
+    }
+
+
+@contextmanager
+def stub_upstreams(profiles: dict[str, UpstreamProfile] | None = None):
+    """Starts a stub server per upstream for the duration of the context.
+
+    profiles: UpstreamProfile keyed by upstream name (rosetta, wagtail,
+    delivery_options), upstreams without a profile respond immediately.
+    """
+
+    profiles = profiles or {}
+    responders = upstream_responders()
+    upstreams = StubUpstreams(
+        **{
+            name: StubUpstream(name, responder, profiles.get(name))
+            for name, responder in responders.items()
+        }
+    )
+    for upstream in upstreams:
+        upstream.start()
+    try:
+        yield upstreams
+    finally:
+        for upstream in upstreams:
+            upstream.stop()
@@ -6,6 +6,7 @@ from django.conf import settings
 from django.core.exceptions import SuspiciousOperation
 
 from app.lib.exceptions import (
+    APICircuitOpenError,
     APIResourceNotFound,
     NoResultsFound,
     RecordNotFound,
@@ -42,6 +43,17 @@ class CustomExceptionMiddleware:
                 request=request, status_code=HTTPStatus.BAD_REQUEST
             )
 
+        # the failures opening the circuit have been reported, the page is
+        # unavailable until the API is called again
+        if isinstance(exception, APICircuitOpenError):
+            logger.warning(exception)
+            response = server_error_view(
+                request=request, status_code=HTTPStatus.SERVICE_UNAVAILABLE
+            )
+            if exception.retry_after:
+                response.headers["Retry-After"] = str(exception.retry_after)
+            return response
+
         # Exception() raised or Unhandled exceptions
 
         logger.exception(exception)
@@ -5,28 +5,63 @@ from django.conf import settings
 from django.core.exceptions import ImproperlyConfigured
 from requests import (
     ConnectionError,
-    JSONDecodeError,
+    RequestException,
+    Response,
     Timeout,
     TooManyRedirects,
     codes,
     get,
 )
+from urllib3.util.request import ACCEPT_ENCODING
 
+from .circuit_breaker import CircuitBreaker, get_circuit_breaker
+from .constants import API_RESPONSE_CHUNK_SIZE, HEDGED_ROSETTA_URIS
+from .deadline import cap_timeout, deadline_exceeded
 from .exceptions import (
     APIBadRequestError,
+    APICircuitOpenError,
     APIConnectionError,
+    APIDeadlineExceededError,
     APIError,
     APIForbiddenError,
     APINonJSONResponseError,
     APIRedirectError,
     APIRequestFailedError,
     APIResourceNotFound,
+    APIResponseTooLargeError,
     APITimeoutError,
 )
+from .hedging import hedged_call
+from .json_decoder import content_charset, decode_json
+from .transfer_stats import record_transfer
 
 logger = logging.getLogger(__name__)
 
 
+def content_length(response: Response) -> int:
+    """Returns the Content-Length of the response, 0 when missing or
+    malformed, leaving the size to be checked as the body is read."""
+
+    try:
+        return int(response.headers.get("Content-Length", 0))
+    except ValueError:
+        return 0
+
+
+def record_call(breaker: CircuitBreaker | None, failed: bool | None):
+    """Records the outcome of a call with the API's breaker, None for calls
+    saying nothing about the API's health, i.e. at the request deadline."""
+
+    if breaker is None:
+        return
+    if failed is None:
+        breaker.release()
+    elif failed:
+        breaker.record_failure()
+    else:
+        breaker.record_success()
+
+
 class JSONAPIClient:
     """
     A simple JSON API client that can be used to make requests to a JSON API.
@@ -45,6 +80,9 @@ class JSONAPIClient:
         self.headers = (
             {
                 "Cache-Control": "no-cache",
+                # the encodings requests can decode, gzip and deflate, and br or
+                # zstd when their libraries are installed
+                "Accept-Encoding": ACCEPT_ENCODING,
                 # "Accept": "application/json",  # TODO: This breaks the Rosetta API for some reason, investigate and re-add if possible
             }
             if default_headers is None
@@ -72,17 +110,37 @@ class JSONAPIClient:
         """Makes a request to the config API. Returns decoded json,
         otherwise raises error"""
         url = f"{self.api_url}/{path.lstrip('/')}"
+        if deadline_exceeded():
+            logger.warning(f"Request deadline exceeded, not requesting {url}")
+            raise APIDeadlineExceededError("Request deadline exceeded")
+        # the remaining time before the request deadline, when shorter
+        capped_timeout = cap_timeout(timeout)
+        breaker = get_circuit_breaker(self.api_url)
+        if breaker and not breaker.allow_request():
+            logger.warning(f"JSON API circuit open, not requesting {url}")
+            raise APICircuitOpenError(
+                "Circuit open, the request was not made",
+                retry_after=breaker.retry_after,
+            )
+        failed = True
         try:
             response = get(
                 url,
                 params=self.params,
                 headers=self.headers,
-                timeout=timeout,
+                timeout=capped_timeout,
+                stream=True,
             )
+            failed = response.status_code >= HTTPStatus.INTERNAL_SERVER_ERROR
         except ConnectionError:
             logger.error("JSON API connection error")
             raise APIConnectionError("A connection error occurred")
         except Timeout:
+            if capped_timeout != timeout:
+                # not the API's failure, timed out at the request deadline
+                failed = None
+                logger.warning("JSON API request deadline exceeded")
+                raise APIDeadlineExceededError("Request deadline exceeded")
             logger.error("JSON API timeout")
             raise APITimeoutError("The request timed out")
         except TooManyRedirects:
@@ -91,25 +149,24 @@ class JSONAPIClient:
         except Exception as e:
             logger.error(f"Unknown JSON API exception: {e}")
             raise APIError(str(e)) from e
+        finally:
+            # an OK response is a success once its body has been read
+            if failed is not False or response.status_code != codes.ok:
+                record_call(breaker, failed)
         logger.debug(response.url)
         if response.status_code == codes.ok:
+            failed = True
             try:
-                return response.json()
-            except JSONDecodeError:
-                logger.error("JSON API provided non-JSON response")
-
-                # TODO: Consider logging the full response somewhere secure for debugging
-                number_of_characters_to_log = 100
-                truncated_text = response.text[:number_of_characters_to_log]
-                suffix = (
-                    " ... [truncated]"
-                    if len(response.text) > number_of_characters_to_log
-                    else ""
-                )
-                logger.error(f"Non-JSON response: {truncated_text}{suffix}")
-
-                raise APINonJSONResponseError("Non-JSON response provided")
-
+                data = self.read_json(response)
+                failed = False
+                return data
+            except APIDeadlineExceededError:
+                failed = None
+                raise
+            finally:
+                record_call(breaker, failed)
+
+        response.close()
         if response.status_code == HTTPStatus.BAD_REQUEST:
             logger.error(f"Bad request: {response.url}")
             raise APIBadRequestError("Bad request")
@@ -122,6 +179,66 @@ class JSONAPIClient:
         logger.error(f"JSON API responded with {response.status_code}")
         raise APIRequestFailedError("Request failed")
 
+    def read_json(self, response: Response):
+        """Returns the decoded JSON body of a streamed OK response."""
+
+        content = self.read_content(response)
+        try:
+            return decode_json(
+                content,
+                charset=content_charset(response.headers.get("Content-Type")),
+            )
+        except (ValueError, LookupError):
+            logger.error("JSON API provided non-JSON response")
+
+            # TODO: Consider logging the full response somewhere secure for debugging
+            number_of_characters_to_log = 100
+            text = content.decode(errors="replace")
+            truncated_text = text[:number_of_characters_to_log]
+            suffix = (
+                " ... [truncated]" if len(text) > number_of_characters_to_log else ""
+            )
+            logger.error(f"Non-JSON response: {truncated_text}{suffix}")
+
+            raise APINonJSONResponseError("Non-JSON response provided")
+
+    def read_content(self, response: Response) -> bytes:
+        """Returns the decoded body of a streamed response, counting its bytes.
+        Raises APIResponseTooLargeError, without reading any further, once the
+        body is larger than API_MAX_RESPONSE_SIZE, and APIDeadlineExceededError
+        once the request deadline has passed, as the timeout only limits each
+        read."""
+
+        max_size = settings.API_MAX_RESPONSE_SIZE
+        try:
+            if max_size and content_length(response) > max_size:
+                raise APIResponseTooLargeError("Response too large")
+            chunks = []
+            size = 0
+            for chunk in response.iter_content(chunk_size=API_RESPONSE_CHUNK_SIZE):
+                size += len(chunk)
+                if max_size and size > max_size:
+                    raise APIResponseTooLargeError("Response too large")
+                if deadline_exceeded():
+                    raise APIDeadlineExceededError("Request deadline exceeded")
+                chunks.append(chunk)
+        except APIDeadlineExceededError:
+            logger.warning(f"JSON API request deadline exceeded: {response.url}")
+            response.close()
+            raise
+        except APIResponseTooLargeError:
+            logger.error(
+                f"JSON API response larger than {max_size} bytes: {response.url}"
+            )
+            response.close()
+            raise
+        except RequestException as e:
+            logger.error(f"JSON API response could not be read: {e}")
+            raise APIError(str(e)) from e
+        # the bytes on the wire, before decompression
+        record_transfer(self.api_url, response.raw.tell(), size)
+        return b"".join(chunks)
+
 
 def rosetta_request_handler(uri, params=None, timeout=None) -> dict:
     """Prepares and initiates the api url requested and returns response data"""
@@ -132,5 +249,7 @@ def rosetta_request_handler(uri, params=None, timeout=None) -> dict:
         raise ImproperlyConfigured("ROSETTA_API_URL not set")
     client = JSONAPIClient(api_url)
     client.add_parameters(params)
+    if settings.ENABLE_ROSETTA_HEDGING and uri in HEDGED_ROSETTA_URIS:
+        return hedged_call(f"rosetta:{uri}", lambda: client.get(uri, timeout=timeout))
     data = client.get(uri, timeout=timeout)
     return data
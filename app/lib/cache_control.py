@@ -0,0 +1,72 @@
+"""Cache-Control and surrogate key headers for pages.
+
+Each view has a Cache-Control policy from settings.CACHE_CONTROL. Surrogate
+keys name the content a page shows, so a shared cache (CDN) can purge every
+page showing a record, a series or the Wagtail notifications.
+"""
+
+import re
+from http import HTTPStatus
+
+from django.conf import settings
+from django.http import HttpResponse
+from django.utils.cache import patch_cache_control, patch_vary_headers
+
+SURROGATE_KEY_HEADER = "Surrogate-Key"
+
+
+def surrogate_key(*parts: str) -> str:
+    """Returns a surrogate key from its parts, i.e. ("series", "WO 95") is
+    "series-WO_95". Keys are space separated in the header."""
+
+    return "-".join(re.sub(r"\s+", "_", str(part).strip()) for part in parts)
+
+
+def record_surrogate_key(record_id: str) -> str:
+    return surrogate_key("record", record_id)
+
+
+def series_surrogate_key(reference_number: str) -> str:
+    return surrogate_key("series", reference_number)
+
+
+class CacheControlMixin:
+    """A mixin for views to set Cache-Control and Surrogate-Key headers on
+    successful and not modified responses.
+
+    Pages vary by the cookies the templates read, so responses vary by Cookie.
+    """
+
+    # key of the view's policy in settings.CACHE_CONTROL
+    cache_control_policy: str = ""
+
+    def get_cache_control_policy(self) -> str:
+        return self.cache_control_policy
+
+    def is_private(self) -> bool:
+        """Returns True when the response must not be stored by shared caches."""
+
+        return False
+
+    def get_surrogate_keys(self) -> list[str]:
+        return []
+
+    def dispatch(self, request, *args, **kwargs) -> HttpResponse:
+        response = super().dispatch(request, *args, **kwargs)
+        if response.status_code in (HTTPStatus.OK, HTTPStatus.NOT_MODIFIED):
+            self.add_cache_headers(response)
+        return response
+
+    def add_cache_headers(self, response: HttpResponse) -> None:
+        if cache_control := settings.CACHE_CONTROL.get(
+            self.get_cache_control_policy(), ""
+        ):
+            response.headers["Cache-Control"] = cache_control
+            if self.is_private():
+                patch_cache_control(response, private=True)
+        patch_vary_headers(response, ["Cookie"])
+
+        if surrogate_keys := self.get_surrogate_keys():
+            response.headers[SURROGATE_KEY_HEADER] = " ".join(
+                dict.fromkeys(surrogate_keys)
+            )
@@ -0,0 +1,123 @@
+"""Circuit breakers for the JSON APIs, one per base URL.
+
+After CIRCUIT_BREAKER_THRESHOLD consecutive failures (connection
+errors, timeouts and 5xx responses) the circuit opens and calls fail fast
+without waiting for the API. After CIRCUIT_BREAKER_RESET_TIMEOUT seconds the
+circuit is half-open: a single trial call is made, closing the circuit when
+it succeeds or opening it again when it fails.
+
+Breakers are shared by all threads in a process.
+"""
+
+import logging
+import math
+import threading
+import time
+
+from django.conf import settings
+
+logger = logging.getLogger(__name__)
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half-open"
+
+
+class CircuitBreaker:
+    def __init__(self, name: str, failure_threshold: int, reset_timeout: float):
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.state = CLOSED
+        self.failures = 0
+        self.opened_at = 0.0
+        self._lock = threading.Lock()
+
+    @property
+    def is_open(self) -> bool:
+        """True while calls fail fast, before the cool-down has elapsed."""
+
+        return (
+            self.state == OPEN
+            and time.monotonic() < self.opened_at + self.reset_timeout
+        ) or self.state == HALF_OPEN
+
+    @property
+    def retry_after(self) -> int:
+        """Seconds, at least 1, before the trial call can be made."""
+
+        remaining = self.opened_at + self.reset_timeout - time.monotonic()
+        return max(math.ceil(remaining), 1)
+
+    def allow_request(self) -> bool:
+        """Returns True when a call can be made, the trial call when the
+        cool-down has elapsed."""
+
+        with self._lock:
+            if self.state == CLOSED:
+                return True
+            if (
+                self.state == OPEN
+                and time.monotonic() >= self.opened_at + self.reset_timeout
+            ):
+                # the trial call, other calls fail fast until it completes
+                self.state = HALF_OPEN
+                return True
+            return False
+
+    def record_success(self):
+        with self._lock:
+            if self.state != CLOSED:
+                logger.info(f"Circuit closed for {self.name}")
+            self.state = CLOSED
+            self.failures = 0
+
+    def release(self):
+        """Ends a call that says nothing about the API's health, i.e. timed
+        out at the request deadline. A trial call can be made again."""
+
+        with self._lock:
+            if self.state == HALF_OPEN:
+                self.state = OPEN
+
+    def record_failure(self):
+        with self._lock:
+            self.failures += 1
+            if self.state == HALF_OPEN or (
+                self.state == CLOSED and self.failures >= self.failure_threshold
+            ):
+                logger.warning(
+                    f"Circuit open for {self.name} after {self.failures} failures"
+                )
+                self.state = OPEN
+                self.opened_at = time.monotonic()
+
+
+_lock = threading.Lock()
+_breakers: dict[str, CircuitBreaker] = {}
+
+
+def get_circuit_breaker(api_url: str) -> CircuitBreaker | None:
+    """Returns the breaker for the API base URL, None when disabled."""
+
+    if not settings.ENABLE_CIRCUIT_BREAKER:
+        return None
+    if (breaker := _breakers.get(api_url)) is None:
+        with _lock:
+            breaker = _breakers.setdefault(
+                api_url,
+                CircuitBreaker(
+                    api_url,
+                    failure_threshold=settings.CIRCUIT_BREAKER_THRESHOLD,
+                    reset_timeout=settings.CIRCUIT_BREAKER_RESET_TIMEOUT,
+                ),
+            )
+    return breaker
+
+
+def is_circuit_open(api_url: str) -> bool:
+    """Returns True when calls to the API fail fast, so optional calls can
+    be skipped."""
+
+    breaker = get_circuit_breaker(api_url)
+    return breaker is not None and breaker.is_open
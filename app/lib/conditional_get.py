@@ -0,0 +1,174 @@
+"""Conditional GET support for pages rendered from API data.
+
+Pages get an ETag from the request state they render (path, query, build
+version, notifications, cookies read by the templates) and the version of the
+API data they show, and a Last-Modified of when that ETag was first seen.
+
+With ENABLE_CONDITIONAL_GET_CACHE, the validators are cached by request
+state, so a conditional request for an unchanged page is answered with 304 Not
+Modified before any API call. Otherwise, or when the validators are not
+cached, the API is called but the 304 is returned before the page is built:
+before the view runs for views whose ETag is known from the data fetched first
+(etag_before_render), otherwise before the template renders. Last-Modified is
+only sent with the cache, which records when the ETag was first seen.
+"""
+
+import hashlib
+import json
+import logging
+import time
+from http import HTTPStatus
+
+from django.conf import settings
+from django.core.cache import cache
+from django.http import HttpRequest, HttpResponse
+from django.utils.cache import get_conditional_response
+from django.utils.functional import cached_property
+from django.utils.http import http_date
+
+from app.lib.constants import (
+    CONDITIONAL_GET_CACHE_KEY_PREFIX,
+    CONDITIONAL_GET_CACHE_TIMEOUT,
+)
+from app.main.cache import global_notifications_version
+
+logger = logging.getLogger(__name__)
+
+# cookies changing the rendered page
+RENDER_COOKIES = (
+    "cookie_preferences_set",
+    "dismissed_notifications",
+    "hide_record_detail_descriptions",
+    "theme",
+)
+
+
+def _digest(parts: list) -> str:
+    return hashlib.sha256(
+        json.dumps(parts, sort_keys=True, default=str).encode()
+    ).hexdigest()
+
+
+def is_conditional(request: HttpRequest) -> bool:
+    return "If-None-Match" in request.headers or "If-Modified-Since" in request.headers
+
+
+class ConditionalGetMixin:
+    """A mixin for views to answer conditional GET requests.
+
+    Views override get_etag_parts() to return the versions of the API data
+    rendered, and can add to get_validator_parts() the request state rendered.
+    Views whose get_etag_parts() only needs data fetched before the page is
+    built, e.g. the record, set etag_before_render.
+    """
+
+    etag_before_render = False
+
+    def get_validator_parts(self) -> list:
+        """Returns the request state the page renders from, known before any
+        API call."""
+
+        return [
+            self.request.path,
+            sorted(self.request.GET.lists()),
+            settings.BUILD_VERSION,
+            global_notifications_version(),
+            [self.request.COOKIES.get(name) for name in RENDER_COOKIES],
+        ]
+
+    @cached_property
+    def validator_parts(self) -> list:
+        """The request state, from get_validator_parts() once per request."""
+
+        return self.get_validator_parts()
+
+    def get_etag_parts(self) -> list | None:
+        """Returns the versions of the API data rendered, or None when the
+        response has no validators."""
+
+        return None
+
+    def get_etag(self, etag_parts: list) -> str:
+        return f'"{_digest([self.validator_parts, etag_parts])}"'
+
+    def get_validators_cache_key(self) -> str:
+        return f"{CONDITIONAL_GET_CACHE_KEY_PREFIX}:{_digest(self.validator_parts)}"
+
+    def get_cached_validators(self) -> tuple[str, int] | None:
+        if not settings.ENABLE_CONDITIONAL_GET_CACHE:
+            return None
+        return cache.get(self.get_validators_cache_key())
+
+    def dispatch(self, request, *args, **kwargs) -> HttpResponse:
+        if request.method not in ("GET", "HEAD"):
+            return super().dispatch(request, *args, **kwargs)
+
+        if is_conditional(request) and (response := self.not_modified_response()):
+            return response
+
+        response = super().dispatch(request, *args, **kwargs)
+        return self.add_validators(response)
+
+    def not_modified_response(self) -> HttpResponse | None:
+        """Returns 304 Not Modified when the request's validators match the
+        cached validators or, for etag_before_render views, the ETag, None
+        when the view has to run."""
+
+        if validators := self.get_cached_validators():
+            etag, last_modified = validators
+        elif self.etag_before_render and (etag_parts := self.get_etag_parts()):
+            etag, last_modified = self.get_etag(etag_parts), None
+        else:
+            return None
+
+        response = get_conditional_response(
+            self.request,
+            etag=etag,
+            last_modified=last_modified,
+            response=self.validated_response(HttpResponse(), etag, last_modified),
+        )
+        if response.status_code == HTTPStatus.NOT_MODIFIED:
+            return response
+        return None
+
+    def add_validators(self, response: HttpResponse) -> HttpResponse:
+        """Sets the validators for the page, returns 304 Not Modified instead
+        of rendering when the request's validators match."""
+
+        if response.status_code != HTTPStatus.OK:
+            return response
+        if (etag_parts := self.get_etag_parts()) is None:
+            return response
+
+        etag = self.get_etag(etag_parts)
+        last_modified = None
+        if settings.ENABLE_CONDITIONAL_GET_CACHE:
+            validators = self.get_cached_validators()
+            if validators and validators[0] == etag:
+                last_modified = validators[1]
+            else:
+                last_modified = int(time.time())
+                try:
+                    cache.set(
+                        self.get_validators_cache_key(),
+                        (etag, last_modified),
+                        timeout=CONDITIONAL_GET_CACHE_TIMEOUT,
+                    )
+                except Exception as e:
+                    logger.error(f"Failed to cache response validators: {e}")
+
+        response = self.validated_response(response, etag, last_modified)
+        return get_conditional_response(
+            self.request,
+            etag=etag,
+            last_modified=last_modified,
+            response=response,
+        )
+
+    def validated_response(
+        self, response: HttpResponse, etag: str, last_modified: int | None
+    ) -> HttpResponse:
+        response.headers["ETag"] = etag
+        if last_modified is not None:
+            response.headers["Last-Modified"] = http_date(last_modified)
+        return response
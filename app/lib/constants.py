@@ -6,3 +6,26 @@ DATE_YMD_SEPARATOR = "-"
 # Base URL for Discovery links used across records and delivery options.
 # TODO: will no longer be needed in time when Etna is fully functional
 BASE_TNA_DISCOVERY_URL = "https://discovery.nationalarchives.gov.uk"
+
+# response validators (ETag, Last-Modified) cached for conditional GET requests
+CONDITIONAL_GET_CACHE_TIMEOUT = 60 * 5  # 5 minutes
+CONDITIONAL_GET_CACHE_KEY_PREFIX = "conditional_get"
+
+# missing records and empty searches cached apart from positive results
+NEGATIVE_CACHE_KEY_PREFIX = "negative"
+NEGATIVE_CACHE_STATS_KEY_PREFIX = "negative_stats"
+# hits and stores counted before the cache is updated
+NEGATIVE_CACHE_STATS_FLUSH_EVERY = 50
+
+# hedged Rosetta requests, see app.lib.hedging
+# idempotent reads, safe to repeat
+HEDGED_ROSETTA_URIS = ("get", "search")
+HEDGE_LATENCY_WINDOW = 200  # recent latencies the hedge delay is taken from
+HEDGE_MIN_SAMPLES = 20  # latencies needed before requests are hedged
+HEDGE_MAX_WORKERS = 16
+HEDGE_BUDGET_MAX_TOKENS = 10  # hedges allowed in a burst
+
+# bytes transferred from the APIs, see app.lib.transfer_stats
+TRANSFER_STATS_KEY_PREFIX = "transfer_stats"
+TRANSFER_STATS_FLUSH_EVERY = 50  # responses counted before the cache is updated
+API_RESPONSE_CHUNK_SIZE = 64 * 1024
@@ -0,0 +1,58 @@
+"""Per-request deadline for upstream API calls.
+
+RequestDeadlineMiddleware sets a deadline REQUEST_DEADLINE seconds after the
+request starts. JSONAPIClient caps each call's timeout at the time remaining,
+and fails without calling the API once the deadline has passed, so a slow
+call early in the request leaves less time for later ones rather than the
+request outliving the load balancer's limit.
+
+The deadline is held in a context variable, threads working for the request
+are given its deadline with use_deadline().
+"""
+
+import time
+from contextvars import ContextVar
+
+_deadline: ContextVar[float | None] = ContextVar("request_deadline", default=None)
+
+
+def set_deadline(seconds: float):
+    """Sets the deadline seconds from now, returns a token to reset it."""
+
+    return _deadline.set(time.monotonic() + seconds)
+
+
+def reset_deadline(token):
+    _deadline.reset(token)
+
+
+def get_deadline() -> float | None:
+    return _deadline.get()
+
+
+def use_deadline(deadline: float | None):
+    """Sets a deadline from another thread, i.e. in a thread pool initializer."""
+
+    _deadline.set(deadline)
+
+
+def remaining_time() -> float | None:
+    """Returns the seconds left before the deadline, None without a deadline."""
+
+    if (deadline := _deadline.get()) is None:
+        return None
+    return max(deadline - time.monotonic(), 0.0)
+
+
+def deadline_exceeded() -> bool:
+    return remaining_time() == 0.0
+
+
+def cap_timeout(timeout: float | None) -> float | None:
+    """Returns the timeout, capped at the time remaining before the deadline."""
+
+    if (remaining := remaining_time()) is None:
+        return timeout
+    if timeout is None:
+        return remaining
+    return min(timeout, remaining)
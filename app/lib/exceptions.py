@@ -13,6 +13,10 @@ class APITimeoutError(APIError):
     """Raised when a request to the JSON API times out."""
 
 
+class APIDeadlineExceededError(APITimeoutError):
+    """Raised without calling the JSON API once the request deadline has passed."""
+
+
 class APIRedirectError(APIError):
     """Raised when the JSON API request encounters too many redirects."""
 
@@ -37,6 +41,19 @@ class APIResourceNotFound(APIError):
     """Raised when the JSON API responds with HTTP 404."""
 
 
+class APICircuitOpenError(APIError):
+    """Raised without calling the JSON API while its circuit breaker is open."""
+
+    def __init__(self, message: str, retry_after: int | None = None):
+        super().__init__(message)
+        # seconds before the API is called again
+        self.retry_after = retry_after
+
+
+class APIResponseTooLargeError(APIError):
+    """Raised when a JSON API response is larger than API_MAX_RESPONSE_SIZE."""
+
+
 class CatalogueError(Exception):
     """Base exception for Catalog errors after successful API calls (200)."""
 
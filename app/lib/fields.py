@@ -3,6 +3,7 @@
 import calendar
 from datetime import date
 from enum import StrEnum
+from types import MappingProxyType
 
 from django.http import QueryDict
 from django.utils.functional import cached_property
@@ -14,6 +15,36 @@ class ValidationError(Exception):
     pass
 
 
+class ChoiceIndex:
+    """Immutable index of configured choices, shareable between field instances
+    and requests.
+
+    choices: format [(field value, display value),]
+    Provides O(1) value membership and value to display label lookups.
+    """
+
+    __slots__ = ("choices", "values", "labels", "_value_set")
+
+    def __init__(self, choices):
+        self.choices = tuple(choices)
+        self.values = tuple(value for value, _ in self.choices)
+        self.labels = MappingProxyType(dict(self.choices))
+        self._value_set = frozenset(self.values)
+
+    def __len__(self):
+        return len(self.choices)
+
+    def __iter__(self):
+        return iter(self.choices)
+
+    def __contains__(self, value):
+        return value in self._value_set
+
+    def has_all(self, values) -> bool:
+        """Returns True if all values are configured choice values."""
+        return self._value_set.issuperset(values)
+
+
 class DateKeys(StrEnum):
     """Date keys for multi part date fields used both BE and FE.
     They appear in the input name as suffixes in the FE component.
@@ -178,13 +209,14 @@ class ChoiceField(BaseField):
 
 
 class DynamicMultipleChoiceField(BaseField):
-    def __init__(self, choices: list[tuple[str, str]], **kwargs):
+    def __init__(self, choices: list[tuple[str, str]] | ChoiceIndex, **kwargs):
         """
         choices: data format - [(field value, display value),]
         defined choices act to validate input against and lookup
         display labels for dynamic values, otherwise an empty list when
         there are no fixed choices to validate against or need to
-        lookup labels.
+        lookup labels. For large or fixed choices, pass a ChoiceIndex
+        shared between forms so that it is only built once.
 
         keyword args - validate_input: bool,
                        more_filter_choices_text: str
@@ -227,27 +259,32 @@ class DynamicMultipleChoiceField(BaseField):
         # Also, this keeps the URL length manageable.
         # self.FILTER_CHOICES_LIMIT = 5
 
+        if isinstance(choices, ChoiceIndex):
+            self.choice_index = choices
+            choices = choices.choices
+        else:
+            self.choice_index = ChoiceIndex(choices)
+
         self.choices = choices
         self.configured_choices = self.choices
-        # cache valid choices
-        if self.validate_input:
-            self.valid_choices = [value for value, _ in self.choices]
-        else:
-            self.valid_choices = []
 
         # The self.choices_updated is used to at the time of render
         # to coerce 0 counts on error or when choices
         # have been updated to reflect options from the API.
         self.choices_updated = False
 
-    def _has_match_all(self, value, search_in):
-        return all(item in search_in for item in value)
+    @property
+    def valid_choices(self) -> tuple[str, ...]:
+        """Returns configured choice values input is validated against."""
+        if self.validate_input:
+            return self.choice_index.values
+        return ()
 
     def validate(self, value):
         if self.required or self.validate_input:
             super().validate(value)
             if self.validate_input:
-                if not self._has_match_all(value, self.valid_choices):
+                if not self.choice_index.has_all(value):
                     raise ValidationError(
                         (
                             f"Enter a valid choice. Value(s) [{', '.join(value)}] do not belong "
@@ -278,27 +315,19 @@ class DynamicMultipleChoiceField(BaseField):
                 # with configured choices by coercing with empty data
                 # and coerce 0 counts for input not in api data
                 self.update_choices([], self.value)
+        selected_values = set(self.value or ())
         return [
             (
                 {"text": display_value, "value": value, "checked": True}
-                if (value in self.value)
+                if (value in selected_values)
                 else {"text": display_value, "value": value}
             )
             for value, display_value in self.choices
         ]
 
-    @cached_property
+    @property
     def configured_choice_labels(self):
-        return {value: label for value, label in self.configured_choices}
-
-    def choice_label_from_api_data(self, data: dict[str, str | int]) -> str:
-        count = f"{data['doc_count']:,}"
-        try:
-            # Use a label from the configured choice values, if available
-            return f"{self.configured_choice_labels[data['value']]} ({count})"
-        except KeyError:
-            # Fall back to using the key value (which is the same in most cases)
-            return f"{data['value']} ({count})"
+        return self.choice_index.labels
 
     def update_choices(
         self,
@@ -321,21 +350,27 @@ class DynamicMultipleChoiceField(BaseField):
         ]
         """
 
-        # Generate a new list of choices
+        # Generate a new list of choices in a single pass, long filters can
+        # have thousands of entries. Labels are taken from the configured
+        # choice values if available, falling back to the value (which is the
+        # same in most cases)
+        labels = self.configured_choice_labels
         choices = []
-        choice_vals_with_hits = set()
+        append = choices.append
         for item in choice_api_data:
-            choices.append((item["value"], self.choice_label_from_api_data(item)))
-            choice_vals_with_hits.add(item["value"])
-
-        for missing_value in [
-            v for v in selected_values if v not in choice_vals_with_hits
-        ]:
-            try:
-                label_base = self.configured_choice_labels[missing_value]
-            except KeyError:
-                label_base = missing_value
-            choices.append((missing_value, f"{label_base} (0)"))
+            value = item["value"]
+            append((value, f"{labels.get(value, value)} ({item['doc_count']:,})"))
+
+        # keep selected values not in the api data, with 0 counts
+        if selected_values:
+            missing_values = set(selected_values).difference(
+                value for value, _ in choices
+            )
+            choices.extend(
+                (value, f"{labels.get(value, value)} (0)")
+                for value in selected_values
+                if value in missing_values
+            )
 
         # Replace the field's attribute value
         self.choices = choices
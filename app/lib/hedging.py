@@ -0,0 +1,173 @@
+"""Hedged requests for idempotent API reads with a long latency tail.
+
+When a call has not answered after a delay, the recent latency percentile
+(ROSETTA_HEDGE_PERCENTILE) for its endpoint, a second identical call is
+started and whichever answers first wins. The calls race on a thread pool;
+while there are too few latencies to know the delay, or too few free threads
+for both calls, a call runs in the caller's thread and is not hedged, so
+calls never queue behind each other.
+
+Hedges are limited by a budget shared by the process: each call earns a
+fraction of a hedge (ROSETTA_HEDGE_MAX_PERCENT), each hedge spends a whole
+one, so at most that percentage of calls are hedged and hedging cannot
+amplify load on a struggling API.
+"""
+
+import contextvars
+import logging
+import math
+import threading
+import time
+from collections import deque
+from collections.abc import Callable
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Any
+
+from django.conf import settings
+
+from .constants import (
+    HEDGE_BUDGET_MAX_TOKENS,
+    HEDGE_LATENCY_WINDOW,
+    HEDGE_MAX_WORKERS,
+    HEDGE_MIN_SAMPLES,
+)
+
+logger = logging.getLogger(__name__)
+
+
+class LatencyTracker:
+    """Recent latencies of an endpoint, for the hedge delay."""
+
+    def __init__(self, window: int = HEDGE_LATENCY_WINDOW):
+        self.latencies: deque[float] = deque(maxlen=window)
+        self._lock = threading.Lock()
+
+    def record(self, latency: float):
+        with self._lock:
+            self.latencies.append(latency)
+
+    def percentile(self, percentile: float) -> float | None:
+        """Returns the latency at the percentile, None until there are
+        enough latencies."""
+
+        with self._lock:
+            if len(self.latencies) < HEDGE_MIN_SAMPLES:
+                return None
+            latencies = sorted(self.latencies)
+        index = math.ceil(percentile / 100 * len(latencies)) - 1
+        return latencies[min(max(index, 0), len(latencies) - 1)]
+
+
+class HedgeBudget:
+    """Hedges allowed as a percentage of calls."""
+
+    def __init__(self, max_tokens: float = HEDGE_BUDGET_MAX_TOKENS):
+        self.max_tokens = max_tokens
+        self.tokens = 0.0
+        self._lock = threading.Lock()
+
+    def earn(self, percent: float):
+        with self._lock:
+            self.tokens = min(self.tokens + percent / 100, self.max_tokens)
+
+    def spend(self) -> bool:
+        with self._lock:
+            if self.tokens < 1:
+                return False
+            self.tokens -= 1
+            return True
+
+
+_lock = threading.Lock()
+_executor: ThreadPoolExecutor | None = None
+_trackers: dict[str, LatencyTracker] = {}
+_in_flight = 0
+budget = HedgeBudget()
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    global _executor
+    if _executor is None:
+        with _lock:
+            if _executor is None:
+                _executor = ThreadPoolExecutor(
+                    max_workers=HEDGE_MAX_WORKERS, thread_name_prefix="hedge"
+                )
+    return _executor
+
+
+def get_latency_tracker(name: str) -> LatencyTracker:
+    if (tracker := _trackers.get(name)) is None:
+        with _lock:
+            tracker = _trackers.setdefault(name, LatencyTracker())
+    return tracker
+
+
+def _timed_call(call: Callable[[], Any], tracker: LatencyTracker) -> Any:
+    start = time.monotonic()
+    result = call()
+    tracker.record(time.monotonic() - start)
+    return result
+
+
+def _call_finished(future: Future):
+    global _in_flight
+    with _lock:
+        _in_flight -= 1
+
+
+def _submit(call: Callable[[], Any], tracker: LatencyTracker) -> Future:
+    global _in_flight
+    executor = _get_executor()
+    with _lock:
+        _in_flight += 1
+    try:
+        # in a copy of the caller's context, for the request deadline
+        future = executor.submit(
+            contextvars.copy_context().run, _timed_call, call, tracker
+        )
+    except RuntimeError:
+        with _lock:
+            _in_flight -= 1
+        raise
+    future.add_done_callback(_call_finished)
+    return future
+
+
+def hedging_saturated() -> bool:
+    """Returns True when there are not enough free threads for a call and
+    its hedge, so they would queue behind other calls."""
+
+    return _in_flight + 2 > HEDGE_MAX_WORKERS
+
+
+def hedged_call(name: str, call: Callable[[], Any]) -> Any:
+    """Returns the result of call, hedged when it is slower than the recent
+    latency percentile for name, i.e. an API endpoint. The first call or
+    hedge to succeed answers."""
+
+    tracker = get_latency_tracker(name)
+    budget.earn(settings.ROSETTA_HEDGE_MAX_PERCENT)
+    delay = tracker.percentile(settings.ROSETTA_HEDGE_PERCENTILE)
+    if delay is None or hedging_saturated():
+        # learning the latencies, or no threads to race on
+        return _timed_call(call, tracker)
+
+    primary = _submit(call, tracker)
+    done, _ = wait([primary], timeout=delay)
+    if done or not budget.spend():
+        return primary.result()
+
+    logger.info(f"Hedging {name} after {delay:.3f}s")
+    hedge = _submit(call, tracker)
+    pending = {primary, hedge}
+    while pending:
+        done, pending = wait(pending, return_when=FIRST_COMPLETED)
+        for future in done:
+            if future.exception() is None:
+                # the other call is left to finish, its result ignored
+                for other in pending:
+                    other.cancel()
+                return future.result()
+    # both failed
+    return primary.result()
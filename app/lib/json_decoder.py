@@ -0,0 +1,66 @@
+"""Pluggable JSON decoding for API responses.
+
+The JSON_DECODER setting picks the decoder: "orjson", "stdlib", or "auto" to
+use orjson when it is installed and the stdlib json module otherwise.
+
+Responses are decoded from their raw bytes without building the text first,
+unless their Content-Type declares a charset other than UTF-8.
+"""
+
+import json
+from collections.abc import Callable
+from typing import Any
+
+from django.conf import settings
+from django.core.exceptions import ImproperlyConfigured
+from django.utils.http import parse_header_parameters
+
+try:
+    import orjson
+except ImportError:
+    # The stdlib json module is used
+    orjson = None
+
+AUTO = "auto"
+ORJSON = "orjson"
+STDLIB = "stdlib"
+
+DECODERS: dict[str, Callable[[bytes | str], Any]] = {STDLIB: json.loads}
+if orjson is not None:
+    DECODERS[ORJSON] = orjson.loads
+
+UTF8_CHARSETS = ("utf-8", "utf8")
+
+
+def get_decoder(name: str | None = None) -> Callable[[bytes | str], Any]:
+    """Returns the loads function for the named decoder, by default the
+    JSON_DECODER setting."""
+
+    name = name or settings.JSON_DECODER
+    if name == AUTO:
+        name = ORJSON if ORJSON in DECODERS else STDLIB
+    try:
+        return DECODERS[name]
+    except KeyError:
+        raise ImproperlyConfigured(f"JSON decoder {name} is not available")
+
+
+def content_charset(content_type: str | None) -> str | None:
+    """Returns the charset declared by a Content-Type header, if any."""
+
+    if not content_type:
+        return None
+    _, params = parse_header_parameters(content_type)
+    return params.get("charset")
+
+
+def decode_json(
+    content: bytes, charset: str | None = None, decoder: str | None = None
+) -> Any:
+    """Returns the decoded JSON content. Raises ValueError, or a subclass of
+    it, when the content is not valid JSON."""
+
+    loads = get_decoder(decoder)
+    if charset and charset.lower() not in UTF8_CHARSETS:
+        return loads(content.decode(charset))
+    return loads(content)
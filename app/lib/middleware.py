@@ -0,0 +1,21 @@
+from django.conf import settings
+
+from .deadline import reset_deadline, set_deadline
+
+
+class RequestDeadlineMiddleware:
+    """Sets a deadline for the upstream API calls made for a request, when
+    REQUEST_DEADLINE is set."""
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        if not settings.REQUEST_DEADLINE:
+            return self.get_response(request)
+
+        token = set_deadline(settings.REQUEST_DEADLINE)
+        try:
+            return self.get_response(request)
+        finally:
+            reset_deadline(token)
@@ -0,0 +1,133 @@
+"""Negative cache for API lookups that found nothing.
+
+Missing records and searches without results are cached for a short time
+(NEGATIVE_CACHE_TIMEOUT), apart from positive results, so repeated requests
+for them, i.e. bots probing old Discovery ids, are answered without calling
+the API. The not found error is raised again from the cache.
+
+Hits and stores are counted per kind of lookup, to show how much traffic the
+negative cache absorbs. Counts are kept in the process and added to counts in
+the cache, shared across processes, every NEGATIVE_CACHE_STATS_FLUSH_EVERY
+hits and stores rather than on every lookup.
+"""
+
+import hashlib
+import json
+import logging
+import threading
+
+from django.conf import settings
+from django.core.cache import cache
+
+from .constants import (
+    NEGATIVE_CACHE_KEY_PREFIX,
+    NEGATIVE_CACHE_STATS_FLUSH_EVERY,
+    NEGATIVE_CACHE_STATS_KEY_PREFIX,
+)
+from .exceptions import APIResourceNotFound, NoResultsFound, RecordNotFound
+
+logger = logging.getLogger(__name__)
+
+# not found errors that can be cached, by name
+NEGATIVE_ERRORS = {
+    error.__name__: error
+    for error in (APIResourceNotFound, NoResultsFound, RecordNotFound)
+}
+
+# kinds of lookup
+RECORD_LOOKUP = "record"
+SEARCH_LOOKUP = "search"
+LOOKUPS = (RECORD_LOOKUP, SEARCH_LOOKUP)
+
+HIT = "hit"
+STORE = "store"
+
+_lock = threading.Lock()
+_pending: dict[tuple[str, str], int] = {}
+_pending_events = 0
+
+
+def negative_cache_key(kind: str, lookup) -> str:
+    """Returns a cache key for a lookup, i.e. a record id or search params."""
+
+    digest = hashlib.sha256(
+        json.dumps(lookup, sort_keys=True, default=str).encode()
+    ).hexdigest()
+    return f"{NEGATIVE_CACHE_KEY_PREFIX}:{kind}:{digest}"
+
+
+def _key(kind: str, event: str) -> str:
+    return f"{NEGATIVE_CACHE_STATS_KEY_PREFIX}:{kind}:{event}"
+
+
+def _count(kind: str, event: str):
+    global _pending_events
+    with _lock:
+        _pending[(kind, event)] = _pending.get((kind, event), 0) + 1
+        _pending_events += 1
+        if _pending_events < NEGATIVE_CACHE_STATS_FLUSH_EVERY:
+            return
+    flush_negative_cache_stats()
+
+
+def flush_negative_cache_stats():
+    """Adds the counts kept in the process to the counts in the cache."""
+
+    global _pending_events
+    with _lock:
+        pending = dict(_pending)
+        _pending.clear()
+        _pending_events = 0
+    try:
+        for (kind, event), value in pending.items():
+            key = _key(kind, event)
+            cache.add(key, 0, timeout=None)
+            cache.incr(key, value)
+    except Exception as e:
+        logger.warning(f"Failed to count negative cache hits and stores: {e}")
+
+
+def raise_if_negative_cached(kind: str, lookup):
+    """Raises the cached not found error for the lookup, if cached."""
+
+    if not settings.NEGATIVE_CACHE_TIMEOUT:
+        return
+    cached = cache.get(negative_cache_key(kind, lookup))
+    if cached is None:
+        return
+    error_name, message = cached
+    _count(kind, HIT)
+    raise NEGATIVE_ERRORS[error_name](message)
+
+
+def cache_negative(kind: str, lookup, error: Exception):
+    """Caches the not found error for the lookup."""
+
+    if not settings.NEGATIVE_CACHE_TIMEOUT:
+        return
+    try:
+        cache.set(
+            negative_cache_key(kind, lookup),
+            (type(error).__name__, str(error)),
+            timeout=settings.NEGATIVE_CACHE_TIMEOUT,
+        )
+    except Exception as e:
+        logger.error(f"Failed to cache not found {kind}: {e}")
+        return
+    _count(kind, STORE)
+
+
+def negative_cache_stats(kinds=LOOKUPS) -> dict[str, dict[str, int]]:
+    """Returns the hit and store counts for each kind of lookup."""
+
+    counts = cache.get_many(
+        [_key(kind, event) for kind in kinds for event in (HIT, STORE)]
+    )
+    return {
+        kind: {event: counts.get(_key(kind, event), 0) for event in (HIT, STORE)}
+        for kind in kinds
+    }
+
+
+def reset_negative_cache_stats(kinds=LOOKUPS):
+    cache.delete_many([_key(kind, event) for kind in kinds for event in (HIT, STORE)])
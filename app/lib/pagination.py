@@ -56,7 +56,9 @@ def pagination_list(current_page, total_pages, boundaries=1, around=1):
     return [item for item in pagination_items if item]
 
 
-def pagination_object(current_page, total_pages, current_args, boundaries=1, around=1):
+def pagination_object(
+    current_page, total_pages, current_args, boundaries=1, around=1, page_param="page"
+):
     if total_pages == 0:
         return {}
     current_page_int = int(current_page)
@@ -67,7 +69,7 @@ def pagination_object(current_page, total_pages, current_args, boundaries=1, aro
             if item == "..."
             else {
                 "number": format_number(item),
-                "href": f"?{qs_replace_value(current_args, 'page', item)}",
+                "href": f"?{qs_replace_value(current_args, page_param, item)}",
                 "current": item == current_page_int,
             }
         )
@@ -78,7 +80,7 @@ def pagination_object(current_page, total_pages, current_args, boundaries=1, aro
             "href": f"?{
                 qs_replace_value(
                     current_args,
-                    'page',
+                    page_param,
                     current_page_int - 1,
                 )
             }",
@@ -89,7 +91,7 @@ def pagination_object(current_page, total_pages, current_args, boundaries=1, aro
             "href": f"?{
                 qs_replace_value(
                     current_args,
-                    'page',
+                    page_param,
                     current_page_int + 1,
                 )
             }",
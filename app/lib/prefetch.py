@@ -0,0 +1,78 @@
+"""Speculative prefetch in background threads, to warm caches with what a
+user is likely to request next, i.e. the next page of search results or the
+next record in a series.
+
+Prefetching is bounded by a budget of prefetches in flight for the process
+(SEARCH_PREFETCH_MAX_IN_FLIGHT) shared by all kinds of prefetch. When the
+budget is spent the prefetch is skipped rather than queued.
+"""
+
+import logging
+import re
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+
+from django.conf import settings
+
+logger = logging.getLogger(__name__)
+
+BOT_USER_AGENT = re.compile(
+    r"bot|crawl|spider|slurp|archiver|facebookexternalhit|bingpreview|headless",
+    re.IGNORECASE,
+)
+
+_lock = threading.Lock()
+_executor: ThreadPoolExecutor | None = None
+_in_flight: set[str] = set()
+
+
+def is_bot(user_agent: str) -> bool:
+    return not user_agent or bool(BOT_USER_AGENT.search(user_agent))
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    global _executor
+    if _executor is None:
+        with _lock:
+            if _executor is None:
+                _executor = ThreadPoolExecutor(
+                    max_workers=settings.SEARCH_PREFETCH_MAX_IN_FLIGHT,
+                    thread_name_prefix="prefetch",
+                )
+    return _executor
+
+
+def _prefetch(key: str, fn, *args, **kwargs):
+    try:
+        fn(*args, **kwargs)
+    except Exception as e:
+        # fetched again when requested
+        logger.info(f"Failed to prefetch {key}: {e}")
+    finally:
+        with _lock:
+            _in_flight.discard(key)
+
+
+def submit_prefetch(key: str, fn, *args, **kwargs) -> Future | None:
+    """Calls fn in the background to warm the cache for key, i.e. its cache
+    key.
+
+    Returns None when skipped: already in flight, or the prefetch budget is
+    spent.
+    """
+
+    with _lock:
+        if (
+            key in _in_flight
+            or len(_in_flight) >= settings.SEARCH_PREFETCH_MAX_IN_FLIGHT
+        ):
+            return None
+        _in_flight.add(key)
+
+    try:
+        return _get_executor().submit(_prefetch, key, fn, *args, **kwargs)
+    except RuntimeError:
+        # executor shut down
+        with _lock:
+            _in_flight.discard(key)
+        return None
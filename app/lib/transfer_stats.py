@@ -0,0 +1,100 @@
+"""Bytes transferred from the APIs, per upstream.
+
+For each upstream, i.e. the host of an API, the responses read and their
+bytes on the wire (compressed) and decoded (uncompressed) are counted, to
+show the bandwidth saved by compression and the payloads decoded.
+
+Counts are kept in the process and added to counts in the cache, shared
+across processes, every TRANSFER_STATS_FLUSH_EVERY responses rather than on
+every response.
+"""
+
+import logging
+import threading
+from urllib.parse import urlparse
+
+from django.core.cache import cache
+
+from .constants import TRANSFER_STATS_FLUSH_EVERY, TRANSFER_STATS_KEY_PREFIX
+
+logger = logging.getLogger(__name__)
+
+RESPONSES = "responses"
+COMPRESSED_BYTES = "compressed_bytes"
+BYTES = "bytes"
+COUNTS = (RESPONSES, COMPRESSED_BYTES, BYTES)
+
+UPSTREAMS_KEY = f"{TRANSFER_STATS_KEY_PREFIX}:upstreams"
+
+_lock = threading.Lock()
+_pending: dict[str, dict[str, int]] = {}
+_pending_responses = 0
+
+
+def upstream_name(api_url: str) -> str:
+    return urlparse(api_url).netloc or api_url
+
+
+def _key(upstream: str, count: str) -> str:
+    return f"{TRANSFER_STATS_KEY_PREFIX}:{upstream}:{count}"
+
+
+def record_transfer(api_url: str, compressed_bytes: int, bytes: int):
+    """Counts a response read from the API."""
+
+    global _pending_responses
+    upstream = upstream_name(api_url)
+    logger.debug(f"Read {compressed_bytes} bytes ({bytes} decoded) from {upstream}")
+    with _lock:
+        counts = _pending.setdefault(upstream, dict.fromkeys(COUNTS, 0))
+        counts[RESPONSES] += 1
+        counts[COMPRESSED_BYTES] += compressed_bytes
+        counts[BYTES] += bytes
+        _pending_responses += 1
+        if _pending_responses < TRANSFER_STATS_FLUSH_EVERY:
+            return
+    flush_transfer_stats()
+
+
+def flush_transfer_stats():
+    """Adds the counts kept in the process to the counts in the cache."""
+
+    global _pending_responses
+    with _lock:
+        pending = dict(_pending)
+        _pending.clear()
+        _pending_responses = 0
+    if not pending:
+        return
+    try:
+        upstreams = cache.get(UPSTREAMS_KEY, set())
+        if not upstreams.issuperset(pending):
+            cache.set(UPSTREAMS_KEY, upstreams | set(pending), timeout=None)
+        for upstream, counts in pending.items():
+            for count, value in counts.items():
+                key = _key(upstream, count)
+                cache.add(key, 0, timeout=None)
+                cache.incr(key, value)
+    except Exception as e:
+        logger.warning(f"Failed to count API transfers: {e}")
+
+
+def transfer_stats() -> dict[str, dict[str, int]]:
+    """Returns the counts for each upstream."""
+
+    upstreams = sorted(cache.get(UPSTREAMS_KEY, set()))
+    counts = cache.get_many(
+        [_key(upstream, count) for upstream in upstreams for count in COUNTS]
+    )
+    return {
+        upstream: {count: counts.get(_key(upstream, count), 0) for count in COUNTS}
+        for upstream in upstreams
+    }
+
+
+def reset_transfer_stats():
+    upstreams = cache.get(UPSTREAMS_KEY, set())
+    cache.delete_many(
+        [UPSTREAMS_KEY]
+        + [_key(upstream, count) for upstream in upstreams for count in COUNTS]
+    )
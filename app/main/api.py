@@ -9,13 +9,14 @@ from app.search.constants import (
 logger = logging.getLogger(__name__)
 
 
-def fetch_all_subjects() -> list[dict[str, str]]:
+def fetch_all_subjects(timeout=None) -> list[dict[str, str]]:
     """Fetch all subjects from the search API using longSubject aggregation."""
 
     api_result = search_records(
         query="",
         results_per_page=LONG_FILTER_RESULTS_PER_PAGE,
         params=LONG_FILTER_SUBJECT_PARAMS,
+        timeout=timeout,
     )
     # Note:
     # It is expected that the search API will always return the longSubject aggregation
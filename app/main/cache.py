@@ -1,9 +1,15 @@
 """Module for cache management in the main app."""
 
+import hashlib
+import json
 import logging
 import string
+from urllib.parse import urlencode
 
+from django.conf import settings
 from django.core.cache import cache
+from django.template.loader import render_to_string
+from django.urls import reverse
 
 from app.records.api import wagtail_request_handler
 from app.search.api import search_records
@@ -15,10 +21,15 @@ from app.search.constants import (
 from .api import fetch_all_subjects
 from .constants import (
     GLOBAL_NOTIFICATIONS_CACHE_KEY,
+    GLOBAL_NOTIFICATIONS_SURROGATE_KEY,
     LANDING_PAGE_CACHE_KEY,
+    LANDING_PAGE_SURROGATE_KEY,
+    SUBJECT_PICKER_CACHE_KEY_PREFIX,
     SUBJECTS_CACHE_KEY,
     SUBJECTS_CACHE_TIMEOUT,
     WAGTAIL_API_CACHE_TIMEOUT,
+    WAGTAIL_CONTENT_VERSION_CACHE_KEY,
+    WagtailContent,
 )
 
 logger = logging.getLogger(__name__)
@@ -29,6 +40,92 @@ def empty_subjects_grouped_by_letter() -> dict:
     return {letter: [] for letter in string.ascii_uppercase}
 
 
+def subject_picker_cache_key() -> str:
+    """Return the cache key of the subject picker, by build so the HTML is
+    rendered again with the templates of a new release."""
+    return f"{SUBJECT_PICKER_CACHE_KEY_PREFIX}:{settings.BUILD_VERSION}"
+
+
+def build_subject_picker(subjects: list[dict]) -> dict:
+    """Build the render-ready subject picker from the longSubject aggregation
+    entries, and render its HTML.
+
+    Returns a dictionary including:
+    - letters: for each letter A-Z, its id, subjects (name, href, count),
+      subject count and whether it is disabled
+    - disabled_letters: the letters without subjects
+    - subjects_grouped_by_letter: the sorted subject names of each letter
+    - count: the number of subjects
+    - html: the rendered subject picker
+    """
+    counts = {}
+    for item in subjects:
+        counts[item["value"]] = item.get("doc_count", 0)
+
+    subjects_grouped_by_letter = empty_subjects_grouped_by_letter()
+    for name in counts:
+        subjects_grouped_by_letter[name[0].upper()].append(name)
+
+    search_url = reverse("search:catalogue")
+    letters = []
+    for letter, names in subjects_grouped_by_letter.items():
+        names.sort()
+        letters.append(
+            {
+                "letter": letter,
+                "id": letter.lower(),
+                "subjects": [
+                    {
+                        "name": name,
+                        "href": f"{search_url}?{urlencode({'subject': name})}",
+                        "count": counts[name],
+                    }
+                    for name in names
+                ],
+                "count": len(names),
+                "disabled": not names,
+            }
+        )
+
+    picker = {
+        "letters": letters,
+        "disabled_letters": [
+            letter["letter"] for letter in letters if letter["disabled"]
+        ],
+        "subjects_grouped_by_letter": subjects_grouped_by_letter,
+        "count": len(counts),
+    }
+    picker["html"] = render_to_string(
+        "main/subject-picker.html", {"subject_picker": picker}
+    )
+    return picker
+
+
+def refresh_subjects(timeout=None) -> dict:
+    """Fetch all subjects, and cache them grouped by their starting letter
+    together with the subject picker built from them.
+
+    Returns the subject picker, built empty and not cached when the API
+    request fails.
+    """
+    try:
+        picker = build_subject_picker(fetch_all_subjects(timeout=timeout))
+    except Exception as e:
+        # Fall back to an empty result if the API request fails,
+        # incorrectly formatted data is returned
+        logger.error(f"Failed to fetch all Subjects: {e}")
+        return build_subject_picker([])
+
+    cache.set_many(
+        {
+            SUBJECTS_CACHE_KEY: picker["subjects_grouped_by_letter"],
+            subject_picker_cache_key(): picker,
+        },
+        timeout=SUBJECTS_CACHE_TIMEOUT,
+    )
+    return picker
+
+
 def get_subjects_grouped_by_letter() -> dict:
     """Fetch and cache all subjects grouped by their starting letter.
 
@@ -38,31 +135,24 @@ def get_subjects_grouped_by_letter() -> dict:
     data = cache.get(SUBJECTS_CACHE_KEY)
 
     if data is None:
-        # initialize the data structure with empty lists for each letter
-        data = empty_subjects_grouped_by_letter()
-        try:
-            api_result = fetch_all_subjects()
+        data = refresh_subjects()["subjects_grouped_by_letter"]
 
-            # group subjects by their starting letter
-            for item in api_result:
-                data[item["value"][0].upper()].append(item["value"])
+    return data
 
-            # sort the subjects for each letter
-            for letter in data:
-                data[letter].sort()
 
-            cache.set(
-                SUBJECTS_CACHE_KEY,
-                data,
-                timeout=SUBJECTS_CACHE_TIMEOUT,
-            )
-        except Exception as e:
-            # Fall back to an empty result if the API request fails,
-            # incorrectly formatted data is returned
-            data = empty_subjects_grouped_by_letter()
-            logger.error(f"Failed to fetch all Subjects: {e}")
+def get_subject_picker(timeout=None) -> dict:
+    """Return the cached subject picker, see build_subject_picker(), fetching
+    the subjects when it is not cached.
 
-    return data
+    The picker is built once when the subjects are refreshed, so pages show
+    it without any per subject work.
+    """
+    picker = cache.get(subject_picker_cache_key())
+
+    if picker is None:
+        picker = refresh_subjects(timeout=timeout)
+
+    return picker
 
 
 def fetch_global_notifications() -> dict | None:
@@ -147,6 +237,70 @@ def fetch_landing_page_data() -> dict | None:
     return data
 
 
+def get_wagtail_content_version() -> int:
+    """Return the version of the Wagtail content, bumped on invalidation."""
+    return cache.get(WAGTAIL_CONTENT_VERSION_CACHE_KEY, 0)
+
+
+def global_notifications_version() -> str:
+    """Return a version of the cached global notifications, without fetching
+    them, so responses showing the notifications can be validated.
+
+    Empty when the notifications are not cached.
+    """
+    data = cache.get(GLOBAL_NOTIFICATIONS_CACHE_KEY)
+    if data is None:
+        return ""
+    digest = hashlib.sha256(
+        json.dumps(data, sort_keys=True, default=str).encode()
+    ).hexdigest()
+    return f"{get_wagtail_content_version()}:{digest}"
+
+
+# cache key, refresh function and surrogate key of each Wagtail content
+WAGTAIL_CONTENT = {
+    WagtailContent.NOTIFICATIONS: (
+        GLOBAL_NOTIFICATIONS_CACHE_KEY,
+        fetch_global_notifications,
+        GLOBAL_NOTIFICATIONS_SURROGATE_KEY,
+    ),
+    WagtailContent.LANDING_PAGE: (
+        LANDING_PAGE_CACHE_KEY,
+        fetch_landing_page_data,
+        LANDING_PAGE_SURROGATE_KEY,
+    ),
+}
+
+
+def bump_wagtail_content_version() -> int:
+    """Increment the Wagtail content version, returns the new version."""
+    try:
+        return cache.incr(WAGTAIL_CONTENT_VERSION_CACHE_KEY)
+    except ValueError:
+        # not set or evicted, any new value differs from versions in use
+        version = get_wagtail_content_version() + 1
+        cache.set(WAGTAIL_CONTENT_VERSION_CACHE_KEY, version, timeout=None)
+        return version
+
+
+def invalidate_wagtail_content(contents: list[str], refresh: bool = False) -> dict:
+    """Evict the cached Wagtail content, and fetch it again when refresh is
+    set, then bump the content version so response validators change.
+
+    Returns the new version and the surrogate keys of pages to purge from
+    shared caches.
+    """
+    cache.delete_many([WAGTAIL_CONTENT[content][0] for content in contents])
+    if refresh:
+        for content in contents:
+            WAGTAIL_CONTENT[content][1]()
+
+    return {
+        "version": bump_wagtail_content_version(),
+        "surrogate_keys": [WAGTAIL_CONTENT[content][2] for content in contents],
+    }
+
+
 # Landing page getters (for catalogue landing page only)
 
 
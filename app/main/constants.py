@@ -1,7 +1,25 @@
-WAGTAIL_API_CACHE_TIMEOUT = 60 * 15  # 15 minutes
+from django.conf import settings
+
+WAGTAIL_API_CACHE_TIMEOUT = settings.WAGTAIL_API_CACHE_TIMEOUT
 
 GLOBAL_NOTIFICATIONS_CACHE_KEY = "wagtail_global_notifications"
 LANDING_PAGE_CACHE_KEY = "wagtail_landing_page"
+# bumped when Wagtail content is invalidated, part of response validators
+WAGTAIL_CONTENT_VERSION_CACHE_KEY = "wagtail_content_version"
 
 SUBJECTS_CACHE_TIMEOUT = 60 * 60 * 24 * 7  # 1 week
 SUBJECTS_CACHE_KEY = "SUBJECTS_GROUPED_BY_LETTER"
+# the subject picker, with its HTML rendered, rebuilt with the subjects
+SUBJECT_PICKER_CACHE_KEY_PREFIX = "subject_picker"
+
+# surrogate keys for purging shared caches (CDN) of pages showing the content
+GLOBAL_NOTIFICATIONS_SURROGATE_KEY = "global-notifications"
+LANDING_PAGE_SURROGATE_KEY = "catalogue-landing"
+SUBJECTS_SURROGATE_KEY = "subjects"
+
+
+class WagtailContent:
+    """Wagtail content cached by the app, invalidated by the webhook."""
+
+    NOTIFICATIONS = "notifications"
+    LANDING_PAGE = "landing_page"
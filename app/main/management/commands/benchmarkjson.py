@@ -0,0 +1,66 @@
+import json
+
+from django.core.management.base import BaseCommand
+
+from app.benchmarks.json_decoding import benchmark_json_decoding, default_payloads
+from app.benchmarks.payloads import LONG_FILTER_ENTRIES, SEARCH_RESULTS
+from app.benchmarks.profiler import format_report
+
+REPORT_COLUMNS = [
+    "stage",
+    "calls",
+    "mean_ms",
+    "median_ms",
+    "p95_ms",
+    "mean_allocated_kib",
+    "max_peak_kib",
+]
+
+
+class Command(BaseCommand):
+    help = (
+        "Benchmarks decoding canned API responses with each available JSON "
+        "decoder, reporting timings and allocations per decoder."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--iterations", type=int, default=50)
+        parser.add_argument("--warmup", type=int, default=5)
+        parser.add_argument(
+            "--results",
+            type=int,
+            default=SEARCH_RESULTS,
+            help="Number of results in the canned search response",
+        )
+        parser.add_argument(
+            "--entries",
+            type=int,
+            default=LONG_FILTER_ENTRIES,
+            help="Number of entries in the canned long filter aggregations",
+        )
+        parser.add_argument(
+            "--no-memory",
+            action="store_true",
+            help="Skip the tracemalloc allocation pass",
+        )
+        parser.add_argument("--json", action="store_true", help="Output as JSON")
+
+    def handle(self, *args, **options):
+        results = benchmark_json_decoding(
+            payloads=default_payloads(
+                results=options["results"], entries=options["entries"]
+            ),
+            iterations=options["iterations"],
+            warmup=options["warmup"],
+            trace_memory=not options["no_memory"],
+        )
+        report = {name: profiler.report() for name, profiler in results.items()}
+
+        if options["json"]:
+            self.stdout.write(json.dumps(report, indent=2))
+            return
+
+        for name, rows in report.items():
+            self.stdout.write(self.style.MIGRATE_HEADING(name))
+            self.stdout.write(format_report(rows, REPORT_COLUMNS))
+            self.stdout.write("")
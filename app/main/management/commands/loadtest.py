@@ -0,0 +1,148 @@
+import json
+
+from django.core.management.base import BaseCommand, CommandError
+
+from app.benchmarks.loadtest import DEFAULT_MIX, run_load_test
+from app.benchmarks.profiler import format_report
+from app.benchmarks.stubs import UpstreamProfile
+
+UPSTREAMS = ("rosetta", "wagtail", "delivery_options")
+
+LATENCY_COLUMNS = [
+    "kind",
+    "requests",
+    "mean_ms",
+    "p50_ms",
+    "p90_ms",
+    "p95_ms",
+    "p99_ms",
+    "max_ms",
+]
+
+
+def parse_assignments(values: list[str] | None, cast) -> dict:
+    """Parses repeated `name=value` options, `*` applies to all upstreams."""
+
+    parsed = {}
+    for value in values or []:
+        name, separator, raw = value.partition("=")
+        if not separator:
+            raise CommandError(f"Expected name=value, got '{value}'")
+        names = UPSTREAMS if name == "*" else (name,)
+        for upstream in names:
+            if upstream not in UPSTREAMS:
+                raise CommandError(
+                    f"Unknown upstream '{upstream}', expected one of {UPSTREAMS}"
+                )
+            parsed[upstream] = cast(raw)
+    return parsed
+
+
+class Command(BaseCommand):
+    help = (
+        "Load tests the ASGI application at a target request rate against "
+        "local stub upstreams (Rosetta get/search and the WireMock mappings), "
+        "reporting throughput, latency percentiles and upstream amplification."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--rps", type=float, default=10)
+        parser.add_argument(
+            "--duration", type=float, default=10, help="Duration in seconds"
+        )
+        parser.add_argument("--warmup", type=int, default=3)
+        parser.add_argument(
+            "--mix",
+            action="append",
+            help=(
+                "Relative weight of a request kind as kind=weight, kinds: "
+                f"{', '.join(DEFAULT_MIX)} (default "
+                f"{', '.join(f'{k}={v}' for k, v in DEFAULT_MIX.items())})"
+            ),
+        )
+        parser.add_argument(
+            "--latency",
+            action="append",
+            help="Injected upstream latency in ms as upstream=ms, * for all",
+        )
+        parser.add_argument(
+            "--jitter",
+            action="append",
+            help="Random extra upstream latency in ms as upstream=ms, * for all",
+        )
+        parser.add_argument(
+            "--error-rate",
+            action="append",
+            help="Fraction of upstream requests failing with 503 as upstream=rate",
+        )
+        parser.add_argument("--seed", type=int)
+        parser.add_argument("--json", action="store_true", help="Output as JSON")
+
+    def handle(self, *args, **options):
+        mix = DEFAULT_MIX
+        if options["mix"]:
+            mix = {}
+            for value in options["mix"]:
+                kind, _, weight = value.partition("=")
+                if kind not in DEFAULT_MIX:
+                    raise CommandError(f"Unknown request kind '{kind}'")
+                mix[kind] = int(weight)
+
+        latency = parse_assignments(options["latency"], float)
+        jitter = parse_assignments(options["jitter"], float)
+        error_rate = parse_assignments(options["error_rate"], float)
+        profiles = {
+            upstream: UpstreamProfile(
+                latency_ms=latency.get(upstream, 0),
+                jitter_ms=jitter.get(upstream, 0),
+                error_rate=error_rate.get(upstream, 0),
+            )
+            for upstream in UPSTREAMS
+        }
+
+        result = run_load_test(
+            rps=options["rps"],
+            duration=options["duration"],
+            mix=mix,
+            profiles=profiles,
+            warmup=options["warmup"],
+            seed=options["seed"],
+        )
+        report = result.report()
+
+        if options["json"]:
+            self.stdout.write(json.dumps(report, indent=2))
+            return
+
+        self.stdout.write(
+            f"{report['requests']} requests in {report['duration_s']:.2f}s "
+            f"({report['throughput_rps']:.2f} req/s), statuses {report['statuses']}"
+        )
+        rows = [{"kind": "all"} | report["latency"]] + [
+            {"kind": kind} | summary
+            for kind, summary in report["latency_by_kind"].items()
+        ]
+        self.stdout.write(format_report(rows, LATENCY_COLUMNS))
+        self.stdout.write("")
+        self.stdout.write(
+            format_report(
+                [
+                    {
+                        "upstream": name,
+                        "calls": report["upstream_calls"][name],
+                        "errors": report["upstream_errors"][name],
+                        "per_request": report["amplification"][name],
+                    }
+                    for name in report["upstream_calls"]
+                ]
+                + [
+                    {
+                        "upstream": "total",
+                        "calls": sum(report["upstream_calls"].values()),
+                        "errors": sum(report["upstream_errors"].values()),
+                        "per_request": report["amplification"]["total"],
+                    }
+                ],
+                ["upstream", "calls", "errors", "per_request"],
+            )
+        )
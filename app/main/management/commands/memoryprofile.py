@@ -0,0 +1,87 @@
+import json
+
+from django.core.management.base import BaseCommand, CommandError
+
+from app.benchmarks.footprint import measure_footprint
+from app.benchmarks.memory import REQUEST_URLS, profile_requests
+from app.benchmarks.profiler import format_report
+
+REQUEST_COLUMNS = [
+    "kind",
+    "iterations",
+    "mean_peak_kib",
+    "max_peak_kib",
+    "mean_retained_kib",
+    "max_retained_kib",
+    "budget_kib",
+    "over_budget",
+]
+
+FOOTPRINT_COLUMNS = ["target", "retained_kib", "peak_kib", "description"]
+
+
+class Command(BaseCommand):
+    help = (
+        "Measures peak and retained memory per request kind with tracemalloc, "
+        "failing when a request kind exceeds its peak memory budget, and the "
+        "memory retained by module-level data loaded at import time."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--iterations", type=int, default=5)
+        parser.add_argument("--warmup", type=int, default=2)
+        parser.add_argument(
+            "--kind",
+            action="append",
+            choices=list(REQUEST_URLS),
+            help="Only profile the given request kind(s)",
+        )
+        parser.add_argument(
+            "--budget",
+            action="append",
+            help="Peak memory budget for a request kind as kind=KiB",
+        )
+        parser.add_argument(
+            "--no-imports",
+            action="store_true",
+            help="Skip measuring the import time footprint",
+        )
+        parser.add_argument("--json", action="store_true", help="Output as JSON")
+
+    def handle(self, *args, **options):
+        budgets = {}
+        for value in options["budget"] or []:
+            kind, separator, kib = value.partition("=")
+            if not separator or kind not in REQUEST_URLS:
+                raise CommandError(
+                    f"Expected kind=KiB with kind one of {list(REQUEST_URLS)}, "
+                    f"got '{value}'"
+                )
+            budgets[kind] = float(kib)
+
+        requests = [
+            result.as_dict()
+            for result in profile_requests(
+                kinds=options["kind"],
+                iterations=options["iterations"],
+                warmup=options["warmup"],
+                budgets=budgets,
+            )
+        ]
+        footprint = [] if options["no_imports"] else measure_footprint()
+
+        if options["json"]:
+            self.stdout.write(
+                json.dumps({"requests": requests, "imports": footprint}, indent=2)
+            )
+        else:
+            self.stdout.write(self.style.MIGRATE_HEADING("Per request"))
+            self.stdout.write(format_report(requests, REQUEST_COLUMNS))
+            if footprint:
+                self.stdout.write("")
+                self.stdout.write(self.style.MIGRATE_HEADING("Import time"))
+                self.stdout.write(format_report(footprint, FOOTPRINT_COLUMNS))
+
+        over_budget = [row["kind"] for row in requests if row["over_budget"]]
+        if over_budget:
+            raise CommandError(f"Peak memory over budget for: {', '.join(over_budget)}")
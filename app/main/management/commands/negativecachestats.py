@@ -0,0 +1,22 @@
+from django.core.management.base import BaseCommand
+
+from app.lib.negative_cache import negative_cache_stats, reset_negative_cache_stats
+
+
+class Command(BaseCommand):
+    help = (
+        "Shows how many API lookups the negative cache answered (hits) and "
+        "how many not found results it cached (stores), per kind of lookup."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--reset", action="store_true", help="Reset the counts after showing"
+        )
+
+    def handle(self, *args, **options):
+        for kind, counts in negative_cache_stats().items():
+            self.stdout.write(f"{kind}: {counts['hit']} hits, {counts['store']} stores")
+        if options["reset"]:
+            reset_negative_cache_stats()
+            self.stdout.write(self.style.SUCCESS("Negative cache counts reset."))
@@ -0,0 +1,29 @@
+from django.core.management.base import BaseCommand
+
+from app.lib.transfer_stats import reset_transfer_stats, transfer_stats
+
+
+class Command(BaseCommand):
+    help = (
+        "Shows the responses read from each API and their bytes on the wire "
+        "(compressed) and decoded (uncompressed)."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--reset", action="store_true", help="Reset the counts after showing"
+        )
+
+    def handle(self, *args, **options):
+        for upstream, counts in transfer_stats().items():
+            responses = counts["responses"]
+            compressed_bytes = counts["compressed_bytes"]
+            decoded_bytes = counts["bytes"]
+            ratio = compressed_bytes / decoded_bytes if decoded_bytes else 0
+            self.stdout.write(
+                f"{upstream}: {responses} responses, {compressed_bytes} bytes "
+                f"transferred, {decoded_bytes} bytes decoded ({ratio:.0%})"
+            )
+        if options["reset"]:
+            reset_transfer_stats()
+            self.stdout.write(self.style.SUCCESS("Transfer counts reset."))
@@ -5,4 +5,9 @@ from app.main import views
 urlpatterns = [
     path("", views.index, name="index"),
     path("catalogue/", views.CatalogueView.as_view(), name="catalogue"),
+    path(
+        "catalogue/webhooks/wagtail/",
+        views.WagtailWebhookView.as_view(),
+        name="wagtail-webhook",
+    ),
 ]
@@ -1,15 +1,31 @@
+import hmac
+import json
 import logging
+from http import HTTPStatus
 
-from django.http import HttpResponse
+from django.conf import settings
+from django.http import HttpResponse, JsonResponse
 from django.template import loader
-from django.views.generic import TemplateView
+from django.utils.decorators import method_decorator
+from django.views.decorators.csrf import csrf_exempt
+from django.views.generic import TemplateView, View
 
+from app.lib.cache_control import CacheControlMixin
 from app.main.cache import (
     fetch_global_notifications,
     get_explore_the_collection,
 )
 
-from .cache import get_subjects_grouped_by_letter
+from .cache import (
+    WAGTAIL_CONTENT,
+    get_subject_picker,
+    invalidate_wagtail_content,
+)
+from .constants import (
+    GLOBAL_NOTIFICATIONS_SURROGATE_KEY,
+    LANDING_PAGE_SURROGATE_KEY,
+    SUBJECTS_SURROGATE_KEY,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -20,8 +36,16 @@ def index(request):
     return HttpResponse(template.render(context, request))
 
 
-class CatalogueView(TemplateView):
+class CatalogueView(CacheControlMixin, TemplateView):
     template_name = "main/catalogue.html"
+    cache_control_policy = "catalogue_landing"
+
+    def get_surrogate_keys(self) -> list[str]:
+        return [
+            LANDING_PAGE_SURROGATE_KEY,
+            GLOBAL_NOTIFICATIONS_SURROGATE_KEY,
+            SUBJECTS_SURROGATE_KEY,
+        ]
 
     def get_context_data(self, **kwargs):
 
@@ -30,13 +54,8 @@ class CatalogueView(TemplateView):
         explore = get_explore_the_collection()
         notifications = fetch_global_notifications()
 
-        # context for the subjects picker
-        subjects_grouped_by_letter = get_subjects_grouped_by_letter()
-        disabled_letters = [
-            letter
-            for letter, subjects in subjects_grouped_by_letter.items()
-            if not subjects
-        ]
+        # the subjects picker, rendered when the subjects are cached
+        subject_picker = get_subject_picker()
 
         context.update(
             {
@@ -48,9 +67,66 @@ class CatalogueView(TemplateView):
                 "mourning_notice": (
                     notifications.get("mourning_notice") if notifications else None
                 ),
-                "disabled_letters": disabled_letters,
-                "subjects_grouped_by_letter": subjects_grouped_by_letter,
+                "disabled_letters": subject_picker["disabled_letters"],
+                "subjects_grouped_by_letter": subject_picker[
+                    "subjects_grouped_by_letter"
+                ],
+                "subject_picker_html": subject_picker["html"],
             }
         )
 
         return context
+
+
+@method_decorator(csrf_exempt, name="dispatch")
+class WagtailWebhookView(View):
+    """Invalidates cached Wagtail content when Wagtail publishes it.
+
+    Authenticated with the WAGTAIL_WEBHOOK_SECRET as a bearer token. The
+    optional JSON body names the content to invalidate, and whether to fetch
+    it again now rather than on the next request:
+    {"content": ["notifications", "landing_page"], "refresh": false}
+    All content is invalidated when not named.
+    """
+
+    http_method_names = ["post"]
+
+    def is_authenticated(self, request) -> bool:
+        secret = settings.WAGTAIL_WEBHOOK_SECRET
+        authorization = request.headers.get("Authorization", "")
+        return bool(secret) and hmac.compare_digest(
+            authorization.encode(), f"Bearer {secret}".encode()
+        )
+
+    def post(self, request, *args, **kwargs) -> JsonResponse:
+        if not self.is_authenticated(request):
+            return JsonResponse(
+                {"error": "Unauthorized"}, status=HTTPStatus.UNAUTHORIZED
+            )
+
+        try:
+            data = json.loads(request.body or "{}")
+            contents = data.get("content") or list(WAGTAIL_CONTENT)
+            refresh = bool(data.get("refresh", False))
+        except (AttributeError, ValueError):
+            return JsonResponse(
+                {"error": "Invalid body"}, status=HTTPStatus.BAD_REQUEST
+            )
+        if not isinstance(contents, list):
+            contents = [contents]
+        if unknown := [
+            content
+            for content in contents
+            if not isinstance(content, str) or content not in WAGTAIL_CONTENT
+        ]:
+            return JsonResponse(
+                {"error": f"Unknown content: {', '.join(map(str, unknown))}"},
+                status=HTTPStatus.BAD_REQUEST,
+            )
+
+        result = invalidate_wagtail_content(contents, refresh=refresh)
+        logger.info(
+            f"Invalidated Wagtail content {', '.join(contents)}, "
+            f"version {result['version']}"
+        )
+        return JsonResponse({"content": contents, **result})
@@ -11,6 +11,11 @@ from app.lib.exceptions import (
     MultipleRecordsError,
     RecordNotFound,
 )
+from app.lib.negative_cache import (
+    RECORD_LOOKUP,
+    cache_negative,
+    raise_if_negative_cached,
+)
 from app.records.models import APIResponse, Record
 
 logger = logging.getLogger(__name__)
@@ -39,12 +44,19 @@ def record_details_by_id(
 
     Note:
         The errors are handled by a custom middleware in the app.
+        Not found errors are cached briefly and raised again without
+        calling the API.
     """
     uri = "get"
     if params is None:
         params = {}
     params.update({"id": id})
-    results = rosetta_request_handler(uri, params, timeout=timeout)
+    raise_if_negative_cached(RECORD_LOOKUP, params)
+    try:
+        results = rosetta_request_handler(uri, params, timeout=timeout)
+    except APIResourceNotFound as e:
+        cache_negative(RECORD_LOOKUP, params, e)
+        raise
     if "data" not in results:
         raise MissingAPIAttributeError(
             f"Get API response missing required 'data' field for id {id}"
@@ -55,7 +67,9 @@ def record_details_by_id(
         record_data = results["data"][0]
         response = APIResponse(record_data)
         return response.record
-    raise RecordNotFound(f"id {id} does not exist")
+    error = RecordNotFound(f"id {id} does not exist")
+    cache_negative(RECORD_LOOKUP, params, error)
+    raise error
 
 
 def record_details_by_ref(reference: str, params: dict = {}):
@@ -0,0 +1,317 @@
+"""Module for caching records and related records candidates in the records
+app.
+
+Records are cached by id, when record prefetch is enabled and when fetched
+in bulk, so the records prefetched from a record's hierarchy are served from
+the cache.
+
+Related records are sampled from pools of candidates, one per subject and one
+per series, shared by every record with that subject or in that series. The
+pools are cached and refreshed in the background once older than
+RELATED_RECORD_POOL_REFRESH seconds, so showing related records needs no API
+call while the pools are cached, and still varies between views. A view
+refreshes at most RELATED_POOL_MAX_REFRESHES pools, and a failed refresh is
+not retried for RELATED_POOL_RETRY_TIMEOUT seconds.
+"""
+
+import hashlib
+import logging
+import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from django.conf import settings
+from django.core.cache import cache
+
+from app.lib.deadline import get_deadline, use_deadline
+from app.lib.exceptions import NoResultsFound
+
+from .api import record_details_by_id
+from .constants import (
+    RECORD_CACHE_KEY_PREFIX,
+    RECORD_CACHE_TIMEOUT,
+    RECORDS_FETCH_MAX_WORKERS,
+    RELATED_POOL_CACHE_KEY_PREFIX,
+    RELATED_POOL_CACHE_TIMEOUT,
+    RELATED_POOL_MAX_REFRESHES,
+    RELATED_POOL_RETRY_TIMEOUT,
+    RELATED_POOL_SIZE,
+)
+from .models import Record
+from .related import _search_series, _search_subject, submit_background_search
+
+logger = logging.getLogger(__name__)
+
+# kinds of pool
+SUBJECT_POOL = "subject"
+SERIES_POOL = "series"
+
+_POOL_SEARCHES = {
+    SUBJECT_POOL: _search_subject,
+    SERIES_POOL: _search_series,
+}
+
+_lock = threading.Lock()
+_refreshing: set[str] = set()
+
+
+def record_cache_key(id: str) -> str:
+    return f"{RECORD_CACHE_KEY_PREFIX}:{id}"
+
+
+def get_cached_record(key: str) -> Record | None:
+    return cache.get(key)
+
+
+def cache_record(key: str, record: Record):
+    # the version is computed once and cached with the record, rather than
+    # for each response validated from the cache
+    _ = record.version
+    try:
+        cache.set(key, record, timeout=RECORD_CACHE_TIMEOUT)
+    except Exception as e:
+        logger.error(f"Failed to cache record: {e}")
+
+
+def cached_record_details_by_id(id: str) -> Record:
+    """Returns the record from the cache, or calls the API and caches the
+    record."""
+
+    key = record_cache_key(id)
+    if (record := get_cached_record(key)) is not None:
+        return record
+
+    record = record_details_by_id(id=id)
+    cache_record(key, record)
+    return record
+
+
+def records_details_by_ids(
+    ids: list[str], timeout=None
+) -> dict[str, Record | Exception]:
+    """
+    Fetches records by their ids, from the record cache or the Rosetta API.
+
+    Ids are deduplicated. Records not cached are fetched at once, up to
+    RECORDS_FETCH_MAX_WORKERS at a time, and cached.
+
+    Args:
+        ids: The record ids to fetch
+        timeout: Request timeout in seconds, for each record
+
+    Returns:
+        Dictionary keyed by id, in the order of the ids, of the Record or the
+        error raised fetching it, i.e. RecordNotFound
+    """
+    ids = [id for id in dict.fromkeys(ids) if id]
+    keys = {id: record_cache_key(id) for id in ids}
+    try:
+        cached = cache.get_many(keys.values())
+    except Exception as e:
+        logger.error(f"Failed to get cached records: {e}")
+        cached = {}
+
+    results: dict[str, Record | Exception] = {
+        id: cached[key] for id, key in keys.items() if key in cached
+    }
+    missing = [id for id in ids if id not in results]
+    if missing:
+        # worker threads call the API with the request's deadline
+        with ThreadPoolExecutor(
+            max_workers=min(RECORDS_FETCH_MAX_WORKERS, len(missing)),
+            initializer=use_deadline,
+            initargs=(get_deadline(),),
+        ) as executor:
+            futures = {
+                id: executor.submit(record_details_by_id, id=id, timeout=timeout)
+                for id in missing
+            }
+        fetched = {}
+        for id, future in futures.items():
+            try:
+                results[id] = fetched[keys[id]] = record = future.result()
+            except Exception as e:
+                logger.info(f"Failed to fetch record {id}: {e}")
+                results[id] = e
+            else:
+                # cached with the record, as in cache_record()
+                _ = record.version
+        try:
+            cache.set_many(fetched, timeout=RECORD_CACHE_TIMEOUT)
+        except Exception as e:
+            logger.error(f"Failed to cache records: {e}")
+
+    return {id: results[id] for id in ids}
+
+
+def related_pool_cache_key(kind: str, name: str) -> str:
+    digest = hashlib.sha256(name.encode()).hexdigest()
+    return f"{RELATED_POOL_CACHE_KEY_PREFIX}:{kind}:{digest}"
+
+
+def _cache_failed_refresh(kind: str, name: str):
+    """Caches the pool, with any candidates already cached, as refreshed so
+    it is not refreshed again until RELATED_POOL_RETRY_TIMEOUT has passed."""
+
+    key = related_pool_cache_key(kind, name)
+    pool = cache.get(key)
+    try:
+        cache.set(
+            key,
+            {
+                "records": pool["records"] if pool else [],
+                "refreshed": time.time()
+                - settings.RELATED_RECORD_POOL_REFRESH
+                + RELATED_POOL_RETRY_TIMEOUT,
+            },
+            timeout=RELATED_POOL_CACHE_TIMEOUT if pool else RELATED_POOL_RETRY_TIMEOUT,
+        )
+    except Exception as e:
+        logger.error(f"Failed to cache related records {kind} pool {name}: {e}")
+
+
+def refresh_related_pool(kind: str, name: str) -> list[Record] | None:
+    """Searches for the candidates of a pool and caches them. Returns None
+    when the search failed, which is cached to not retry it on every view."""
+
+    try:
+        records = list(_POOL_SEARCHES[kind](name, RELATED_POOL_SIZE).records)
+    except NoResultsFound:
+        records = []
+    except Exception as e:
+        logger.info(f"Failed to refresh related records {kind} pool {name}: {e}")
+        _cache_failed_refresh(kind, name)
+        return None
+
+    try:
+        cache.set(
+            related_pool_cache_key(kind, name),
+            {"records": records, "refreshed": time.time()},
+            timeout=RELATED_POOL_CACHE_TIMEOUT,
+        )
+    except Exception as e:
+        logger.error(f"Failed to cache related records {kind} pool {name}: {e}")
+    return records
+
+
+def _refresh(key: str, kind: str, name: str):
+    try:
+        refresh_related_pool(kind, name)
+    finally:
+        with _lock:
+            _refreshing.discard(key)
+
+
+def refresh_related_pool_in_background(kind: str, name: str) -> bool:
+    """Refreshes a pool in the background, unless it is already refreshing.
+    Returns True when the refresh was started."""
+
+    key = related_pool_cache_key(kind, name)
+    with _lock:
+        if key in _refreshing:
+            return False
+        _refreshing.add(key)
+    try:
+        submit_background_search(_refresh, key, kind, name)
+    except RuntimeError:
+        # executor shut down
+        with _lock:
+            _refreshing.discard(key)
+        return False
+    return True
+
+
+def _needs_refresh(pool: dict | None) -> bool:
+    return (
+        pool is None
+        or time.time() - pool["refreshed"] > settings.RELATED_RECORD_POOL_REFRESH
+    )
+
+
+def get_related_pool(kind: str, name: str) -> list[Record] | None:
+    """Returns the cached candidates of a pool, None when not cached.
+    Missing and stale pools are refreshed in the background."""
+
+    pool = cache.get(related_pool_cache_key(kind, name))
+    if _needs_refresh(pool):
+        refresh_related_pool_in_background(kind, name)
+    return None if pool is None else pool["records"]
+
+
+def get_related_pools(pools: list[tuple[str, str]]) -> list[list[Record] | None]:
+    """Returns the cached candidates of each (kind, name) pool, None for
+    pools not cached. Up to RELATED_POOL_MAX_REFRESHES of the missing, then
+    stale, pools are refreshed in the background."""
+
+    keys = [related_pool_cache_key(kind, name) for kind, name in pools]
+    cached = cache.get_many(keys)
+
+    refreshes = 0
+    # missing pools first
+    for (kind, name), key in sorted(
+        zip(pools, keys), key=lambda pool: pool[1] in cached
+    ):
+        if refreshes >= RELATED_POOL_MAX_REFRESHES:
+            break
+        if _needs_refresh(cached.get(key)) and refresh_related_pool_in_background(
+            kind, name
+        ):
+            refreshes += 1
+
+    return [cached[key]["records"] if key in cached else None for key in keys]
+
+
+def _sample(candidates: dict[str, Record], limit: int) -> list[Record]:
+    return random.sample(list(candidates.values()), min(limit, len(candidates)))
+
+
+def get_related_records_from_pools(
+    current_record: Record, limit: int = 3
+) -> list[Record] | None:
+    """
+    Returns records sharing subjects with the current record, backfilled from
+    its series, sampled from the cached pools.
+
+    Pools not cached yet are left out. Returns None when none of the pools
+    the record needs are cached, for the related records to be searched for
+    instead.
+    """
+    if not current_record.is_tna:
+        return []
+
+    series = current_record.hierarchy_series
+    series_ref = series.reference_number if series else None
+    pools = [(SUBJECT_POOL, subject) for subject in current_record.subjects]
+    if series_ref:
+        pools.append((SERIES_POOL, series_ref))
+    if not pools:
+        return []
+
+    candidates_by_pool = get_related_pools(pools)
+    if all(candidates is None for candidates in candidates_by_pool):
+        return None
+
+    subject_pools = candidates_by_pool[: len(current_record.subjects)]
+    series_pool = (candidates_by_pool[-1] if series_ref else None) or []
+
+    candidates = {
+        record.id: record
+        for pool in subject_pools
+        if pool
+        for record in pool
+        if record.id != current_record.id
+    }
+    related = _sample(candidates, limit)
+
+    # Backfill from series if needed
+    if len(related) < limit:
+        related_ids = {record.id for record in related}
+        series_candidates = {
+            record.id: record
+            for record in series_pool
+            if record.id != current_record.id and record.id not in related_ids
+        }
+        related.extend(_sample(series_candidates, limit - len(related)))
+
+    return related
@@ -71,6 +71,29 @@ MISSING_COUNT_TEXT = "Unknown number of"
 
 RELATED_RECORDS_FETCH_LIMIT = 10
 
+# related records searches in flight at once, for each record and in all
+RELATED_SEARCH_FAN_OUT = 4
+RELATED_SEARCH_MAX_WORKERS = 16
+# most seconds a request waits for its background related searches, when it
+# has no deadline or a later one
+RELATED_SEARCH_WAIT_TIMEOUT = 10
+
+# records cached when record prefetch is enabled
+RECORD_CACHE_TIMEOUT = 60 * 5  # 5 minutes
+RECORD_CACHE_KEY_PREFIX = "record"
+
+# records fetched at once by records_details_by_ids
+RECORDS_FETCH_MAX_WORKERS = 8
+
+# candidates for related records cached per subject and per series
+RELATED_POOL_SIZE = 50
+RELATED_POOL_CACHE_TIMEOUT = 60 * 60 * 24  # 1 day, refreshed before
+RELATED_POOL_CACHE_KEY_PREFIX = "related_pool"
+# most pools refreshed in the background for each record viewed
+RELATED_POOL_MAX_REFRESHES = 3
+# seconds before a pool that failed to refresh is refreshed again
+RELATED_POOL_RETRY_TIMEOUT = 60 * 5
+
 TNA_HELD_BY_VALUES = [
     "The National Archives",
     "The National Archives, Kew",
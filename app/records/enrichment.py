@@ -18,8 +18,16 @@ from app.deliveryoptions.delivery_options import (
     get_availability_group,
     has_distressing_content,
 )
+from app.lib.circuit_breaker import is_circuit_open
 from app.lib.constants import BASE_TNA_DISCOVERY_URL
+from app.lib.deadline import (
+    deadline_exceeded,
+    get_deadline,
+    remaining_time,
+    use_deadline,
+)
 from app.records.api import get_subjects_enrichment
+from app.records.cache import get_related_records_from_pools
 from app.records.constants import (
     API_TIMEOUTS,
     THREADPOOL_MAX_WORKERS,
@@ -29,6 +37,9 @@ from app.records.models import Record
 from app.records.related import (
     get_related_records_by_series,
     get_tna_related_records_by_subjects,
+    related_search_wait_timeout,
+    related_searches_saturated,
+    submit_related_search,
 )
 from app.records.utils import log_enrichment_execution_time
 
@@ -130,21 +141,42 @@ class RecordEnrichmentHelper:
         completion_order = []
         completion_times = {}
 
-        with ThreadPoolExecutor(max_workers=THREADPOOL_MAX_WORKERS) as executor:
+        # worker threads call the APIs with the request's deadline
+        executor = ThreadPoolExecutor(
+            max_workers=THREADPOOL_MAX_WORKERS,
+            initializer=use_deadline,
+            initargs=(get_deadline(),),
+        )
+        timed_out = False
+        try:
             futures_map = self._submit_fetch_tasks(executor)
             start_time = time.time()
 
-            # Process futures as they complete
-            for future in as_completed(futures_map):
-                name = futures_map[future]
-                timeout = API_TIMEOUTS[name]
-                elapsed = time.time() - start_time
-                completion_order.append(name)
-                completion_times[name] = elapsed
-
-                self._process_future_result(future, name, timeout, results)
-
-            self._log_completion_timing(completion_order, completion_times)
+            # Process futures as they complete, until the request deadline
+            try:
+                for future in as_completed(futures_map, timeout=remaining_time()):
+                    name = futures_map[future]
+                    timeout = API_TIMEOUTS[name]
+                    elapsed = time.time() - start_time
+                    completion_order.append(name)
+                    completion_times[name] = elapsed
+
+                    self._process_future_result(future, name, timeout, results)
+            except TimeoutError:
+                timed_out = True
+                skipped = [
+                    name for future, name in futures_map.items() if not future.done()
+                ]
+                logger.warning(
+                    f"Request deadline exceeded, skipped {', '.join(skipped)} "
+                    f"for record {self.record.id}"
+                )
+        finally:
+            # not waited for at the deadline, running tasks end on their own,
+            # their calls fail once past the deadline
+            executor.shutdown(wait=not timed_out, cancel_futures=timed_out)
+
+        self._log_completion_timing(completion_order, completion_times)
 
         return results
 
@@ -161,7 +193,19 @@ class RecordEnrichmentHelper:
 
         return results
 
+    def _is_unavailable(self, name: str, api_url: str) -> bool:
+        """Returns True to skip optional enrichment while its API's circuit
+        breaker is open, or after the request deadline."""
+        if is_circuit_open(api_url) or deadline_exceeded():
+            logger.info(
+                f"Skipped {name} for record {self.record.id}, the API is unavailable"
+            )
+            return True
+        return False
+
     def _fetch_subjects(self) -> dict:
+        if self._is_unavailable("subjects", settings.WAGTAIL_API_URL):
+            return {}
         return get_subjects_enrichment(
             self.record.subjects,
             limit=settings.MAX_SUBJECTS_PER_RECORD,
@@ -176,24 +220,83 @@ class RecordEnrichmentHelper:
         1. Search for records sharing subjects (random selection from candidates)
         2. If fewer than limit found, backfill from same series
 
+        With ENABLE_RELATED_RECORD_POOLS the records are sampled from cached
+        candidates, searching only until they are cached.
+
+        With ENABLE_PARALLEL_API_CALLS the series search starts alongside the
+        subject searches, and is cancelled or ignored when not needed, unless
+        the search threads are all busy.
+
         Returns:
             List of related Record objects (up to related_limit), or empty list
         """
-        related = get_tna_related_records_by_subjects(
-            self.record,
-            limit=self.related_limit,
-            timeout=settings.ROSETTA_ENRICHMENT_API_TIMEOUT,
-        )
+        if settings.ENABLE_RELATED_RECORD_POOLS:
+            # no API call while the record's pools are cached
+            related = get_related_records_from_pools(
+                self.record, limit=self.related_limit
+            )
+            if related is not None:
+                return related
+
+        if self._is_unavailable("related", settings.ROSETTA_API_URL):
+            return []
+
+        series_future = None
+        if settings.ENABLE_PARALLEL_API_CALLS and not related_searches_saturated():
+            try:
+                series_future = submit_related_search(
+                    get_related_records_by_series,
+                    self.record,
+                    limit=self.related_limit,
+                    timeout=settings.ROSETTA_ENRICHMENT_API_TIMEOUT,
+                )
+            except RuntimeError:
+                logger.info(
+                    f"Failed to start series search for record {self.record.id}"
+                )
+
+        try:
+            related = get_tna_related_records_by_subjects(
+                self.record,
+                limit=self.related_limit,
+                timeout=settings.ROSETTA_ENRICHMENT_API_TIMEOUT,
+            )
+        except Exception:
+            if series_future:
+                series_future.cancel()
+            raise
 
         # Backfill from series if needed
-        if len(related) < self.related_limit:
-            remaining = self.related_limit - len(related)
+        if len(related) >= self.related_limit:
+            if series_future:
+                series_future.cancel()
+            return related
+
+        remaining = self.related_limit - len(related)
+        if series_future:
+            try:
+                series_records = series_future.result(
+                    timeout=related_search_wait_timeout()
+                )
+            except TimeoutError:
+                logger.info(
+                    f"Timed out waiting for series search, skipped series "
+                    f"backfill for record {self.record.id}"
+                )
+                series_records = []
+        else:
             series_records = get_related_records_by_series(
                 self.record,
                 limit=remaining,
                 timeout=settings.ROSETTA_ENRICHMENT_API_TIMEOUT,
             )
-            related.extend(series_records)
+
+        related_ids = {record.id for record in related}
+        related.extend(
+            [record for record in series_records if record.id not in related_ids][
+                :remaining
+            ]
+        )
 
         return related
 
@@ -209,6 +312,8 @@ class RecordEnrichmentHelper:
             Dictionary with delivery_option, do_availability_group, display
             heading, instructions, and Discovery link. Empty dict on any error.
         """
+        if self._is_unavailable("delivery", settings.DELIVERY_OPTIONS_API_URL):
+            return {}
         try:
             # Get API data
             api_context = self._get_delivery_api_data()
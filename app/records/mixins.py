@@ -1,6 +1,14 @@
 import logging
 
+from django.conf import settings
+
+from app.lib.cache_control import (
+    CacheControlMixin,
+    record_surrogate_key,
+    series_surrogate_key,
+)
 from app.records.api import record_details_by_id
+from app.records.cache import cached_record_details_by_id
 from app.records.models import Record
 
 logger = logging.getLogger(__name__)
@@ -12,7 +20,11 @@ class RecordContextMixin:
     def get_record(self) -> Record:
         """Fetch the record by ID from URL kwargs."""
         if not hasattr(self, "_record"):
-            self._record = record_details_by_id(id=self.kwargs["id"])
+            if settings.ENABLE_RECORD_PREFETCH:
+                # prefetched from the hierarchy of the record viewed before
+                self._record = cached_record_details_by_id(id=self.kwargs["id"])
+            else:
+                self._record = record_details_by_id(id=self.kwargs["id"])
         return self._record
 
     def get_context_data(self, **kwargs):
@@ -20,3 +32,18 @@ class RecordContextMixin:
         context = super().get_context_data(**kwargs)
         context["record"] = self.get_record()
         return context
+
+
+class RecordCacheControlMixin(CacheControlMixin):
+    """Mixin for record pages to set cache headers with the record's
+    surrogate keys."""
+
+    def get_surrogate_keys(self) -> list[str]:
+        keys = [record_surrogate_key(self.kwargs["id"])]
+        # the record is not fetched for a not modified response
+        if hasattr(self, "_record"):
+            keys.append(record_surrogate_key(self._record.id))
+            series = self._record.hierarchy_series
+            if series and series.reference_number:
+                keys.append(series_surrogate_key(series.reference_number))
+        return keys
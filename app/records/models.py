@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import hashlib
+import json
 import logging
 from typing import Any
 from urllib.parse import urlencode
@@ -27,6 +29,7 @@ from app.records.constants import (
 from app.records.utils import (
     extract,
     format_link,
+    get_path_accessor,
 )
 from app.search.buckets import BucketKeys
 from app.search.constants import FieldsConstant
@@ -41,6 +44,14 @@ from .tna_archon_constants import (
 logger = logging.getLogger(__name__)
 
 
+def is_tna_group(raw_data: dict[str, Any]) -> bool:
+    """Returns True if the record data belongs to the TNA group, False otherwise."""
+    for item in raw_data.get("groupArray", []):
+        if item.get("value", "") == "tna":
+            return True
+    return False
+
+
 class APIModel:
     def __init__(self, raw_data: dict[str, Any]):
         self._raw = raw_data
@@ -50,15 +61,19 @@ class APIModel:
         Attempts to extract `key` from `self._raw` and return the value.
         """
         if "." in key:
-            try:
-                return extract(self._raw, key, default)
-            except Exception:
-                return default
+            return get_path_accessor(key)(self._raw, default)
         try:
             return self._raw[key]
         except KeyError:
             return default
 
+    @cached_property
+    def version(self) -> str:
+        """A hash of the raw data, changes whenever the API data changes."""
+        return hashlib.sha256(
+            json.dumps(self._raw, sort_keys=True, default=str).encode()
+        ).hexdigest()
+
 
 class APIResponse(APIModel):
     def __init__(self, raw_data: dict[str, Any]):
@@ -435,16 +450,18 @@ class Record(APIModel):
         """Returns the api value of the attr if found, empty list otherwise."""
         return self.get("unpublishedFindingAids", [])
 
+    def _linked_summary(self, raw_data: dict[str, Any]) -> RecordSummary:
+        """Returns a summary of a record linked from this one, TNA when this
+        record is, otherwise from the linked record's own group."""
+        return RecordSummary(raw_data, is_tna=self.is_tna or is_tna_group(raw_data))
+
     @cached_property
-    def hierarchy(self) -> tuple[Record, ...]:
-        """Returns tuple of records transformed from the values of the attr if found, empty tuple otherwise."""
+    def hierarchy(self) -> tuple[RecordSummary, ...]:
+        """Returns tuple of record summaries transformed from the values of the attr if found, empty tuple otherwise."""
         hierarchy_records = ()
         for hierarchy_item in self.get("@hierarchy", ()):
             if hierarchy_item.get("identifier"):
-                # page_record_is_tna: carry status to hierarchy record
-                hierarchy_record = Record(
-                    hierarchy_item | {"page_record_is_tna": self.is_tna}
-                )
+                hierarchy_record = self._linked_summary(hierarchy_item)
                 # skips current record from showing in hierarchy bar
                 if self.id == hierarchy_record.id:
                     continue
@@ -453,58 +470,30 @@ class Record(APIModel):
         return hierarchy_records
 
     @cached_property
-    def hierarchy_count(self) -> str:
-        """Returns the formatted count usually found in record of the hierarchy
-        records i.e. @hierarchy, default text otherwise.
-        Usually expected to be present to show in the UI."""
-
-        count = self.get("count", None)
-        if not count:
-            # Handles missing value by logging the issue and continuing without user-facing impact.
-            message = "hierarchy_count missing for hierarchy record"
-            logger.error(message)
-            sentry_sdk.capture_message(message, level="error")
-            # add context for debugging in Sentry
-            sentry_sdk.set_context("missing_info", {"hierarchy_record_id": {self.id}})
-            return MISSING_COUNT_TEXT
-        return format_number(count)
-
-    @cached_property
-    def next(self) -> Record | None:
-        """Returns a record transformed from the values of the attr if found, None otherwise."""
+    def next(self) -> RecordSummary | None:
+        """Returns a record summary transformed from the values of the attr if found, None otherwise."""
         if next := self.get("@next", None):
-            # page_record_is_tna: carry status to next record
-            return Record(next | {"page_record_is_tna": self.is_tna})
+            return self._linked_summary(next)
         return None
 
     @cached_property
-    def previous(self) -> Record | None:
-        """Returns a record transformed from the values of the attr if found, None otherwise."""
+    def previous(self) -> RecordSummary | None:
+        """Returns a record summary transformed from the values of the attr if found, None otherwise."""
         if previous := self.get("@previous", None):
-            # page_record_is_tna: carry status to previous record
-            return Record(previous | {"page_record_is_tna": self.is_tna})
+            return self._linked_summary(previous)
         return None
 
     @cached_property
-    def parent(self) -> Record | None:
-        """Returns a record transformed from the values of the attr if found, None otherwise."""
+    def parent(self) -> RecordSummary | None:
+        """Returns a record summary transformed from the values of the attr if found, None otherwise."""
         if parent := self.get("parent", None):
-            # page_record_is_tna: carry status to parent record
-            return Record(parent | {"page_record_is_tna": self.is_tna})
+            return self._linked_summary(parent)
         return None
 
     @cached_property
     def is_tna(self) -> bool:
         """Returns True if record belongs to TNA, False otherwise."""
-        # checks if page attribute if present, so that same is_tna
-        # is used for the created record
-        if is_tna := self.get("page_record_is_tna", ""):
-            return is_tna
-
-        for item in self.get("groupArray", []):
-            if item.get("value", "") == "tna":
-                return True
-        return False
+        return is_tna_group(self._raw)
 
     @cached_property
     def is_digitised(self) -> bool:
@@ -546,7 +535,7 @@ class Record(APIModel):
         return items
 
     @cached_property
-    def hierarchy_series(self) -> Record | None:
+    def hierarchy_series(self) -> RecordSummary | None:
         """Return the series-level record from this record's hierarchy, if present."""
         for record in self.hierarchy:
             if record.level == TnaLevels.SERIES.level:
@@ -640,3 +629,88 @@ class Record(APIModel):
                 }
             return f"{BASE_TNA_DISCOVERY_URL}/results/r?{urlencode(params)}"
         return ""
+
+
+class RecordSummary:
+    """A compact, read-only record for list contexts i.e. search results and
+    the hierarchy, next, previous and parent of a record.
+
+    Holds only the values shown when listing records rather than the raw data,
+    is_tna is passed in by the caller, i.e. carried from the page record or
+    derived once from the search result.
+    """
+
+    __slots__ = (
+        "id",
+        "reference_number",
+        "title",
+        "summary_title",
+        "clean_description",
+        "held_by",
+        "date_covering",
+        "level_code",
+        "is_tna",
+        "_count",
+    )
+
+    def __init__(self, raw_data: dict[str, Any], is_tna: bool):
+        self.id = raw_data.get("id") or extract(raw_data, "@admin.id", "")
+        self.reference_number = raw_data.get("referenceNumber") or next(
+            (
+                item["reference_number"]
+                for item in raw_data.get("identifier", ())
+                if "reference_number" in item
+            ),
+            "",
+        )
+        self.title = raw_data.get("title", "")
+        self.summary_title = raw_data.get("summaryTitle") or extract(
+            raw_data, "summary.title", ""
+        )
+        self.clean_description = raw_data.get("cleanDescription", "")
+        self.held_by = raw_data.get("heldBy", "")
+        self.date_covering = raw_data.get("dateCovering", "")
+        self.level_code = extract(raw_data, "level.code", None)
+        self.is_tna = is_tna
+        self._count = raw_data.get("count", None)
+
+    @classmethod
+    def from_search_result(cls, raw_data: dict[str, Any]) -> RecordSummary:
+        """Returns a summary for a search result, is_tna derived from its group."""
+        return cls(raw_data, is_tna=is_tna_group(raw_data))
+
+    def __str__(self):
+        return f"{self.summary_title} ({self.id})"
+
+    @property
+    def level(self) -> str:
+        """Returns level name for tna, non tna level codes"""
+        if self.is_tna:
+            return TnaLevels.level_from_code(str(self.level_code or ""))
+        return NonTnaLevels.level_from_code(str(self.level_code or ""))
+
+    @property
+    def url(self) -> str:
+        """Returns record detail url for id, empty str otherwise."""
+        if self.id:
+            try:
+                return reverse("records:details", kwargs={"id": self.id})
+            except NoReverseMatch:
+                pass
+        return ""
+
+    @property
+    def hierarchy_count(self) -> str:
+        """Returns the formatted count usually found in record of the hierarchy
+        records i.e. @hierarchy, default text otherwise.
+        Usually expected to be present to show in the UI."""
+
+        if not self._count:
+            # Handles missing value by logging the issue and continuing without user-facing impact.
+            message = "hierarchy_count missing for hierarchy record"
+            logger.error(message)
+            sentry_sdk.capture_message(message, level="error")
+            # add context for debugging in Sentry
+            sentry_sdk.set_context("missing_info", {"hierarchy_record_id": {self.id}})
+            return MISSING_COUNT_TEXT
+        return format_number(self._count)
@@ -0,0 +1,54 @@
+"""Speculative prefetch of the records next to a record in its hierarchy.
+
+After a record page is rendered, its next, previous and parent records, the
+records linked from the page's hierarchy navigation, are fetched in
+background threads and stored in the record cache, so browsing through a
+series is answered from the cache.
+
+Prefetching is bounded by the prefetch budget shared by the process, see
+app.lib.prefetch.
+"""
+
+import logging
+from concurrent.futures import Future
+
+from django.conf import settings
+
+from app.lib.prefetch import is_bot, submit_prefetch
+
+from .cache import cached_record_details_by_id, get_cached_record, record_cache_key
+from .models import Record
+
+logger = logging.getLogger(__name__)
+
+
+def should_prefetch_records(user_agent: str) -> bool:
+    """Returns True when the hierarchy is worth prefetching for the request."""
+
+    return settings.ENABLE_RECORD_PREFETCH and not is_bot(user_agent)
+
+
+def prefetch_record(id: str) -> Future | None:
+    """Fetches a record in the background to warm the record cache.
+
+    Returns None when skipped: already cached or in flight, or the prefetch
+    budget is spent.
+    """
+
+    key = record_cache_key(id)
+    if get_cached_record(key) is not None:
+        return None
+
+    return submit_prefetch(key, cached_record_details_by_id, id)
+
+
+def prefetch_hierarchy(record: Record) -> list[Future]:
+    """Prefetches the next, previous and parent records of a record, the
+    most likely to be requested next first."""
+
+    futures = []
+    for summary in (record.next, record.previous, record.parent):
+        if summary and summary.id and summary.id != record.id:
+            if future := prefetch_record(summary.id):
+                futures.append(future)
+    return futures
@@ -1,12 +1,30 @@
+import contextvars
+import itertools
 import logging
 import random
-
-from app.records.constants import RELATED_RECORDS_FETCH_LIMIT, TnaLevels
+import threading
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+
+from django.conf import settings
+
+from app.lib.deadline import remaining_time
+from app.records.constants import (
+    RELATED_RECORDS_FETCH_LIMIT,
+    RELATED_SEARCH_FAN_OUT,
+    RELATED_SEARCH_MAX_WORKERS,
+    RELATED_SEARCH_WAIT_TIMEOUT,
+    TnaLevels,
+)
 from app.records.models import Record
 from app.search.api import search_records
 
 logger = logging.getLogger(__name__)
 
+_lock = threading.Lock()
+_executor: ThreadPoolExecutor | None = None
+# searches submitted and not yet finished, shared by all requests
+_in_flight = 0
+
 # Labels for tna levels between Series and Item inclusive
 tna_level_lower_bound = int(TnaLevels.SERIES.level_code)
 tna_level_upper_bound = int(TnaLevels.ITEM.level_code) + 1
@@ -19,6 +37,71 @@ _LEVEL_FILTERS_SERIES_TO_ITEM = [
 ]
 
 
+def _get_executor() -> ThreadPoolExecutor:
+    global _executor
+    if _executor is None:
+        with _lock:
+            if _executor is None:
+                _executor = ThreadPoolExecutor(
+                    max_workers=RELATED_SEARCH_MAX_WORKERS,
+                    thread_name_prefix="related-search",
+                )
+    return _executor
+
+
+def _search_finished(future: Future):
+    global _in_flight
+    with _lock:
+        _in_flight -= 1
+
+
+def _submit(fn, *args, **kwargs) -> Future:
+    global _in_flight
+    executor = _get_executor()
+    with _lock:
+        _in_flight += 1
+    try:
+        future = executor.submit(fn, *args, **kwargs)
+    except RuntimeError:
+        with _lock:
+            _in_flight -= 1
+        raise
+    future.add_done_callback(_search_finished)
+    return future
+
+
+def related_searches_saturated() -> bool:
+    """Returns True when every search thread is busy, so a new search would
+    queue behind other requests' searches."""
+
+    return _in_flight >= RELATED_SEARCH_MAX_WORKERS
+
+
+def related_search_wait_timeout() -> float:
+    """Returns the seconds to wait for background searches, the time left
+    before the request deadline, at most RELATED_SEARCH_WAIT_TIMEOUT."""
+
+    remaining = remaining_time()
+    if remaining is None:
+        return RELATED_SEARCH_WAIT_TIMEOUT
+    return min(remaining, RELATED_SEARCH_WAIT_TIMEOUT)
+
+
+def submit_related_search(fn, *args, **kwargs) -> Future:
+    """Runs a related records search in the background, with the request's
+    deadline. Raises RuntimeError when the executor has shut down."""
+
+    return _submit(contextvars.copy_context().run, fn, *args, **kwargs)
+
+
+def submit_background_search(fn, *args, **kwargs) -> Future:
+    """Runs a search in the background without the request's deadline, for
+    work outliving the request. Raises RuntimeError when the executor has
+    shut down."""
+
+    return _submit(fn, *args, **kwargs)
+
+
 def get_tna_related_records_by_subjects(
     current_record: Record, limit: int = 3, timeout: int = None
 ) -> list[Record]:
@@ -103,6 +186,32 @@ def _search_with_all_subjects(
     return record_matches
 
 
+def _search_subject(subject: str, fetch_limit: int, timeout: int = None):
+    filters = ["group:tna", f"subject:{subject}"]
+    # Add pre-computed level filters
+    filters.extend(_LEVEL_FILTERS_SERIES_TO_ITEM)
+
+    params = {"filter": filters, "aggs": []}
+
+    return search_records(
+        query="*",
+        results_per_page=fetch_limit,
+        page=1,
+        sort="",
+        params=params,
+        timeout=timeout,
+    )
+
+
+def _add_record_matches(current_record: Record, api_result, record_matches: dict):
+    for record in api_result.records:
+        if record.id == current_record.id:
+            continue
+
+        if record.id not in record_matches:
+            record_matches[record.id] = record
+
+
 def _search_individual_subjects(
     current_record: Record,
     fetch_limit: int,
@@ -111,6 +220,11 @@ def _search_individual_subjects(
 ) -> dict:
     """Search by individual subjects until enough matches are found.
 
+    With ENABLE_PARALLEL_API_CALLS, up to RELATED_SEARCH_FAN_OUT subjects are
+    searched at once, and the searches not yet started are cancelled once
+    there are enough matches. Subjects are searched in turn instead while
+    the search threads are all busy.
+
     Args:
         current_record: The TNA record to find relations for
         fetch_limit: Maximum number of additional matches to fetch
@@ -126,35 +240,57 @@ def _search_individual_subjects(
     # By using a random shuffle, we won't get the same related records appearing over and again
     random.shuffle(record_subject_list)
 
-    for subject in record_subject_list:
-        if len(record_matches) >= fetch_limit:
-            break
-
-        filters = ["group:tna", f"subject:{subject}"]
-        # Add pre-computed level filters
-        filters.extend(_LEVEL_FILTERS_SERIES_TO_ITEM)
-
-        params = {"filter": filters, "aggs": []}
-
-        try:
-            api_result = search_records(
-                query="*",
-                results_per_page=fetch_limit,
-                page=1,
-                sort="",
-                params=params,
-                timeout=timeout,
+    if not settings.ENABLE_PARALLEL_API_CALLS or related_searches_saturated():
+        for subject in record_subject_list:
+            if len(record_matches) >= fetch_limit:
+                break
+            try:
+                api_result = _search_subject(subject, fetch_limit, timeout)
+                _add_record_matches(current_record, api_result, record_matches)
+            except Exception as e:
+                logger.debug(f"Failed to search for subject '{subject}': {e}")
+        return record_matches
+
+    subjects = iter(record_subject_list)
+    pending: dict[Future, str] = {}
+
+    def submit(count: int):
+        for subject in itertools.islice(subjects, count):
+            try:
+                future = submit_related_search(
+                    _search_subject, subject, fetch_limit, timeout
+                )
+            except RuntimeError:
+                # executor shut down
+                return
+            pending[future] = subject
+
+    submit(RELATED_SEARCH_FAN_OUT)
+    try:
+        while pending and len(record_matches) < fetch_limit:
+            done, _ = wait(
+                pending,
+                timeout=related_search_wait_timeout(),
+                return_when=FIRST_COMPLETED,
             )
-
-            for record in api_result.records:
-                if record.id == current_record.id:
-                    continue
-
-                if record.id not in record_matches:
-                    record_matches[record.id] = record
-
-        except Exception as e:
-            logger.debug(f"Failed to search for subject '{subject}': {e}")
+            if not done:
+                logger.debug(
+                    f"Timed out waiting for subject searches for "
+                    f"record {current_record.id}"
+                )
+                break
+            for future in done:
+                subject = pending.pop(future)
+                try:
+                    _add_record_matches(current_record, future.result(), record_matches)
+                except Exception as e:
+                    logger.debug(f"Failed to search for subject '{subject}': {e}")
+            if len(record_matches) < fetch_limit:
+                submit(len(done))
+    finally:
+        # enough matches, searches already running finish in the background
+        for future in pending:
+            future.cancel()
 
     return record_matches
 
@@ -198,6 +334,22 @@ def _search_by_subject_matches(
     return list(record_matches.values())
 
 
+def _search_series(series_ref: str, fetch_limit: int, timeout: int = None):
+    params = {
+        "filter": ["group:tna"],
+        "aggs": [],
+    }
+
+    return search_records(
+        query=series_ref,
+        results_per_page=fetch_limit,
+        page=1,
+        sort="",
+        params=params,
+        timeout=timeout,
+    )
+
+
 def get_related_records_by_series(
     current_record: Record, limit: int = 3, timeout: int = None
 ) -> list[Record]:
@@ -227,20 +379,9 @@ def get_related_records_by_series(
         )
         return []
 
-    params = {
-        "filter": ["group:tna"],
-        "aggs": [],
-    }
-
     try:
-        api_result = search_records(
-            query=series_ref,
-            results_per_page=limit * 2,  # Get extra to filter out current record
-            page=1,
-            sort="",
-            params=params,
-            timeout=timeout,
-        )
+        # Get extra to filter out current record
+        api_result = _search_series(series_ref, limit * 2, timeout)
 
         results = []
         for record in api_result.records:
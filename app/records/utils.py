@@ -1,7 +1,7 @@
 import logging
 import re
 import time
-from functools import wraps
+from functools import lru_cache, wraps
 from typing import Any, Dict
 
 from django.conf import settings
@@ -51,6 +51,57 @@ def change_discovery_record_details_links(html: str) -> str:
     return html
 
 
+class PathAccessor:
+    """
+    A dotted path (e.g. "level.code" or "children.0.id") compiled once into
+    the lookup steps taken to extract its value, see `extract()`.
+
+    Each path segment is parsed for a sequence index up front, so accessing
+    a value only walks the source.
+    """
+
+    __slots__ = ("key", "steps")
+
+    def __init__(self, key: str):
+        self.key = key
+        steps = []
+        for bit in key.split("."):
+            try:
+                index = int(bit)
+            except ValueError:
+                index = None
+            steps.append((bit, index))
+        self.steps = tuple(steps)
+
+    def __call__(self, source: Any, default: Any = None) -> Any:
+        current = source
+        try:
+            for bit, index in self.steps:
+                # Only attempt key lookups for dicts
+                if isinstance(current, dict):
+                    current = current[bit]
+
+                # Only attempt index lookups for sequences, and only
+                # when the value looks like an index
+                elif index is not None and hasattr(current, "__getitem__"):
+                    current = current[index]
+
+                # Always fall back to attribute lookup
+                else:
+                    current = getattr(current, bit)
+
+        except Exception:
+            return default
+
+        return current
+
+
+@lru_cache(maxsize=1024)
+def get_path_accessor(key: str) -> PathAccessor:
+    """Returns the compiled PathAccessor for `key`, cached per key."""
+    return PathAccessor(key)
+
+
 def extract(source: Dict[str, Any], key: str, default: Any = None) -> Any:
     """
     Attempts to extract `key` (a string with multiple '.' to indicate
@@ -60,37 +111,7 @@ def extract(source: Dict[str, Any], key: str, default: Any = None) -> Any:
     If `default` is provided, that value will be returned if any issues
     arise during the process.
     """
-    current = source
-    lookups = tuple(key.split("."))
-
-    try:
-        for bit in lookups:
-            # NOTE: we could use a series of nested try/excepts here instead,
-            # but using conditionals allows us to raise more relevant exceptions
-
-            # Only attempt key lookups for dicts
-            if isinstance(current, dict):
-                current = current[bit]
-                continue
-
-            # Only attempt index lookups for sequences, and only
-            # when the value looks like an index
-            if hasattr(current, "__getitem__"):
-                try:
-                    bit_index = int(bit)
-                except ValueError:
-                    pass
-                else:
-                    current = current[bit_index]  # do index lookup
-                    continue
-
-            # Always fall back to attribute lookup
-            current = getattr(current, bit)
-
-    except Exception:
-        return default
-
-    return current
+    return get_path_accessor(key)(source, default)
 
 
 def log_enrichment_execution_time(func):
@@ -4,21 +4,56 @@ import logging
 
 from django.views.generic import TemplateView
 
+from app.deliveryoptions.reader_type import get_reader_type
+from app.lib.conditional_get import ConditionalGetMixin
 from app.main.cache import fetch_global_notifications
+from app.main.constants import GLOBAL_NOTIFICATIONS_SURROGATE_KEY
 from app.records.enrichment import RecordEnrichmentHelper
 from app.records.labels import FIELD_LABELS
-from app.records.mixins import RecordContextMixin
+from app.records.mixins import RecordCacheControlMixin, RecordContextMixin
+from app.records.prefetch import prefetch_hierarchy, should_prefetch_records
 
 from .constants import RecordTypes
 
 logger = logging.getLogger(__name__)
 
 
-class RecordDetailView(RecordContextMixin, TemplateView):
+class RecordDetailView(
+    RecordCacheControlMixin, ConditionalGetMixin, RecordContextMixin, TemplateView
+):
     """View for rendering an individual archive record's details page."""
 
     template_name = "records/record_detail.html"
     related_records_limit = 3
+    cache_control_policy = "record_detail"
+    etag_before_render = True
+
+    def is_private(self) -> bool:
+        """Delivery options depend on the reader type, from the client IP
+        address, which shared caches do not vary by."""
+        return True
+
+    def get_surrogate_keys(self) -> list[str]:
+        return [*super().get_surrogate_keys(), GLOBAL_NOTIFICATIONS_SURROGATE_KEY]
+
+    def get_validator_parts(self) -> list:
+        """Delivery options shown depend on the reader type."""
+        return [*super().get_validator_parts(), get_reader_type(self.request)]
+
+    def get_etag_parts(self) -> list:
+        return [self.get_record().version]
+
+    def get(self, request, *args, **kwargs):
+        response = super().get(request, *args, **kwargs)
+        response.add_post_render_callback(lambda response: self.prefetch_hierarchy())
+        return response
+
+    def prefetch_hierarchy(self):
+        """Warms the record cache with the records linked from the hierarchy
+        navigation, when enabled and worth it for the request."""
+
+        if should_prefetch_records(self.request.headers.get("User-Agent", "")):
+            prefetch_hierarchy(self.get_record())
 
     def get_template_names(self):
         """Determine template based on record type."""
@@ -128,13 +163,15 @@ class RecordDetailView(RecordContextMixin, TemplateView):
         context["analytics_data"] = data
 
 
-class RelatedRecordsView(RecordContextMixin, TemplateView):
+class RelatedRecordsView(RecordCacheControlMixin, RecordContextMixin, TemplateView):
     """View for rendering a record's related records page."""
 
     template_name = "records/related_records.html"
+    cache_control_policy = "record_related"
 
 
-class RecordsHelpView(RecordContextMixin, TemplateView):
+class RecordsHelpView(RecordCacheControlMixin, RecordContextMixin, TemplateView):
     """View for rendering help/guidance for users new to archives."""
 
     template_name = "records/new_to_archives.html"
+    cache_control_policy = "record_help"
@@ -3,6 +3,11 @@ from app.lib.exceptions import (
     MissingAPIAttributeError,
     NoResultsFound,
 )
+from app.lib.negative_cache import (
+    SEARCH_LOOKUP,
+    cache_negative,
+    raise_if_negative_cached,
+)
 
 from .buckets import CATALOGUE_BUCKETS
 from .models import APISearchResponse
@@ -25,12 +30,19 @@ def search_records(
     params: filter, aggregation, etc
     timeout: Request timeout in seconds
     The errors are handled by a custom middleware in the app.
+    Searches without results are cached briefly and raise NoResultsFound
+    again without calling the API.
     """
     uri = "search"
     params = _build_search_params(query, results_per_page, page, sort, params)
+    raise_if_negative_cached(SEARCH_LOOKUP, params)
 
     results = rosetta_request_handler(uri, params, timeout=timeout)
-    _validate_search_results(results, page)
+    try:
+        _validate_search_results(results, page)
+    except NoResultsFound as e:
+        cache_negative(SEARCH_LOOKUP, params, e)
+        raise
     return APISearchResponse(results)
 
 
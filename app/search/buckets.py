@@ -1,5 +1,5 @@
 import logging
-from dataclasses import dataclass, field
+from dataclasses import dataclass
 from enum import Enum, StrEnum
 
 from django.contrib.humanize.templatetags.humanize import intcomma
@@ -98,28 +98,38 @@ class Aggregation(MultiValueForAggregation):
         return None
 
 
-@dataclass
+@dataclass(frozen=True)
 class Bucket:
     """
     A structured model that holds information that is made available in the templates
     for the user to explore.
     Ex TNA-Records at the National Archives
+
+    Bucket configuration is shared across requests, per request display values
+    are held by BucketDisplay.
     """
 
     key: str
     label: str
     description: str
+
+    aggregations: tuple[str, ...] = ()
+
+
+@dataclass(slots=True)
+class BucketDisplay:
+    """Per request display values for a configured Bucket."""
+
+    bucket: Bucket
     href: str = "#"
     record_count: int = 0
     is_current: bool = False
 
-    aggregations: list[str] = field(default_factory=lambda: [])
-
     @property
     def label_with_count(self) -> str:
         if self.record_count is None:
-            return self.label
-        return self.label + f" ({intcomma(self.record_count)})"
+            return self.bucket.label
+        return self.bucket.label + f" ({intcomma(self.record_count)})"
 
     @property
     def item(self) -> dict[str, str | bool]:
@@ -143,9 +153,26 @@ class BucketKeys(StrEnum):
     NON_TNA = "nonTna"
 
 
-@dataclass
+@dataclass(slots=True)
+class BucketListDisplay:
+    """Per request display values for a BucketList."""
+
+    buckets: tuple[BucketDisplay, ...]
+
+    def __iter__(self):
+        yield from self.buckets
+
+    @property
+    def items(self):
+        """Returns list of bucket items t to be used by
+        front-end component Ex: tnaSecondaryNavigation()"""
+
+        return [bucket.item for bucket in self.buckets]
+
+
+@dataclass(frozen=True)
 class BucketList:
-    buckets: list[Bucket]
+    buckets: tuple[Bucket, ...]
 
     def __iter__(self):
         yield from self.buckets
@@ -156,50 +183,50 @@ class BucketList:
                 return bucket
         raise KeyError(f"Bucket matching the key '{key}' could not be found")
 
-    def update_buckets_for_display(
+    def for_display(
         self, query: str | None, buckets: dict, current_bucket_key: str | None
-    ):
-        """update buckets data used by bucket.item for the FE component"""
+    ) -> BucketListDisplay:
+        """Returns buckets data used by bucket.item for the FE component,
+        leaving the configured buckets unchanged."""
 
+        bucket_displays = []
         for bucket in self.buckets:
-            bucket.record_count = buckets.get(bucket.key, 0)
-            bucket.is_current = bucket.key == current_bucket_key
-            bucket.href = f"?group={bucket.key}"
+            href = f"?group={bucket.key}"
             if query:
-                bucket.href += f"&q={query}"
+                href += f"&q={query}"
+            bucket_displays.append(
+                BucketDisplay(
+                    bucket=bucket,
+                    href=href,
+                    record_count=buckets.get(bucket.key, 0),
+                    is_current=bucket.key == current_bucket_key,
+                )
+            )
+        return BucketListDisplay(tuple(bucket_displays))
 
     def as_choices(self) -> list[tuple[str, str]]:
         return [(bucket.key, bucket.label) for bucket in self.buckets]
 
-    @property
-    def items(self):
-        """Returns list of bucket items t to be used by
-        front-end component Ex: tnaSecondaryNavigation()"""
-
-        return [bucket.item for bucket in self.buckets]
-
 
 # Configure list of buckets to show in template, these values rarely change
 CATALOGUE_BUCKETS = BucketList(
-    [
+    (
         Bucket(
             key=BucketKeys.TNA.value,
             label="Records at the National Archives",
             description="Results for records held at The National Archives that match your search term.",
-            aggregations=[
+            aggregations=(
                 Aggregation.LEVEL.aggs,
                 Aggregation.COLLECTION.aggs,
                 Aggregation.CLOSURE.aggs,
                 Aggregation.SUBJECT.aggs,
-            ],
+            ),
         ),
         Bucket(
             key=BucketKeys.NON_TNA.value,
             label="Records at other UK archives",
             description="Results for records held at other archives in the UK (and not at The National Archives) that match your search term.",
-            aggregations=[
-                Aggregation.HELD_BY.aggs,
-            ],
+            aggregations=(Aggregation.HELD_BY.aggs,),
         ),
-    ]
+    )
 )
@@ -0,0 +1,78 @@
+"""Module for caching search results in the search app."""
+
+import hashlib
+import json
+import logging
+
+from django.core.cache import cache
+
+from .api import search_records
+from .constants import SEARCH_CACHE_KEY_PREFIX, SEARCH_CACHE_TIMEOUT
+from .models import APISearchResponse
+
+logger = logging.getLogger(__name__)
+
+
+def _canonical(value):
+    """Sorts list values so the same filters in any order share a key."""
+
+    if isinstance(value, dict):
+        return {key: _canonical(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return sorted(str(item) for item in value)
+    return value
+
+
+def search_cache_key(
+    query: str, results_per_page: int, page: int, sort: str, params: dict | None
+) -> str:
+    """Returns a cache key for a search page, from its canonical params."""
+
+    search = json.dumps(
+        {
+            "q": query or "",
+            "size": results_per_page,
+            "page": page,
+            "sort": sort or "",
+            "params": _canonical(params or {}),
+        },
+        sort_keys=True,
+    )
+    digest = hashlib.sha256(search.encode()).hexdigest()
+    return f"{SEARCH_CACHE_KEY_PREFIX}:{digest}"
+
+
+def get_cached_search_result(key: str) -> APISearchResponse | None:
+    return cache.get(key)
+
+
+def cache_search_result(key: str, api_result: APISearchResponse):
+    # the version is computed once and cached with the result, rather than
+    # for each response validated from the cache
+    _ = api_result.version
+    try:
+        cache.set(key, api_result, timeout=SEARCH_CACHE_TIMEOUT)
+    except Exception as e:
+        logger.error(f"Failed to cache search result: {e}")
+
+
+def cached_search_records(
+    query: str, results_per_page: int, page: int, sort: str, params: dict | None
+) -> APISearchResponse:
+    """Returns the search result from the cache, or calls the API and caches
+    the result."""
+
+    key = search_cache_key(query, results_per_page, page, sort, params)
+    if (api_result := get_cached_search_result(key)) is not None:
+        return api_result
+
+    # the search adds to params, keep the caller's params for its key
+    api_result = search_records(
+        query=query,
+        results_per_page=results_per_page,
+        page=page,
+        sort=sort,
+        params=dict(params or {}),
+    )
+    cache_search_result(key, api_result)
+    return api_result
@@ -4,6 +4,21 @@ RESULTS_PER_PAGE = 20  # max records to show per page
 LONG_FILTER_RESULTS_PER_PAGE = 0  # for long filter, skip pagination to get all options
 LONG_FILTER_SUBJECT_PARAMS = {"filter": ["group:tna"], "aggs": "longSubject"}
 PAGE_LIMIT = 500  # max page number that can be queried
+LONG_FILTER_CHOICES_PER_PAGE = 100  # max long filter choices to show per page
+LONG_FILTER_INDEX_CACHE_TIMEOUT = 60 * 15  # 15 minutes
+LONG_FILTER_INDEX_CACHE_KEY_PREFIX = "long_filter_index"
+SEARCH_CACHE_TIMEOUT = 60 * 5  # 5 minutes
+SEARCH_CACHE_KEY_PREFIX = "search_result"
+# pages within this many of PAGE_LIMIT are not prefetched
+SEARCH_PREFETCH_PAGE_LIMIT_MARGIN = 5
+SEARCH_SURROGATE_KEY = "search"  # purges search pages from shared caches
+SUGGESTIONS_LIMIT = 10  # max type-ahead suggestions returned for a query
+SUGGESTIONS_QUERY_MAX_LENGTH = 100
+SUGGESTIONS_CACHE_TIMEOUT = 60 * 60 * 24  # 1 day
+SUGGESTIONS_RETRY_TIMEOUT = 60  # seconds before fetching again after a failure
+SUGGESTION_SOURCES_API_TIMEOUT = 30  # seconds, long aggregations are slow
+SUGGESTION_SOURCES_CACHE_KEY = "SUGGESTION_SOURCES"
+SUGGESTION_SOURCES_VERSION_CACHE_KEY = "SUGGESTION_SOURCES_VERSION"
 FILTER_DATATYPE_RECORD = "datatype:record"  # filter for records in search results
 
 
@@ -39,6 +54,14 @@ class FieldsConstant:
     DISPLAY = "display"
 
 
+class LongFilterParams:
+    """Query string params to browse long filter choices."""
+
+    LETTER = "filter_letter"
+    PREFIX = "filter_prefix"
+    PAGE = "filter_page"
+
+
 FILTER_FIELDS = [
     FieldsConstant.ONLINE,
     FieldsConstant.LEVEL,
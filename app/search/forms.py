@@ -2,6 +2,7 @@ from app.lib.constants import DATE_YMD_SEPARATOR
 from app.lib.fields import (
     CharField,
     ChoiceField,
+    ChoiceIndex,
     DynamicMultipleChoiceField,
     FromDateField,
     ToDateField,
@@ -18,6 +19,10 @@ from .constants import (
     Sort,
 )
 
+# shared between forms, built once
+LEVEL_CHOICES = ChoiceIndex((m.level, m.level) for m in TnaLevels)
+COLLECTION_CHOICE_INDEX = ChoiceIndex(COLLECTION_CHOICES)
+
 
 class CatalogueSearchBaseForm(BaseForm):
     """This is Base form that corresponds to top level (UI) for catalogue search
@@ -120,14 +125,14 @@ class CatalogueSearchTnaForm(CatalogueSearchCommonForm):
             | {
                 FieldsConstant.LEVEL: DynamicMultipleChoiceField(
                     label="Filter by levels",
-                    choices=[(m.level, m.level) for m in TnaLevels],
+                    choices=LEVEL_CHOICES,
                     validate_input=True,  # validate input with choices before querying the API
                     active_filter_label="Level",
                     more_filter_choices_text="See more levels",
                 ),
                 FieldsConstant.COLLECTION: DynamicMultipleChoiceField(
                     label="Collections",
-                    choices=COLLECTION_CHOICES,
+                    choices=COLLECTION_CHOICE_INDEX,
                     validate_input=False,  # do not validate input COLLECTION_CHOICES fixed or dynamic
                     active_filter_label="Collection",
                     more_filter_choices_text="See more collections",
@@ -0,0 +1,170 @@
+"""Long filter choices indexed for browsing by first letter and prefix.
+
+A long aggregation (i.e. longSubject) can return thousands of entries, the
+index is built once from the API response, cached, and then sliced for each
+letter, prefix and page without calling the API again.
+"""
+
+import hashlib
+import json
+import logging
+import math
+import string
+import unicodedata
+from bisect import bisect_left
+
+from django.core.cache import cache
+
+from .constants import (
+    LONG_FILTER_CHOICES_PER_PAGE,
+    LONG_FILTER_INDEX_CACHE_KEY_PREFIX,
+    LONG_FILTER_INDEX_CACHE_TIMEOUT,
+)
+from .models import APISearchResponse
+
+logger = logging.getLogger(__name__)
+
+# letter for values not starting with A-Z, i.e. digits, punctuation
+OTHER_LETTER = "#"
+LETTERS = (*string.ascii_uppercase, OTHER_LETTER)
+
+# sorts after any character, used as the upper bound of a prefix range
+PREFIX_UPPER_BOUND = chr(0x10FFFF)
+
+
+def normalise_value(value: str) -> str:
+    """Returns value for case and accent insensitive matching.
+    Example: " Émigrés " -> "emigres"
+    """
+
+    decomposed = unicodedata.normalize("NFKD", str(value))
+    return (
+        "".join(char for char in decomposed if not unicodedata.combining(char))
+        .casefold()
+        .strip()
+    )
+
+
+def letter_for_value(normalised_value: str) -> str:
+    """Returns the letter a normalised value is listed under."""
+
+    first = normalised_value[:1].upper()
+    return first if first and first in string.ascii_uppercase else OTHER_LETTER
+
+
+class LongFilterIndex:
+    """Aggregation entries indexed by letter and by normalised prefix.
+
+    entries: in API order, most records first
+    letters: entries sorted by value, keyed by letter
+    """
+
+    __slots__ = ("entries", "letters", "_sorted_entries", "_sorted_keys", "_by_value")
+
+    def __init__(self, entries: list[dict]):
+        self.entries = tuple(entries)
+        keyed = sorted(
+            ((normalise_value(entry.get("value", "")), entry) for entry in entries),
+            key=lambda item: (item[0], item[1].get("value", "")),
+        )
+        self._sorted_keys = [key for key, _ in keyed]
+        self._sorted_entries = tuple(entry for _, entry in keyed)
+        self._by_value = {entry.get("value"): entry for entry in entries}
+
+        letters = {letter: [] for letter in LETTERS}
+        for key, entry in keyed:
+            letters[letter_for_value(key)].append(entry)
+        self.letters = {letter: tuple(items) for letter, items in letters.items()}
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def get(self, value: str) -> dict | None:
+        return self._by_value.get(value)
+
+    def for_letter(self, letter: str) -> tuple[dict, ...]:
+        return self.letters.get(letter, ())
+
+    def with_prefix(self, prefix: str) -> tuple[dict, ...]:
+        """Returns entries, sorted by value, whose normalised value starts with
+        the normalised prefix."""
+
+        prefix = normalise_value(prefix)
+        if not prefix:
+            return self._sorted_entries
+        start = bisect_left(self._sorted_keys, prefix)
+        end = bisect_left(self._sorted_keys, prefix + PREFIX_UPPER_BOUND, lo=start)
+        return self._sorted_entries[start:end]
+
+    def letter_counts(self) -> dict[str, int]:
+        return {letter: len(items) for letter, items in self.letters.items()}
+
+
+class LongFilterPage:
+    """A page of long filter choices for a letter or prefix, or for all entries."""
+
+    __slots__ = ("entries", "letter", "prefix", "page", "pages", "total")
+
+    def __init__(
+        self,
+        index: LongFilterIndex,
+        letter: str = "",
+        prefix: str = "",
+        page: int = 1,
+        per_page: int = LONG_FILTER_CHOICES_PER_PAGE,
+    ):
+        if prefix:
+            letter = ""
+            selection = index.with_prefix(prefix)
+        elif letter:
+            selection = index.for_letter(letter)
+        else:
+            selection = index.entries
+
+        self.letter = letter
+        self.prefix = prefix
+        self.page = page
+        self.total = len(selection)
+        self.pages = math.ceil(self.total / per_page)
+        start = (page - 1) * per_page
+        self.entries = selection[start : start + per_page]
+
+
+def long_filter_cache_key(query: str, sort: str, params: dict) -> str:
+    """Returns a cache key for the search that returned a long aggregation.
+
+    All params shaping the aggregation are included, so a key is shared for
+    a group with the same query and filters.
+    """
+
+    search = json.dumps({"q": query, "sort": sort, "params": params}, sort_keys=True)
+    digest = hashlib.sha256(search.encode()).hexdigest()
+    return f"{LONG_FILTER_INDEX_CACHE_KEY_PREFIX}:{digest}"
+
+
+def get_cached_long_filter(
+    key: str,
+) -> tuple[APISearchResponse, LongFilterIndex] | None:
+    return cache.get(key)
+
+
+def cache_long_filter(
+    key: str, api_result: APISearchResponse, aggregation_name: str
+) -> LongFilterIndex:
+    """Builds the index for the long aggregation in api_result and caches both
+    so letters, prefixes and pages are served without calling the API."""
+
+    entries = []
+    for aggregation in api_result.aggregations:
+        if aggregation.get("name") == aggregation_name:
+            entries = aggregation.get("entries", [])
+            break
+    index = LongFilterIndex(entries)
+    # the version is computed once and cached with the result, rather than
+    # for each response validated from the cache
+    _ = api_result.version
+    try:
+        cache.set(key, (api_result, index), timeout=LONG_FILTER_INDEX_CACHE_TIMEOUT)
+    except Exception as e:
+        logger.error(f"Failed to cache long filter {aggregation_name}: {e}")
+    return index
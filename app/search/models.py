@@ -4,7 +4,7 @@ from typing import Any
 
 from django.utils.functional import cached_property
 
-from app.records.models import APIResponse, Record
+from app.records.models import APIResponse, Record, RecordSummary
 
 
 class APISearchResponse(APIResponse):
@@ -19,6 +19,18 @@ class APISearchResponse(APIResponse):
             ]
         return records
 
+    @cached_property
+    def record_summaries(self) -> list[RecordSummary]:
+        """Returns compact records for listing search results."""
+        records = []
+        if "data" in self._raw:
+            records = [
+                RecordSummary.from_search_result(record["@template"]["details"])
+                for record in self._raw["data"]
+                if "@template" in record and "details" in record["@template"]
+            ]
+        return records
+
     @cached_property
     def buckets(self) -> dict:
         """
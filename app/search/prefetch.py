@@ -0,0 +1,57 @@
+"""Speculative prefetch of the next page of search results.
+
+After a page of results is rendered, the next page is searched in a
+background thread and stored in the search cache, so following the "next"
+link is answered from the cache.
+
+Prefetching is bounded by the prefetch budget shared by the process, see
+app.lib.prefetch.
+"""
+
+import logging
+from concurrent.futures import Future
+
+from django.conf import settings
+
+from app.lib.prefetch import is_bot, submit_prefetch
+
+from .cache import cached_search_records, get_cached_search_result, search_cache_key
+from .constants import PAGE_LIMIT, SEARCH_PREFETCH_PAGE_LIMIT_MARGIN
+
+logger = logging.getLogger(__name__)
+
+
+def should_prefetch(user_agent: str, next_page: int, pages: int) -> bool:
+    """Returns True when the next page is worth prefetching for the request."""
+
+    return (
+        settings.ENABLE_SEARCH_PREFETCH
+        and settings.ENABLE_SEARCH_CACHE
+        and next_page <= pages
+        and next_page <= PAGE_LIMIT - SEARCH_PREFETCH_PAGE_LIMIT_MARGIN
+        and not is_bot(user_agent)
+    )
+
+
+def prefetch_search_page(
+    query, results_per_page, page, sort, params: dict | None
+) -> Future | None:
+    """Searches a page in the background to warm the search cache.
+
+    Returns None when skipped: already cached or in flight, or the prefetch
+    budget is spent.
+    """
+
+    key = search_cache_key(query, results_per_page, page, sort, params)
+    if get_cached_search_result(key) is not None:
+        return None
+
+    return submit_prefetch(
+        key,
+        cached_search_records,
+        query=query,
+        results_per_page=results_per_page,
+        page=page,
+        sort=sort,
+        params=params,
+    )
@@ -0,0 +1,314 @@
+"""Type-ahead suggestions for subjects, collections and archives.
+
+Suggestions are answered from an in-process prefix index, keystrokes never
+call the API. The long aggregations the index is built from are fetched once
+and shared through the cache with a version, subjects are taken from the
+subjects cached for the subject picker. When the version changes each process
+rebuilds its index in a background thread and swaps it in with a single
+assignment, keystrokes meanwhile are answered from the current index, which
+is empty until the first build.
+"""
+
+import hashlib
+import heapq
+import json
+import logging
+import re
+import threading
+import time
+from bisect import bisect_left
+from collections import defaultdict
+from concurrent.futures import Future, ThreadPoolExecutor
+from urllib.parse import urlencode
+
+from django.core.cache import cache
+from django.urls import reverse
+
+from .api import search_records
+from .buckets import Aggregation, BucketKeys
+from .collection_names import COLLECTION_NAMES
+from .constants import (
+    FILTER_DATATYPE_RECORD,
+    LONG_FILTER_RESULTS_PER_PAGE,
+    SUGGESTION_SOURCES_API_TIMEOUT,
+    SUGGESTION_SOURCES_CACHE_KEY,
+    SUGGESTION_SOURCES_VERSION_CACHE_KEY,
+    SUGGESTIONS_CACHE_TIMEOUT,
+    SUGGESTIONS_LIMIT,
+    SUGGESTIONS_RETRY_TIMEOUT,
+    FieldsConstant,
+)
+from .long_filters import PREFIX_UPPER_BOUND, normalise_value
+
+logger = logging.getLogger(__name__)
+
+# long aggregation and group the suggestions for each filter field come from
+SUGGESTION_AGGREGATIONS = {
+    FieldsConstant.SUBJECT: (Aggregation.SUBJECT, BucketKeys.TNA),
+    FieldsConstant.COLLECTION: (Aggregation.COLLECTION, BucketKeys.TNA),
+    FieldsConstant.HELD_BY: (Aggregation.HELD_BY, BucketKeys.NON_TNA),
+}
+
+# prefixes up to this length match too many keys to rank per keystroke, their
+# top suggestions are ranked when the index is built
+RANKED_PREFIX_LENGTH = 2
+
+_WORD_START = re.compile(r"\b\w")
+
+
+class Suggestion:
+    """A filter value to search by, i.e. a subject."""
+
+    __slots__ = ("count", "field_name", "text", "value")
+
+    def __init__(self, field_name: str, value: str, text: str, count: int):
+        self.field_name = field_name
+        self.value = value
+        self.text = text
+        self.count = count
+
+    def keys(self) -> set[str]:
+        """Normalised text from the start of each word, so a query matches
+        the start of any word."""
+
+        normalised = normalise_value(self.text)
+        return {
+            normalised[match.start() :] for match in _WORD_START.finditer(normalised)
+        }
+
+    @property
+    def href(self) -> str:
+        """Search url filtered by the suggestion."""
+
+        group = SUGGESTION_AGGREGATIONS[self.field_name][1]
+        query_string = urlencode(
+            {FieldsConstant.GROUP: group.value, self.field_name: self.value}
+        )
+        return f"{reverse('search:catalogue')}?{query_string}"
+
+    def as_dict(self) -> dict:
+        return {
+            "text": self.text,
+            "value": self.value,
+            "type": self.field_name,
+            "count": self.count,
+            "href": self.href,
+        }
+
+
+class SuggestionIndex:
+    """Suggestions ranked by record count, searchable by word prefix.
+
+    Suggestions are stored in rank order, so a suggestion's position is its
+    rank and the best matches for a prefix are the lowest positions.
+    """
+
+    __slots__ = ("_keys", "_positions", "_ranked", "suggestions", "version")
+
+    def __init__(self, suggestions: list[Suggestion], version: str = ""):
+        self.version = version
+        self.suggestions = tuple(
+            sorted(
+                suggestions, key=lambda suggestion: (-suggestion.count, suggestion.text)
+            )
+        )
+        keyed = sorted(
+            (key, position)
+            for position, suggestion in enumerate(self.suggestions)
+            for key in suggestion.keys()
+        )
+        self._keys = [key for key, _ in keyed]
+        self._positions = [position for _, position in keyed]
+
+        matches = defaultdict(set)
+        for key, position in keyed:
+            for length in range(1, min(len(key), RANKED_PREFIX_LENGTH) + 1):
+                matches[key[:length]].add(position)
+        self._ranked = {
+            prefix: tuple(heapq.nsmallest(SUGGESTIONS_LIMIT, positions))
+            for prefix, positions in matches.items()
+        }
+
+    def __len__(self) -> int:
+        return len(self.suggestions)
+
+    def suggest(self, query: str, limit: int = SUGGESTIONS_LIMIT) -> list[Suggestion]:
+        """Returns the suggestions with most records having a word starting
+        with query."""
+
+        prefix = normalise_value(query)
+        if not prefix:
+            return []
+        if len(prefix) <= RANKED_PREFIX_LENGTH:
+            positions = self._ranked.get(prefix, ())[:limit]
+        else:
+            start = bisect_left(self._keys, prefix)
+            end = bisect_left(self._keys, prefix + PREFIX_UPPER_BOUND, lo=start)
+            positions = heapq.nsmallest(limit, set(self._positions[start:end]))
+        return [self.suggestions[position] for position in positions]
+
+
+def build_suggestion_index(sources: dict) -> SuggestionIndex:
+    """Builds the index from aggregation entries keyed by field name."""
+
+    suggestions = []
+    for field_name in (FieldsConstant.SUBJECT, FieldsConstant.HELD_BY):
+        suggestions.extend(
+            Suggestion(field_name, entry["value"], entry["value"], entry["doc_count"])
+            for entry in sources.get(field_name, [])
+        )
+
+    # all configured collections, whether or not they have records
+    collection_counts = {
+        entry["value"]: entry["doc_count"]
+        for entry in sources.get(FieldsConstant.COLLECTION, [])
+    }
+    for code in COLLECTION_NAMES.keys() | collection_counts.keys():
+        name = COLLECTION_NAMES.get(code)
+        suggestions.append(
+            Suggestion(
+                FieldsConstant.COLLECTION,
+                code,
+                f"{code} - {name}" if name else code,
+                collection_counts.get(code, 0),
+            )
+        )
+    return SuggestionIndex(suggestions, version=sources.get("version", ""))
+
+
+def fetch_subject_entries() -> list[dict]:
+    """Returns the longSubject aggregation entries cached for the subject
+    picker, fetching them when not cached."""
+
+    # imported here, app.main imports from the search app
+    from app.main.cache import get_subject_picker
+
+    picker = get_subject_picker(timeout=SUGGESTION_SOURCES_API_TIMEOUT)
+    if not picker["count"]:
+        raise ValueError("Subjects are not available")
+    return [
+        {"value": subject["name"], "doc_count": subject["count"]}
+        for letter in picker["letters"]
+        for subject in letter["subjects"]
+    ]
+
+
+def fetch_suggestion_sources() -> dict:
+    """Fetches the long aggregation entries for each suggestion field."""
+
+    sources = {}
+    for field_name, (aggregation, group) in SUGGESTION_AGGREGATIONS.items():
+        if field_name == FieldsConstant.SUBJECT:
+            sources[field_name] = fetch_subject_entries()
+            continue
+        filters = [f"group:{group.value}"]
+        if group == BucketKeys.NON_TNA:
+            filters.append(FILTER_DATATYPE_RECORD)
+        api_result = search_records(
+            query="",
+            results_per_page=LONG_FILTER_RESULTS_PER_PAGE,
+            params={"filter": filters, "aggs": aggregation.long_aggs},
+            timeout=SUGGESTION_SOURCES_API_TIMEOUT,
+        )
+        sources[field_name] = [
+            {"value": entry["value"], "doc_count": entry.get("doc_count", 0)}
+            for api_aggregation in api_result.aggregations
+            if api_aggregation.get("name") == aggregation.long_aggs
+            for entry in api_aggregation.get("entries", [])
+        ]
+    sources["version"] = hashlib.sha256(
+        json.dumps(sources, sort_keys=True).encode()
+    ).hexdigest()
+    return sources
+
+
+def refresh_suggestion_sources() -> dict | None:
+    """Fetches and caches the suggestion sources, returns None on failure."""
+
+    try:
+        sources = fetch_suggestion_sources()
+    except Exception as e:
+        logger.error(f"Failed to fetch suggestion sources: {e}")
+        return None
+    cache.set(SUGGESTION_SOURCES_CACHE_KEY, sources, timeout=SUGGESTIONS_CACHE_TIMEOUT)
+    cache.set(
+        SUGGESTION_SOURCES_VERSION_CACHE_KEY,
+        sources["version"],
+        timeout=SUGGESTIONS_CACHE_TIMEOUT,
+    )
+    return sources
+
+
+_index = SuggestionIndex([])
+_lock = threading.Lock()
+_executor: ThreadPoolExecutor | None = None
+_refreshing: Future | None = None
+_retry_after = 0.0
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    global _executor
+    if _executor is None:
+        with _lock:
+            if _executor is None:
+                _executor = ThreadPoolExecutor(
+                    max_workers=1, thread_name_prefix="suggestions"
+                )
+    return _executor
+
+
+def refresh_suggestion_index() -> SuggestionIndex:
+    """Rebuilds the index for the cached sources version, fetching the
+    sources when they are not cached. Called in the background.
+
+    While the sources cannot be fetched the previous index is kept.
+    """
+
+    global _index, _retry_after
+
+    version = cache.get(SUGGESTION_SOURCES_VERSION_CACHE_KEY)
+    if version == _index.version and _index:
+        return _index
+
+    sources = cache.get(SUGGESTION_SOURCES_CACHE_KEY) if version else None
+    if sources is None or sources.get("version") != version:
+        if time.monotonic() < _retry_after:
+            return _index
+        sources = refresh_suggestion_sources()
+        if sources is None:
+            _retry_after = time.monotonic() + SUGGESTIONS_RETRY_TIMEOUT
+            return _index
+
+    # a single assignment, requests read either the old or the new index
+    _index = build_suggestion_index(sources)
+    return _index
+
+
+def refresh_suggestion_index_in_background() -> Future | None:
+    """Rebuilds the index in the background, unless a rebuild is already
+    running. Returns None when the executor has shut down."""
+
+    global _refreshing
+
+    executor = _get_executor()
+    with _lock:
+        if _refreshing is None or _refreshing.done():
+            try:
+                _refreshing = executor.submit(refresh_suggestion_index)
+            except RuntimeError:
+                # executor shut down
+                return None
+        return _refreshing
+
+
+def get_suggestion_index() -> SuggestionIndex:
+    """Returns the current index, starting a rebuild in the background when
+    the cached sources version has changed.
+
+    Only the small version value is read from the cache for each request.
+    """
+
+    index = _index
+    if cache.get(SUGGESTION_SOURCES_VERSION_CACHE_KEY) != index.version or not index:
+        refresh_suggestion_index_in_background()
+    return index
@@ -4,4 +4,9 @@ from app.search import views
 
 urlpatterns = [
     path("search/", views.CatalogueSearchView.as_view(), name="catalogue"),
+    path(
+        "search/suggestions/",
+        views.SuggestionsView.as_view(),
+        name="suggestions",
+    ),
 ]
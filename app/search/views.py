@@ -1,13 +1,15 @@
-import copy
 import logging
 import math
 from typing import Any
 
+from django.conf import settings
 from django.core.exceptions import SuspiciousOperation
-from django.http import HttpRequest, HttpResponse, QueryDict
-from django.views.generic import TemplateView
+from django.http import HttpRequest, HttpResponse, JsonResponse, QueryDict
+from django.views.generic import TemplateView, View
 
 from app.errors import views as errors_view
+from app.lib.cache_control import CacheControlMixin
+from app.lib.conditional_get import ConditionalGetMixin
 from app.lib.constants import DATE_YMD_SEPARATOR
 from app.lib.exceptions import NoResultsFound
 from app.lib.fields import (
@@ -20,7 +22,7 @@ from app.lib.fields import (
 )
 from app.lib.pagination import pagination_object
 from app.main.cache import fetch_global_notifications
-from app.records.constants import TnaLevels
+from app.main.constants import GLOBAL_NOTIFICATIONS_SURROGATE_KEY
 from app.search.api import search_records
 from config.utils.query_string import qs_remove_value, qs_replace_value, qs_toggle_value
 
@@ -29,8 +31,9 @@ from .buckets import (
     Aggregation,
     Bucket,
     BucketKeys,
-    BucketList,
+    BucketListDisplay,
 )
+from .cache import cached_search_records
 from .constants import (
     DATE_DISPLAY_FORMAT,
     FILTER_DATATYPE_RECORD,
@@ -38,7 +41,10 @@ from .constants import (
     LONG_FILTER_RESULTS_PER_PAGE,
     PAGE_LIMIT,
     RESULTS_PER_PAGE,
+    SEARCH_SURROGATE_KEY,
+    SUGGESTIONS_QUERY_MAX_LENGTH,
     Display,
+    LongFilterParams,
     Sort,
 )
 from .forms import (
@@ -47,8 +53,18 @@ from .forms import (
     CatalogueSearchTnaForm,
     FieldsConstant,
 )
+from .long_filters import (
+    LETTERS,
+    LongFilterIndex,
+    LongFilterPage,
+    cache_long_filter,
+    get_cached_long_filter,
+    long_filter_cache_key,
+)
 from .mixins import SearchDataLayerMixin
 from .models import APISearchResponse
+from .prefetch import prefetch_search_page, should_prefetch
+from .suggestions import get_suggestion_index
 from .utils import camelcase_to_underscore, underscore_to_camelcase
 
 logger = logging.getLogger(__name__)
@@ -62,6 +78,15 @@ class APIMixin:
     """A mixin to get the api result, processes api result, sets the context."""
 
     def get_api_result(self, query, results_per_page, page, sort, params):
+        # pages of results, long filter searches have no results per page
+        if settings.ENABLE_SEARCH_CACHE and results_per_page:
+            return cached_search_records(
+                query=query,
+                results_per_page=results_per_page,
+                page=page,
+                sort=sort,
+                params=params,
+            )
         api_result = search_records(
             query=query,
             results_per_page=results_per_page,
@@ -97,7 +122,7 @@ class APIMixin:
             params.update({"aggs": filter_list_value})
         else:
             # aggs for current bucket
-            params.update({"aggs": current_bucket.aggregations})
+            params.update({"aggs": list(current_bucket.aggregations)})
 
         # date related filters
         add_filter(params, self._get_date_api_params(form))
@@ -183,7 +208,7 @@ class APIMixin:
 
             if field_name in form.fields:
                 if isinstance(form.fields[field_name], DynamicMultipleChoiceField):
-                    choice_api_data = aggregation.get("entries", ())
+                    choice_api_data = self.get_choice_api_data(field_name, aggregation)
                     self.replace_api_data(field_name, choice_api_data)
                     form.fields[field_name].update_choices(
                         choice_api_data, form.fields[field_name].value
@@ -191,6 +216,13 @@ class APIMixin:
 
                     self._build_more_filter_options(form, field_name, aggregation)
 
+    def get_choice_api_data(
+        self, field_name: str, aggregation: dict
+    ) -> list[dict[str, str | int]]:
+        """Returns the aggregation entries to build the field's choices from."""
+
+        return aggregation.get("entries", ())
+
     def _get_field_name_from_api_aggregation(self, aggregation: dict) -> str:
         """Get field name from aggregation name, considering long filters.
         Examples:
@@ -264,7 +296,7 @@ class APIMixin:
         results = None
         stats = {"total": None, "results": None}
         if self.api_result:
-            results = self.api_result.records
+            results = self.api_result.record_summaries
             stats = {
                 "total": self.api_result.stats_total,
                 "results": self.api_result.stats_results,
@@ -293,8 +325,12 @@ class CatalogueSearchFormMixin(APIMixin, TemplateView):
         super().setup(request, *args, **kwargs)
         self.form_kwargs = self.get_form_kwargs()
 
-        self.bucket_list: BucketList = copy.deepcopy(CATALOGUE_BUCKETS)
+        # display values for the shared CATALOGUE_BUCKETS, set before rendering
+        self.bucket_list: BucketListDisplay | None = None
         self.api_result = None
+        # long filter choices browsed by letter, prefix and page
+        self.long_filter_index: LongFilterIndex | None = None
+        self.long_filter_page: LongFilterPage | None = None
 
         # validate group param first to create appropriate form
         if self.form_kwargs.get("data").get("group") not in [
@@ -390,7 +426,7 @@ class CatalogueSearchFormMixin(APIMixin, TemplateView):
             if self.form.is_valid():
                 self.query = self.form.fields[FieldsConstant.Q].cleaned
                 self.sort = self.form.fields[FieldsConstant.SORT].cleaned
-                self.current_bucket = self.bucket_list.get_bucket(
+                self.current_bucket = CATALOGUE_BUCKETS.get_bucket(
                     self.form.fields[FieldsConstant.GROUP].cleaned
                 )
                 # if filter_list is set, use the filter_list template
@@ -418,30 +454,127 @@ class CatalogueSearchFormMixin(APIMixin, TemplateView):
             raise PageNotFound
         return page
 
+    @property
+    def long_filter_letter(self) -> str:
+        letter = self.request.GET.get(LongFilterParams.LETTER, "").upper()
+        return letter if letter in LETTERS else ""
+
+    @property
+    def long_filter_prefix(self) -> str:
+        return self.request.GET.get(LongFilterParams.PREFIX, "").strip()
+
+    @property
+    def long_filter_page_number(self) -> int:
+        try:
+            page = int(self.request.GET.get(LongFilterParams.PAGE, 1))
+            if page < 1:
+                raise ValueError
+        except ValueError:
+            raise PageNotFound
+        return page
+
     def form_valid(self):
         """Gets the api result and processes it after the form and fields
         are cleaned and validated. Renders with form, context."""
 
+        params = self.get_api_params(self.form, self.current_bucket)
         if self.is_filter_list_applied(self.form):
-            results_per_page = LONG_FILTER_RESULTS_PER_PAGE
+            self.api_result = self.get_long_filter_api_result(params)
         else:
-            results_per_page = RESULTS_PER_PAGE
-
-        self.api_result = self.get_api_result(
-            query=self.query,
-            results_per_page=results_per_page,
-            page=self.page,
-            sort=self.sort,
-            params=self.get_api_params(self.form, self.current_bucket),
-        )
+            self.api_result = self.get_api_result(
+                query=self.query,
+                results_per_page=RESULTS_PER_PAGE,
+                page=self.page,
+                sort=self.sort,
+                params=params,
+            )
         self.process_api_result(self.form, self.api_result)
         context = self.get_context_data(form=self.form)
-        return self.render_to_response(context=context)
+        response = self.render_to_response(context=context)
+        if not self.is_filter_list_applied(self.form):
+            response.add_post_render_callback(
+                lambda response: self.prefetch_next_page(params)
+            )
+        return response
+
+    def prefetch_next_page(self, params: dict):
+        """Warms the search cache with the page after the rendered page, when
+        enabled and worth it for the request."""
+
+        next_page = self.page + 1
+        pages = min(
+            math.ceil(self.api_result.stats_total / RESULTS_PER_PAGE), PAGE_LIMIT
+        )
+        if should_prefetch(
+            self.request.headers.get("User-Agent", ""), next_page, pages
+        ):
+            prefetch_search_page(
+                query=self.query,
+                results_per_page=RESULTS_PER_PAGE,
+                page=next_page,
+                sort=self.sort,
+                params=params,
+            )
+
+    def get_long_filter_api_result(self, params: dict) -> APISearchResponse:
+        """Returns the api result for the long filter, from the cache when the
+        same search was made before, and sets the page of choices to show."""
+
+        filter_list_value = self.form.fields[FieldsConstant.FILTER_LIST].cleaned
+        # long filter results are cached with their index, key before the
+        # api call, which adds to params
+        cache_key = long_filter_cache_key(self.query, self.sort, params)
+        if cached := get_cached_long_filter(cache_key):
+            api_result, self.long_filter_index = cached
+        else:
+            api_result = self.get_api_result(
+                query=self.query,
+                results_per_page=LONG_FILTER_RESULTS_PER_PAGE,
+                page=self.page,
+                sort=self.sort,
+                params=params,
+            )
+            self.long_filter_index = cache_long_filter(
+                cache_key, api_result, filter_list_value
+            )
+
+        self.long_filter_page = LongFilterPage(
+            self.long_filter_index,
+            letter=self.long_filter_letter,
+            prefix=self.long_filter_prefix,
+            page=self.long_filter_page_number,
+        )
+        if self.long_filter_page.page > max(self.long_filter_page.pages, 1):
+            raise PageNotFound
+        return api_result
+
+    def get_choice_api_data(
+        self, field_name: str, aggregation: dict
+    ) -> list[dict[str, str | int]]:
+        """For the long filter, returns the current page of choices, preceded
+        by selected choices from other pages so they remain selected."""
+
+        entries = super().get_choice_api_data(field_name, aggregation)
+        if (
+            not self.long_filter_page
+            or aggregation.get("name")
+            != self.form.fields[FieldsConstant.FILTER_LIST].cleaned
+        ):
+            return entries
+
+        page_entries = self.long_filter_page.entries
+        page_values = {entry.get("value") for entry in page_entries}
+        selected_entries = [
+            entry
+            for value in self.form.fields[field_name].value
+            if value not in page_values and (entry := self.long_filter_index.get(value))
+        ]
+        return [*selected_entries, *page_entries]
 
     def form_invalid(self):
         """Renders invalid form, context."""
         # keep current bucket in focus
-        self.bucket_list.update_buckets_for_display(
+        self.bucket_list = CATALOGUE_BUCKETS.for_display(
             query="",
             buckets={},
             current_bucket_key=self.current_bucket_key,
@@ -457,7 +590,7 @@ class CatalogueSearchFormMixin(APIMixin, TemplateView):
         if self.api_result and self.api_result.stats_total > 0:
             results_range, pagination = self.paginate_api_result()
         if self.api_result:
-            self.bucket_list.update_buckets_for_display(
+            self.bucket_list = CATALOGUE_BUCKETS.for_display(
                 query=self.query,
                 buckets=self.api_result.buckets,
                 current_bucket_key=self.current_bucket_key,
@@ -491,7 +624,12 @@ class CatalogueSearchFormMixin(APIMixin, TemplateView):
         return (results_range, pagination)
 
 
-class CatalogueSearchView(SearchDataLayerMixin, CatalogueSearchFormMixin):
+class CatalogueSearchView(
+    CacheControlMixin,
+    ConditionalGetMixin,
+    SearchDataLayerMixin,
+    CatalogueSearchFormMixin,
+):
     # templates for the view
     templates = {
         "default": "search/catalogue.html",
@@ -501,6 +639,20 @@ class CatalogueSearchView(SearchDataLayerMixin, CatalogueSearchFormMixin):
     # list of selected filters for display and removal links
     selected_filters = []
 
+    def get_cache_control_policy(self) -> str:
+        if self.request.GET.get(FieldsConstant.FILTER_LIST):
+            return "filter_list"
+        return "search"
+
+    def get_surrogate_keys(self) -> list[str]:
+        return [SEARCH_SURROGATE_KEY, GLOBAL_NOTIFICATIONS_SURROGATE_KEY]
+
+    def get_etag_parts(self) -> list | None:
+        """Invalid searches are not validated."""
+        if not self.api_result:
+            return None
+        return [self.api_result.version]
+
     def get_datalayer_data(self, request):
         """Assigns datalayer values specific to catalogue search pages."""
 
@@ -598,12 +750,15 @@ class CatalogueSearchView(SearchDataLayerMixin, CatalogueSearchFormMixin):
 
         filter_context = {}
         if self.is_filter_list_applied(self.form):
+            search_args = self._remove_long_filter_browse_params(self.request.GET)
             cancel_and_return_to_search = (
-                f"?{qs_remove_value(self.request.GET, FieldsConstant.FILTER_LIST)}"
+                f"?{qs_remove_value(search_args, FieldsConstant.FILTER_LIST)}"
             )
             filter_context["mfc_cancel_and_return_to_search_url"] = (
                 cancel_and_return_to_search
             )
+            if self.long_filter_page:
+                filter_context["mfc_navigation"] = self._get_long_filter_navigation()
 
             # get field name from filter_list value
             filter_list_value = self.form.fields[FieldsConstant.FILTER_LIST].cleaned
@@ -616,6 +771,61 @@ class CatalogueSearchView(SearchDataLayerMixin, CatalogueSearchFormMixin):
                 filter_context["aggregation"] = Aggregation
         return filter_context
 
+    def _remove_long_filter_browse_params(self, existing_qs: QueryDict) -> QueryDict:
+        """Returns a copy of existing_qs without the letter, prefix and page
+        params used to browse long filter choices."""
+
+        qs = existing_qs.copy()
+        for param in (
+            LongFilterParams.LETTER,
+            LongFilterParams.PREFIX,
+            LongFilterParams.PAGE,
+        ):
+            qs.pop(param, None)
+        return qs
+
+    def _get_long_filter_navigation(self) -> dict:
+        """Returns links to browse long filter choices by letter and page, and
+        params to keep when filtering the choices by prefix.
+
+        Letters without choices have no href."""
+
+        browse_args = self._remove_long_filter_browse_params(self.request.GET)
+        long_filter_page = self.long_filter_page
+        letters = [
+            {
+                "text": letter,
+                "href": (
+                    f"?{qs_replace_value(browse_args, LongFilterParams.LETTER, letter)}"
+                    if count
+                    else ""
+                ),
+                "current": letter == long_filter_page.letter,
+            }
+            for letter, count in self.long_filter_index.letter_counts().items()
+        ]
+        return {
+            "all": {
+                "href": f"?{browse_args.urlencode()}",
+                "current": not (long_filter_page.letter or long_filter_page.prefix),
+            },
+            "letters": letters,
+            "prefix": long_filter_page.prefix,
+            "prefix_param": LongFilterParams.PREFIX,
+            "hidden_params": [
+                (name, value)
+                for name, values in browse_args.lists()
+                for value in values
+            ],
+            "total": long_filter_page.total,
+            "pagination": pagination_object(
+                long_filter_page.page,
+                long_filter_page.pages,
+                self.request.GET,
+                page_param=LongFilterParams.PAGE,
+            ),
+        }
+
     def build_selected_filters_list(self):
         """Builds a list of selected filters for display and removal links."""
 
@@ -672,12 +882,7 @@ class CatalogueSearchView(SearchDataLayerMixin, CatalogueSearchFormMixin):
         for field_name in self.form.fields:
             if isinstance(self.form.fields[field_name], DynamicMultipleChoiceField):
                 field = self.form.fields[field_name]
-                if field_name == FieldsConstant.LEVEL:
-                    choice_labels = {m.level: m.level for m in TnaLevels}
-                else:
-                    choice_labels = self.form.fields[
-                        field_name
-                    ].configured_choice_labels
+                choice_labels = field.configured_choice_labels
 
                 for item in field.value:
                     existing_filters.append(
@@ -909,3 +1114,19 @@ class CatalogueSearchView(SearchDataLayerMixin, CatalogueSearchFormMixin):
         if self.form.fields[FieldsConstant.HELD_BY].items:
             # visible if items set (with api agg values or input values)
             self.form.fields[FieldsConstant.HELD_BY].is_visible = True
+
+
+class SuggestionsView(View):
+    """Type-ahead suggestions for subjects, collections and archives as JSON,
+    answered from the suggestion index without calling the API."""
+
+    def get(self, request, *args, **kwargs) -> JsonResponse:
+        query = request.GET.get(FieldsConstant.Q, "").strip()
+        query = query[:SUGGESTIONS_QUERY_MAX_LENGTH]
+        suggestions = get_suggestion_index().suggest(query) if query else []
+        return JsonResponse(
+            {
+                "q": query,
+                "suggestions": [suggestion.as_dict() for suggestion in suggestions],
+            }
+        )
@@ -28,6 +28,7 @@ INSTALLED_APPS = [
 
 MIDDLEWARE = [
     "app.errors.middleware.CustomExceptionMiddleware",
+    "app.lib.middleware.RequestDeadlineMiddleware",
     "django.middleware.security.SecurityMiddleware",
     "whitenoise.middleware.WhiteNoiseMiddleware",
     "django.contrib.sessions.middleware.SessionMiddleware",
@@ -196,15 +197,75 @@ ROSETTA_API_URL: str = os.getenv("ROSETTA_API_URL", "")
 DELIVERY_OPTIONS_API_URL: str = os.getenv("DELIVERY_OPTIONS_API_URL", "")
 WAGTAIL_API_URL: str = os.getenv("WAGTAIL_API_URL", "")
 WAGTAIL_API_KEY: str = os.getenv("WAGTAIL_API_KEY", "")
+# Shared secret Wagtail sends to invalidate cached content on publish, the
+# webhook is disabled when empty
+WAGTAIL_WEBHOOK_SECRET: str = os.getenv("WAGTAIL_WEBHOOK_SECRET", "")
 
 # API timeouts
 ROSETTA_ENRICHMENT_API_TIMEOUT: int = get_int_env("ROSETTA_ENRICHMENT_API_TIMEOUT", 5)
 WAGTAIL_API_TIMEOUT: int = get_int_env("WAGTAIL_API_TIMEOUT", 5)
 DELIVERY_OPTIONS_API_TIMEOUT: int = get_int_env("DELIVERY_OPTIONS_API_TIMEOUT", 5)
 
+# How long Wagtail content is cached (seconds), can be hours when the
+# WAGTAIL_WEBHOOK_SECRET webhook invalidates it on publish
+WAGTAIL_API_CACHE_TIMEOUT: int = get_int_env("WAGTAIL_API_CACHE_TIMEOUT", 60 * 15)
+
 # API behaviour
+# JSON decoder for API responses: "orjson", "stdlib", or "auto" for orjson when
+# it is installed
+JSON_DECODER: str = os.environ.get("JSON_DECODER", "auto")
+# Largest API response read (decoded bytes), larger responses are rejected
+# before they are decoded as JSON. 0 for no limit
+API_MAX_RESPONSE_SIZE: int = get_int_env("API_MAX_RESPONSE_SIZE", 20 * 1024 * 1024)
+# Seconds a request can spend calling APIs, each call's timeout is capped at
+# the time remaining. 0 for no deadline
+REQUEST_DEADLINE: int = get_int_env("REQUEST_DEADLINE", 0)
+# Fail fast while an API is failing, instead of waiting for its timeout
+ENABLE_CIRCUIT_BREAKER: bool = get_bool_env("ENABLE_CIRCUIT_BREAKER", False)
+# Consecutive failures opening the circuit for an API
+CIRCUIT_BREAKER_THRESHOLD: int = get_int_env("CIRCUIT_BREAKER_THRESHOLD", 5)
+# Seconds before an open circuit allows a trial call
+CIRCUIT_BREAKER_RESET_TIMEOUT: int = get_int_env("CIRCUIT_BREAKER_RESET_TIMEOUT", 30)
+# Repeat a slow Rosetta get or search, using whichever answers first
+ENABLE_ROSETTA_HEDGING: bool = get_bool_env("ENABLE_ROSETTA_HEDGING", False)
+# Latency percentile a call is repeated after
+ROSETTA_HEDGE_PERCENTILE: int = get_int_env("ROSETTA_HEDGE_PERCENTILE", 95)
+# Most calls repeated, as a percentage of all calls
+ROSETTA_HEDGE_MAX_PERCENT: int = get_int_env("ROSETTA_HEDGE_MAX_PERCENT", 5)
 ENABLE_PARALLEL_API_CALLS: bool = get_bool_env("ENABLE_PARALLEL_API_CALLS", False)
+# Sample related records from candidates cached per subject and per series
+ENABLE_RELATED_RECORD_POOLS: bool = get_bool_env("ENABLE_RELATED_RECORD_POOLS", False)
+# Seconds before cached related records candidates are refreshed
+RELATED_RECORD_POOL_REFRESH: int = get_int_env("RELATED_RECORD_POOL_REFRESH", 60 * 60)
 ENRICHMENT_TIMING_ENABLED: bool = get_bool_env("ENRICHMENT_TIMING_ENABLED", False)
+# Warm the search results cache for the next page of results
+ENABLE_SEARCH_PREFETCH: bool = get_bool_env("ENABLE_SEARCH_PREFETCH", False)
+# Cache pages of search results, on by default with the search prefetch
+ENABLE_SEARCH_CACHE: bool = get_bool_env("ENABLE_SEARCH_CACHE", ENABLE_SEARCH_PREFETCH)
+# Cache records and warm the cache for the next, previous and parent records
+ENABLE_RECORD_PREFETCH: bool = get_bool_env("ENABLE_RECORD_PREFETCH", False)
+# Maximum prefetches, of search pages and records, in flight across all
+# requests in a process
+SEARCH_PREFETCH_MAX_IN_FLIGHT: int = get_int_env("SEARCH_PREFETCH_MAX_IN_FLIGHT", 4)
+# Cache the ETag and Last-Modified of record and search pages, so conditional
+# requests for unchanged pages are answered without an API call
+ENABLE_CONDITIONAL_GET_CACHE: bool = get_bool_env("ENABLE_CONDITIONAL_GET_CACHE", False)
+# How long missing records and searches without results are cached (seconds),
+# 0 to disable
+NEGATIVE_CACHE_TIMEOUT: int = get_int_env("NEGATIVE_CACHE_TIMEOUT", 60)
+
+# Cache-Control header for each view, for browsers and shared caches (CDN).
+# Unset or empty sends no Cache-Control header, shared caching is opt-in.
+# Record details are always private, their delivery options depend on the
+# reader's IP address
+CACHE_CONTROL: dict[str, str] = {
+    "record_detail": os.environ.get("CACHE_CONTROL_RECORD_DETAIL", ""),
+    "record_related": os.environ.get("CACHE_CONTROL_RECORD_RELATED", ""),
+    "record_help": os.environ.get("CACHE_CONTROL_RECORD_HELP", ""),
+    "search": os.environ.get("CACHE_CONTROL_SEARCH", ""),
+    "filter_list": os.environ.get("CACHE_CONTROL_FILTER_LIST", ""),
+    "catalogue_landing": os.environ.get("CACHE_CONTROL_CATALOGUE_LANDING", ""),
+}
 
 # Maximum number of subject/article_tags returned from Wagtail
 MAX_SUBJECTS_PER_RECORD: int = get_int_env("MAX_SUBJECTS_PER_RECORD", 20)
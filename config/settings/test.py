@@ -40,3 +40,10 @@ ENABLE_PARALLEL_API_CALLS = True
 MAX_SUBJECTS_PER_RECORD = 20
 
 FEATURE_ENABLE_HELD_BY_DISCOVERY: bool = False
+ENABLE_SEARCH_PREFETCH = False
+ENABLE_SEARCH_CACHE = False
+ENABLE_RECORD_PREFETCH = False
+NEGATIVE_CACHE_TIMEOUT = 0
+ENABLE_CONDITIONAL_GET_CACHE = False
+ENABLE_CIRCUIT_BREAKER = False
+ENABLE_ROSETTA_HEDGING = False
@@ -0,0 +1,27 @@
+from django.test import SimpleTestCase
+
+from app.benchmarks.json_decoding import (
+    RESPONSE_JSON,
+    benchmark_json_decoding,
+    default_payloads,
+)
+from app.lib.json_decoder import DECODERS
+
+
+class TestBenchmarkJSONDecoding(SimpleTestCase):
+    def test_reports_each_decoder_for_each_payload(self):
+        results = benchmark_json_decoding(
+            payloads=default_payloads(results=5, entries=50),
+            iterations=2,
+            warmup=0,
+        )
+
+        self.assertEqual(
+            [name.split(" ")[0] for name in results],
+            ["get", "search", "search:longCollection", "search:longSubject"],
+        )
+        for profiler in results.values():
+            stages = {row["stage"]: row for row in profiler.report()}
+            self.assertEqual(list(stages), [RESPONSE_JSON, *DECODERS])
+            for row in stages.values():
+                self.assertEqual(row["calls"], 2)
@@ -0,0 +1,72 @@
+from http import HTTPStatus
+from urllib.error import HTTPError
+from urllib.request import urlopen
+
+from django.test import SimpleTestCase
+
+from app.benchmarks.loadtest import run_load_test
+from app.benchmarks.stubs import (
+    UpstreamProfile,
+    WireMockMapping,
+    stub_upstreams,
+)
+
+
+class TestWireMockMapping(SimpleTestCase):
+    def test_url_pattern_matches_full_url(self):
+        mapping = WireMockMapping.from_dict(
+            {
+                "request": {"method": "GET", "urlPattern": "/rosetta/data?.*iaid=C1.*"},
+                "response": {"status": 200, "body": "[]"},
+            }
+        )
+
+        self.assertTrue(mapping.matches("GET", "/rosetta/data/?iaid=C123"))
+        self.assertFalse(mapping.matches("GET", "/other/?iaid=C123"))
+        self.assertFalse(mapping.matches("POST", "/rosetta/data/?iaid=C123"))
+
+    def test_url_path_ignores_query_string(self):
+        mapping = WireMockMapping.from_dict(
+            {
+                "request": {"method": "GET", "urlPath": "/article_tags/"},
+                "response": {"status": 200, "jsonBody": {"items": []}},
+            }
+        )
+
+        self.assertTrue(mapping.matches("GET", "/article_tags/?tags=army"))
+        self.assertEqual(mapping.response.body, b'{"items": []}')
+
+
+class TestStubUpstreams(SimpleTestCase):
+    def test_serves_rosetta_and_wiremock_mappings(self):
+        with stub_upstreams() as upstreams:
+            with urlopen(f"{upstreams.settings['ROSETTA_API_URL']}/get?id=C1") as r:
+                self.assertEqual(r.status, HTTPStatus.OK)
+            with urlopen(f"{upstreams.wagtail.base_url}/globals/notifications/") as r:
+                self.assertEqual(r.status, HTTPStatus.OK)
+
+            self.assertEqual(upstreams.rosetta.calls, 1)
+            self.assertEqual(upstreams.wagtail.calls, 1)
+
+    def test_injected_error_rate(self):
+        with stub_upstreams({"rosetta": UpstreamProfile(error_rate=1)}) as upstreams:
+            with self.assertRaises(HTTPError):
+                urlopen(f"{upstreams.settings['ROSETTA_API_URL']}/get?id=C1")
+
+            self.assertEqual(upstreams.rosetta.errors, 1)
+
+
+class TestRunLoadTest(SimpleTestCase):
+    def test_reports_throughput_latency_and_amplification(self):
+        result = run_load_test(rps=20, duration=0.5, warmup=1, seed=1)
+        report = result.report()
+
+        self.assertEqual(report["requests"], 10)
+        self.assertEqual(report["statuses"], {HTTPStatus.OK: 10})
+        self.assertGreater(report["throughput_rps"], 0)
+        self.assertGreater(report["latency"]["p99_ms"], 0)
+        self.assertGreaterEqual(report["amplification"]["rosetta"], 1)
+        self.assertEqual(
+            report["amplification"]["total"],
+            sum(report["upstream_calls"].values()) / report["requests"],
+        )
@@ -0,0 +1,38 @@
+from django.test import SimpleTestCase
+
+from app.benchmarks.footprint import measure_footprint
+from app.benchmarks.memory import profile_requests
+
+
+class TestProfileRequests(SimpleTestCase):
+    def test_measures_peak_and_retained_memory_per_kind(self):
+        results = profile_requests(kinds=["record", "search"], iterations=2, warmup=1)
+
+        self.assertEqual([result.kind for result in results], ["record", "search"])
+        for result in results:
+            report = result.as_dict()
+            self.assertEqual(report["iterations"], 2)
+            self.assertGreater(report["max_peak_kib"], 0)
+            self.assertLessEqual(report["mean_peak_kib"], report["max_peak_kib"])
+
+    def test_flags_request_kind_over_budget(self):
+        # the budgets themselves depend on the interpreter and dependencies,
+        # they are checked by the memoryprofile command
+        (result,) = profile_requests(
+            kinds=["record"], iterations=1, warmup=1, budgets={"record": 1}
+        )
+
+        self.assertTrue(result.over_budget)
+        self.assertEqual(result.as_dict()["budget_kib"], 1)
+
+        result.budget_kib = result.max_peak_kib
+        self.assertFalse(result.over_budget)
+
+
+class TestMeasureFootprint(SimpleTestCase):
+    def test_measures_target_in_subprocess(self):
+        (result,) = measure_footprint(["department_details"])
+
+        self.assertEqual(result["target"], "department_details")
+        self.assertGreater(result["retained_kib"], 0)
+        self.assertGreaterEqual(result["peak_kib"], result["retained_kib"])
@@ -0,0 +1,88 @@
+import tracemalloc
+
+from django.test import SimpleTestCase
+
+from app.benchmarks.payloads import long_filter_payload, search_payload
+from app.benchmarks.profiler import StageProfiler
+from app.benchmarks.search import benchmark_search, default_scenarios
+from app.search.buckets import Aggregation
+
+
+class TestCannedPayloads(SimpleTestCase):
+    def test_search_payload_has_results_and_aggregations(self):
+        payload = search_payload(results=20)
+
+        self.assertEqual(len(payload["data"]), 20)
+        self.assertEqual(
+            [aggregation["name"] for aggregation in payload["aggregations"]],
+            ["level", "collection", "closure", "subject"],
+        )
+
+    def test_long_filter_payload_has_requested_unique_entries(self):
+        payload = long_filter_payload(Aggregation.SUBJECT, entries=3000)
+        values = [entry["value"] for entry in payload["aggregations"][0]["entries"]]
+
+        self.assertEqual(payload["aggregations"][0]["name"], "longSubject")
+        self.assertEqual(len(values), 3000)
+        self.assertEqual(len(set(values)), 3000)
+
+
+class TestBenchmarkSearch(SimpleTestCase):
+    def test_reports_each_stage_for_each_scenario(self):
+        results = benchmark_search(
+            scenarios=default_scenarios(results=5, entries=50),
+            iterations=1,
+            warmup=0,
+        )
+
+        self.assertEqual(
+            list(results),
+            ["search", "filter_list:longCollection", "filter_list:longSubject"],
+        )
+        for profiler in results.values():
+            stages = {row["stage"]: row for row in profiler.report()}
+            for stage in (
+                "setup (form building)",
+                "validate_suspicious_operation",
+                "get_api_params",
+                "process_api_result",
+                "update_choices",
+                "build_selected_filters_list",
+                "_set_filters_visible_attr",
+                "render",
+                "total",
+            ):
+                self.assertIn(stage, stages)
+            self.assertEqual(stages["total"]["calls"], 1)
+            self.assertGreater(stages["render"]["mean_ms"], 0)
+            self.assertGreater(stages["total"]["max_peak_kib"], 0)
+
+    def test_timing_only_pass_records_no_allocations(self):
+        results = benchmark_search(
+            scenarios=default_scenarios(results=1, entries=10)[:1],
+            iterations=1,
+            warmup=0,
+            trace_memory=False,
+        )
+
+        total = {row["stage"]: row for row in results["search"].report()}["total"]
+        self.assertEqual(total["mean_allocated_kib"], 0)
+
+
+class TestStageProfiler(SimpleTestCase):
+    def test_nested_stage_keeps_enclosing_peak(self):
+        profiler = StageProfiler(trace_memory=True)
+
+        tracemalloc.start()
+        try:
+            with profiler.stage("total"):
+                data = bytearray(1024 * 1024)
+                del data
+                with profiler.stage("nested"):
+                    pass
+        finally:
+            tracemalloc.stop()
+
+        stages = {row["stage"]: row for row in profiler.report()}
+        self.assertGreaterEqual(stages["total"]["max_peak_kib"], 1024)
+        self.assertLess(stages["nested"]["max_peak_kib"], 1024)
@@ -1,16 +1,21 @@
 import unittest
-from unittest.mock import MagicMock, patch
+from unittest.mock import patch
 
 from django.conf import settings
+from urllib3.util.request import ACCEPT_ENCODING
 
 from app.lib.api import JSONAPIClient
 from app.lib.exceptions import APIResourceNotFound
+from test.utils import json_response
 
 
 class DeliveryOptionsApiClientTests(unittest.TestCase):
     def setUp(self):
         self.api_client = JSONAPIClient(settings.DELIVERY_OPTIONS_API_URL)
-        self.headers = {"Cache-Control": "no-cache"}
+        self.headers = {
+            "Cache-Control": "no-cache",
+            "Accept-Encoding": ACCEPT_ENCODING,
+        }
 
     def tearDown(self):
         self.api_client.params.clear()
@@ -19,10 +24,7 @@ class DeliveryOptionsApiClientTests(unittest.TestCase):
     @patch("app.lib.api.get")  # Patch the correct path where requests.get is used
     def test_get_results_success(self, mock_get):
         # Mock response setup
-        mock_response = MagicMock()
-        mock_response.json.return_value = {"delivery_options": ["abc", "def"]}
-        mock_response.status_code = 200
-        mock_get.return_value = mock_response
+        mock_get.return_value = json_response({"delivery_options": ["abc", "def"]})
 
         # Add parameter before calling get_results()
         self.api_client.add_parameter("iaid", "C12345")
@@ -36,6 +38,7 @@ class DeliveryOptionsApiClientTests(unittest.TestCase):
             params={"iaid": "C12345"},
             headers=self.headers,
             timeout=None,
+            stream=True,
         )
 
         # Check the returned data
@@ -44,10 +47,9 @@ class DeliveryOptionsApiClientTests(unittest.TestCase):
     @patch("app.lib.api.get")
     def test_get_results_without_iaid(self, mock_get):
         # Mock API response when no IAID is passed
-        mock_response = MagicMock()
-        mock_response.json.return_value = {"error": "Missing IAID"}
-        mock_response.status_code = 404
-        mock_get.return_value = mock_response
+        mock_get.return_value = json_response(
+            {"error": "Missing IAID"}, status_code=404
+        )
 
         # self.api_client = DeliveryOptionsAPI()
 
@@ -63,18 +65,18 @@ class DeliveryOptionsApiClientTests(unittest.TestCase):
             params={},
             headers=self.headers,
             timeout=None,
+            stream=True,
         )
 
     @patch("app.lib.api.get")
     def test_get_results_multiple_parameters(self, mock_get):
         # Mock response for multiple parameters
-        mock_response = MagicMock()
-        mock_response.json.return_value = {
-            "status": "success",
-            "filters": ["option1", "option2"],
-        }
-        mock_response.status_code = 200
-        mock_get.return_value = mock_response
+        mock_get.return_value = json_response(
+            {
+                "status": "success",
+                "filters": ["option1", "option2"],
+            }
+        )
 
         # The API actually doesn't care about unknown parameters!
         self.api_client.add_parameter("iaid", "C67890")
@@ -87,6 +89,7 @@ class DeliveryOptionsApiClientTests(unittest.TestCase):
             params={"iaid": "C67890", "category": "books"},
             headers=self.headers,
             timeout=None,
+            stream=True,
         )
 
         self.assertEqual(
@@ -7,6 +7,7 @@ from app.deliveryoptions.api import delivery_options_request_handler
 from app.deliveryoptions.constants import AvailabilityCondition, Reader
 from app.deliveryoptions.delivery_options import construct_delivery_options
 from app.records.models import Record
+from test.utils import json_response
 
 
 class DeliveryOptionsIntegrationTestCase(unittest.TestCase):
@@ -35,19 +36,18 @@ class DeliveryOptionsIntegrationTestCase(unittest.TestCase):
     def test_delivery_options_request_handler(self, mock_get):
         """Test the API request handler that fetches delivery options data."""
         # Create a mock response object
-        mock_response = MagicMock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = [
-            {
-                "options": AvailabilityCondition.DigitizedDiscovery,
-                "surrogateLinks": [
-                    {
-                        "xReferenceURL": '<a href="https://test.nationalarchives.gov.uk/document/TEST123">View document</a>'
-                    }
-                ],
-            }
-        ]
-        mock_get.return_value = mock_response
+        mock_get.return_value = json_response(
+            [
+                {
+                    "options": AvailabilityCondition.DigitizedDiscovery,
+                    "surrogateLinks": [
+                        {
+                            "xReferenceURL": '<a href="https://test.nationalarchives.gov.uk/document/TEST123">View document</a>'
+                        }
+                    ],
+                }
+            ]
+        )
 
         # Call the function under test
         api_result = delivery_options_request_handler(self.record.id)
@@ -178,10 +178,7 @@ class DeliveryOptionsAdditionalTests(unittest.TestCase):
     def test_empty_api_response(self, mock_get):
         """Test handling of an empty API response."""
         # Setup mock response with an empty list
-        mock_response = MagicMock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = []
-        mock_get.return_value = mock_response
+        mock_get.return_value = json_response([])
 
         # Instead of expecting ValueError
         with self.assertRaises(Exception) as context:
@@ -200,10 +197,7 @@ class DeliveryOptionsAdditionalTests(unittest.TestCase):
     def test_malformed_api_response(self, mock_get):
         """Test handling of an API response with missing required keys."""
         # Setup mock response with malformed data
-        mock_response = MagicMock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = [{"invalid_key": "value"}]
-        mock_get.return_value = mock_response
+        mock_get.return_value = json_response([{"invalid_key": "value"}])
 
         # Instead of expecting ValueError
         with self.assertRaises(Exception) as context:
@@ -0,0 +1,211 @@
+from http import HTTPStatus
+from unittest.mock import patch
+
+import responses
+from django.conf import settings
+from django.core.cache import cache
+from django.test import SimpleTestCase, TestCase, override_settings
+
+from app.deliveryoptions.constants import Reader
+from app.lib.cache_control import series_surrogate_key, surrogate_key
+from app.main.cache import build_subject_picker
+from app.main.constants import GLOBAL_NOTIFICATIONS_CACHE_KEY
+
+CACHE_CONTROL = {
+    "record_detail": "public, max-age=60, s-maxage=300",
+    "record_related": "public, max-age=300, s-maxage=3600",
+    "record_help": "public, max-age=300, s-maxage=3600",
+    "search": "public, max-age=60, s-maxage=120",
+    "filter_list": "public, max-age=60, s-maxage=300",
+    "catalogue_landing": "",
+}
+
+
+def record_response() -> dict:
+    return {
+        "data": [
+            {
+                "@template": {
+                    "details": {
+                        "id": "C123456",
+                        "title": "Test Title",
+                        "source": "CAT",
+                        "groupArray": [{"value": "tna"}],
+                        "@hierarchy": [
+                            {
+                                "@admin": {"id": "C14303"},
+                                "identifier": [{"reference_number": "WO 95"}],
+                                "level": {"code": 3},
+                            }
+                        ],
+                    }
+                }
+            }
+        ]
+    }
+
+
+def search_response() -> dict:
+    return {
+        "data": [],
+        "aggregations": [],
+        "buckets": [{"name": "group", "entries": [{"value": "tna", "count": 0}]}],
+        "stats": {"total": 0, "results": 0},
+    }
+
+
+class SurrogateKeyTests(SimpleTestCase):
+    def test_surrogate_key(self):
+        for parts, expected in (
+            (("record", "C123456"), "record-C123456"),
+            (("series", "WO 95"), "series-WO_95"),
+            (("series", " ADM  1 "), "series-ADM_1"),
+        ):
+            with self.subTest(parts=parts):
+                self.assertEqual(surrogate_key(*parts), expected)
+
+
+@override_settings(CACHE_CONTROL=CACHE_CONTROL)
+class RecordViewsCacheControlTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        cache.set(
+            GLOBAL_NOTIFICATIONS_CACHE_KEY,
+            {"global_alert": None, "mourning_notice": None},
+        )
+
+    def tearDown(self):
+        cache.clear()
+
+    @responses.activate
+    def test_cache_headers(self):
+        responses.add(
+            responses.GET,
+            f"{settings.ROSETTA_API_URL}/get",
+            json=record_response(),
+        )
+
+        for url, cache_control, surrogate_keys in (
+            (
+                "/catalogue/id/C123456/",
+                "max-age=60, s-maxage=300, private",
+                "record-C123456 series-WO_95 global-notifications",
+            ),
+            (
+                "/catalogue/id/C123456/related/",
+                "public, max-age=300, s-maxage=3600",
+                "record-C123456 series-WO_95",
+            ),
+            (
+                "/catalogue/id/C123456/help/",
+                "public, max-age=300, s-maxage=3600",
+                "record-C123456 series-WO_95",
+            ),
+        ):
+            with self.subTest(url=url):
+                response = self.client.get(url)
+                self.assertEqual(response.status_code, HTTPStatus.OK)
+                self.assertEqual(response["Cache-Control"], cache_control)
+                self.assertEqual(response["Surrogate-Key"], surrogate_keys)
+                self.assertIn("Cookie", response["Vary"])
+
+    @responses.activate
+    def test_record_detail_private_for_all_readers(self):
+        responses.add(
+            responses.GET,
+            f"{settings.ROSETTA_API_URL}/get",
+            json=record_response(),
+        )
+
+        for reader in (Reader.OFFSITE, Reader.ONSITEPUBLIC, Reader.STAFFIN):
+            with self.subTest(reader=reader):
+                with patch("app.records.views.get_reader_type", return_value=reader):
+                    response = self.client.get("/catalogue/id/C123456/")
+
+                self.assertEqual(
+                    response["Cache-Control"], "max-age=60, s-maxage=300, private"
+                )
+
+    @responses.activate
+    def test_not_modified_keeps_cache_control(self):
+        responses.add(
+            responses.GET,
+            f"{settings.ROSETTA_API_URL}/get",
+            json=record_response(),
+        )
+        etag = self.client.get("/catalogue/id/C123456/")["ETag"]
+
+        response = self.client.get("/catalogue/id/C123456/", HTTP_IF_NONE_MATCH=etag)
+
+        self.assertEqual(response.status_code, HTTPStatus.NOT_MODIFIED)
+        self.assertEqual(response["Cache-Control"], "max-age=60, s-maxage=300, private")
+        # the record is fetched for the ETag, so its series is known
+        self.assertEqual(
+            response["Surrogate-Key"],
+            "record-C123456 series-WO_95 global-notifications",
+        )
+
+    @responses.activate
+    def test_no_cache_headers_for_errors(self):
+        responses.add(
+            responses.GET,
+            f"{settings.ROSETTA_API_URL}/get",
+            status=HTTPStatus.NOT_FOUND,
+        )
+
+        response = self.client.get("/catalogue/id/C123456/")
+
+        self.assertEqual(response.status_code, HTTPStatus.NOT_FOUND)
+        self.assertNotIn("Surrogate-Key", response)
+
+    def test_series_surrogate_key(self):
+        self.assertEqual(series_surrogate_key("WO 95"), "series-WO_95")
+
+
+@override_settings(CACHE_CONTROL=CACHE_CONTROL)
+class SearchAndCatalogueViewsCacheControlTests(TestCase):
+    def setUp(self):
+        cache.clear()
+
+    def tearDown(self):
+        cache.clear()
+
+    @responses.activate
+    def test_search_cache_headers(self):
+        responses.add(
+            responses.GET,
+            f"{settings.ROSETTA_API_URL}/search",
+            json=search_response(),
+        )
+
+        for url, cache_control in (
+            ("/catalogue/search/?q=army", "public, max-age=60, s-maxage=120"),
+            (
+                "/catalogue/search/?filter_list=longCollection",
+                "public, max-age=60, s-maxage=300",
+            ),
+        ):
+            with self.subTest(url=url):
+                response = self.client.get(url)
+                self.assertEqual(response.status_code, HTTPStatus.OK)
+                self.assertEqual(response["Cache-Control"], cache_control)
+                self.assertEqual(
+                    response["Surrogate-Key"], "search global-notifications"
+                )
+
+    @patch(
+        "app.main.views.get_subject_picker",
+        side_effect=lambda: build_subject_picker([]),
+    )
+    @patch("app.main.views.fetch_global_notifications", return_value=None)
+    @patch("app.main.views.get_explore_the_collection", return_value={})
+    def test_catalogue_landing_without_cache_control(self, *mocks):
+        response = self.client.get("/catalogue/")
+
+        self.assertEqual(response.status_code, HTTPStatus.OK)
+        # empty policy
+        self.assertNotIn("Cache-Control", response)
+        self.assertEqual(
+            response["Surrogate-Key"],
+            "catalogue-landing global-notifications subjects",
+        )
@@ -0,0 +1,204 @@
+import time
+from http import HTTPStatus
+from unittest.mock import patch
+
+import responses
+from django.conf import settings
+from django.test import SimpleTestCase, override_settings
+
+from app.lib import circuit_breaker
+from app.lib.api import JSONAPIClient
+from app.lib.circuit_breaker import (
+    CLOSED,
+    HALF_OPEN,
+    OPEN,
+    CircuitBreaker,
+    get_circuit_breaker,
+    is_circuit_open,
+)
+from app.lib.exceptions import (
+    APICircuitOpenError,
+    APIConnectionError,
+    APINonJSONResponseError,
+    APIRequestFailedError,
+    APIResourceNotFound,
+)
+from app.records.enrichment import RecordEnrichmentHelper
+from app.records.models import Record
+
+
+class CircuitBreakerTests(SimpleTestCase):
+    def setUp(self):
+        self.breaker = CircuitBreaker("api", failure_threshold=2, reset_timeout=30)
+
+    def test_opens_after_consecutive_failures(self):
+        self.breaker.record_failure()
+        self.breaker.record_success()
+        self.breaker.record_failure()
+        self.assertEqual(self.breaker.state, CLOSED)
+        self.assertTrue(self.breaker.allow_request())
+
+        self.breaker.record_failure()
+
+        self.assertEqual(self.breaker.state, OPEN)
+        self.assertTrue(self.breaker.is_open)
+        self.assertFalse(self.breaker.allow_request())
+
+    @patch("app.lib.circuit_breaker.time.monotonic")
+    def test_half_open_trial(self, mock_monotonic):
+        mock_monotonic.return_value = 100.0
+        self.breaker.record_failure()
+        self.breaker.record_failure()
+
+        mock_monotonic.return_value = 130.0
+        # a single trial call
+        self.assertTrue(self.breaker.allow_request())
+        self.assertEqual(self.breaker.state, HALF_OPEN)
+        self.assertFalse(self.breaker.allow_request())
+
+        # the trial failed, open for another cool-down
+        self.breaker.record_failure()
+        self.assertEqual(self.breaker.state, OPEN)
+        mock_monotonic.return_value = 159.0
+        self.assertFalse(self.breaker.allow_request())
+
+        mock_monotonic.return_value = 160.0
+        self.assertTrue(self.breaker.allow_request())
+        self.breaker.record_success()
+        self.assertEqual(self.breaker.state, CLOSED)
+        self.assertFalse(self.breaker.is_open)
+        self.assertTrue(self.breaker.allow_request())
+
+
+@override_settings(
+    ENABLE_CIRCUIT_BREAKER=True,
+    CIRCUIT_BREAKER_THRESHOLD=2,
+    CIRCUIT_BREAKER_RESET_TIMEOUT=30,
+)
+class JSONAPIClientCircuitBreakerTests(SimpleTestCase):
+    api_url = "https://api.test/data"
+
+    def setUp(self):
+        circuit_breaker._breakers.clear()
+
+    def tearDown(self):
+        circuit_breaker._breakers.clear()
+
+    @responses.activate
+    def test_fails_fast_while_open(self):
+        responses.add(
+            responses.GET,
+            f"{self.api_url}/get",
+            status=HTTPStatus.SERVICE_UNAVAILABLE,
+        )
+        client = JSONAPIClient(self.api_url)
+
+        for _ in range(2):
+            with self.assertRaises(APIRequestFailedError):
+                client.get("get")
+
+        self.assertTrue(is_circuit_open(self.api_url))
+        with self.assertRaises(APICircuitOpenError):
+            client.get("get")
+        self.assertEqual(len(responses.calls), 2)
+        # other APIs are unaffected
+        self.assertFalse(is_circuit_open("https://other.test"))
+
+    @responses.activate
+    def test_client_errors_are_not_failures(self):
+        responses.add(
+            responses.GET,
+            f"{self.api_url}/get",
+            status=HTTPStatus.NOT_FOUND,
+        )
+        client = JSONAPIClient(self.api_url)
+
+        for _ in range(3):
+            with self.assertRaises(APIResourceNotFound):
+                client.get("get")
+
+        self.assertEqual(get_circuit_breaker(self.api_url).state, CLOSED)
+
+    @responses.activate
+    def test_connection_errors_are_failures(self):
+        client = JSONAPIClient(self.api_url)
+
+        for _ in range(2):
+            with self.assertRaises(APIConnectionError):
+                client.get("get")
+
+        self.assertEqual(get_circuit_breaker(self.api_url).state, OPEN)
+
+    @responses.activate
+    def test_unreadable_responses_are_failures(self):
+        responses.add(responses.GET, f"{self.api_url}/get", body="<html>")
+        client = JSONAPIClient(self.api_url)
+
+        for _ in range(2):
+            with self.assertRaises(APINonJSONResponseError):
+                client.get("get")
+
+        self.assertEqual(get_circuit_breaker(self.api_url).state, OPEN)
+
+    @override_settings(ENABLE_CIRCUIT_BREAKER=False)
+    def test_disabled(self):
+        self.assertIsNone(get_circuit_breaker(self.api_url))
+        self.assertFalse(is_circuit_open(self.api_url))
+
+
+@override_settings(ENABLE_CIRCUIT_BREAKER=True, ENABLE_PARALLEL_API_CALLS=False)
+class EnrichmentCircuitBreakerTests(SimpleTestCase):
+    def setUp(self):
+        circuit_breaker._breakers.clear()
+        for api_url in (settings.WAGTAIL_API_URL, settings.DELIVERY_OPTIONS_API_URL):
+            breaker = get_circuit_breaker(api_url)
+            breaker.state = OPEN
+            breaker.opened_at = float("inf")
+
+    def tearDown(self):
+        circuit_breaker._breakers.clear()
+
+    @responses.activate
+    @patch("app.records.enrichment.get_tna_related_records_by_subjects")
+    @patch("app.records.enrichment.get_related_records_by_series")
+    def test_optional_enrichment_skipped(self, mock_series, mock_subjects):
+        mock_subjects.return_value = []
+        mock_series.return_value = []
+        record = Record(
+            {
+                "id": "C123456",
+                "subjects": ["Army"],
+                "groupArray": [{"value": "tna"}],
+                "level": {"code": 7},
+            }
+        )
+
+        results = RecordEnrichmentHelper(record).fetch_all()
+
+        self.assertEqual(results["subjects_enrichment"], {})
+        self.assertEqual(results["delivery_options"], {})
+        # Rosetta is available
+        mock_subjects.assert_called_once()
+        self.assertEqual(len(responses.calls), 0)
+
+
+@override_settings(DEBUG=False, ENABLE_CIRCUIT_BREAKER=True)
+class CircuitOpenResponseTests(SimpleTestCase):
+    def setUp(self):
+        circuit_breaker._breakers.clear()
+        breaker = get_circuit_breaker(settings.ROSETTA_API_URL)
+        breaker.state = OPEN
+        breaker.opened_at = time.monotonic()
+
+    def tearDown(self):
+        circuit_breaker._breakers.clear()
+
+    @responses.activate
+    def test_service_unavailable_while_open(self):
+        response = self.client.get("/catalogue/id/C123456/")
+
+        self.assertEqual(response.status_code, HTTPStatus.SERVICE_UNAVAILABLE)
+        self.assertLessEqual(
+            int(response["Retry-After"]), settings.CIRCUIT_BREAKER_RESET_TIMEOUT
+        )
+        self.assertEqual(len(responses.calls), 0)
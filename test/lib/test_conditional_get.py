@@ -0,0 +1,279 @@
+from http import HTTPStatus
+from unittest.mock import patch
+
+import responses
+from django.conf import settings
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+
+from app.main.constants import GLOBAL_NOTIFICATIONS_CACHE_KEY
+
+
+def record_response(title: str = "Test Title") -> dict:
+    return {
+        "data": [
+            {
+                "@template": {
+                    "details": {
+                        "id": "C123456",
+                        "title": title,
+                        "source": "CAT",
+                    }
+                }
+            }
+        ]
+    }
+
+
+def search_response(total: int = 100) -> dict:
+    return {
+        "data": [
+            {
+                "@template": {
+                    "details": {
+                        "id": "C123456",
+                        "source": "CAT",
+                    }
+                }
+            }
+        ],
+        "aggregations": [],
+        "buckets": [
+            {
+                "name": "group",
+                "entries": [
+                    {"value": "tna", "count": total},
+                ],
+            }
+        ],
+        "stats": {
+            "total": total,
+            "results": 20,
+        },
+    }
+
+
+def rosetta_calls(path: str) -> list:
+    return [
+        call
+        for call in responses.calls
+        if call.request.url.startswith(f"{settings.ROSETTA_API_URL}{path}")
+    ]
+
+
+class RecordDetailViewConditionalGetTests(TestCase):
+    url = "/catalogue/id/C123456/"
+
+    def setUp(self):
+        self.expire_validators()
+
+    def tearDown(self):
+        cache.clear()
+
+    def expire_validators(self):
+        cache.clear()
+        cache.set(
+            GLOBAL_NOTIFICATIONS_CACHE_KEY,
+            {"global_alert": None, "mourning_notice": None},
+        )
+
+    def add_record_response(self, title: str = "Test Title"):
+        responses.add(
+            responses.GET,
+            f"{settings.ROSETTA_API_URL}/get",
+            json=record_response(title),
+        )
+
+    @responses.activate
+    @override_settings(ENABLE_CONDITIONAL_GET_CACHE=True)
+    def test_validators_set(self):
+        self.add_record_response()
+
+        response = self.client.get(self.url)
+
+        self.assertEqual(response.status_code, HTTPStatus.OK)
+        self.assertRegex(response["ETag"], r'^"[0-9a-f]{64}"$')
+        self.assertIn("GMT", response["Last-Modified"])
+        # unchanged for the same record
+        self.assertEqual(self.client.get(self.url)["ETag"], response["ETag"])
+        self.assertEqual(
+            self.client.get(self.url)["Last-Modified"], response["Last-Modified"]
+        )
+
+    @responses.activate
+    @override_settings(ENABLE_CONDITIONAL_GET_CACHE=True)
+    def test_not_modified_before_api_call(self):
+        self.add_record_response()
+        etag = self.client.get(self.url)["ETag"]
+        self.assertEqual(len(rosetta_calls("/get")), 1)
+
+        response = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+
+        self.assertEqual(response.status_code, HTTPStatus.NOT_MODIFIED)
+        self.assertEqual(response["ETag"], etag)
+        self.assertEqual(response.content, b"")
+        self.assertEqual(len(rosetta_calls("/get")), 1)
+
+    @responses.activate
+    def test_not_modified_before_enrichment(self):
+        self.add_record_response()
+        etag = self.client.get(self.url)["ETag"]
+
+        with patch("app.records.views.RecordEnrichmentHelper") as mock_enrichment:
+            response = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+
+        self.assertEqual(response.status_code, HTTPStatus.NOT_MODIFIED)
+        self.assertEqual(response["ETag"], etag)
+        mock_enrichment.assert_not_called()
+        self.assertEqual(len(rosetta_calls("/get")), 2)
+
+    @responses.activate
+    def test_validators_not_cached_by_default(self):
+        self.add_record_response()
+
+        with patch("app.lib.conditional_get.cache") as mock_cache:
+            response = self.client.get(self.url)
+
+        self.assertIn("ETag", response)
+        self.assertNotIn("Last-Modified", response)
+        mock_cache.get.assert_not_called()
+        mock_cache.set.assert_not_called()
+
+    @responses.activate
+    @override_settings(ENABLE_CONDITIONAL_GET_CACHE=True)
+    def test_validator_parts_computed_once(self):
+        self.add_record_response()
+
+        with patch(
+            "app.lib.conditional_get.global_notifications_version", return_value=""
+        ) as mock_version:
+            # checked against the cache and before and after the view
+            response = self.client.get(self.url, HTTP_IF_NONE_MATCH='"stale"')
+
+        self.assertEqual(response.status_code, HTTPStatus.OK)
+        mock_version.assert_called_once()
+
+    @responses.activate
+    def test_modified_when_record_changes(self):
+        self.add_record_response()
+        etag = self.client.get(self.url)["ETag"]
+        self.expire_validators()
+        responses.reset()
+        self.add_record_response(title="Changed Title")
+
+        response = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+
+        self.assertEqual(response.status_code, HTTPStatus.OK)
+        self.assertNotEqual(response["ETag"], etag)
+        self.assertContains(response, "Changed Title")
+
+    @responses.activate
+    def test_etag_varies_by_request_state(self):
+        self.add_record_response()
+        etag = self.client.get(self.url)["ETag"]
+
+        with self.subTest("build version"):
+            with override_settings(BUILD_VERSION="v2"):
+                self.assertNotEqual(self.client.get(self.url)["ETag"], etag)
+
+        with self.subTest("cookies"):
+            self.client.cookies["theme"] = "dark"
+            self.assertNotEqual(self.client.get(self.url)["ETag"], etag)
+            del self.client.cookies["theme"]
+
+        with self.subTest("notifications"):
+            cache.set(
+                GLOBAL_NOTIFICATIONS_CACHE_KEY,
+                {"global_alert": {"title": "Alert"}, "mourning_notice": None},
+            )
+            response = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+            self.assertEqual(response.status_code, HTTPStatus.OK)
+            self.assertNotEqual(response["ETag"], etag)
+
+    @responses.activate
+    def test_no_validators_for_errors(self):
+        responses.add(
+            responses.GET,
+            f"{settings.ROSETTA_API_URL}/get",
+            status=HTTPStatus.NOT_FOUND,
+        )
+
+        response = self.client.get(self.url)
+
+        self.assertEqual(response.status_code, HTTPStatus.NOT_FOUND)
+        self.assertNotIn("ETag", response)
+
+
+class CatalogueSearchViewConditionalGetTests(TestCase):
+    def setUp(self):
+        cache.clear()
+
+    def tearDown(self):
+        cache.clear()
+
+    @responses.activate
+    @override_settings(ENABLE_CONDITIONAL_GET_CACHE=True)
+    def test_not_modified(self):
+        responses.add(
+            responses.GET,
+            f"{settings.ROSETTA_API_URL}/search",
+            json=search_response(),
+        )
+        response = self.client.get("/catalogue/search/?q=army&group=tna")
+        etag = response["ETag"]
+
+        # the same query in any order
+        response = self.client.get(
+            "/catalogue/search/?group=tna&q=army", HTTP_IF_NONE_MATCH=etag
+        )
+
+        self.assertEqual(response.status_code, HTTPStatus.NOT_MODIFIED)
+        self.assertEqual(len(rosetta_calls("/search")), 1)
+
+        response = self.client.get(
+            "/catalogue/search/?q=navy&group=tna", HTTP_IF_NONE_MATCH=etag
+        )
+
+        self.assertEqual(response.status_code, HTTPStatus.OK)
+        self.assertNotEqual(response["ETag"], etag)
+
+    @responses.activate
+    def test_not_modified_without_validators_cache(self):
+        responses.add(
+            responses.GET,
+            f"{settings.ROSETTA_API_URL}/search",
+            json=search_response(),
+        )
+        etag = self.client.get("/catalogue/search/?q=army")["ETag"]
+
+        response = self.client.get("/catalogue/search/?q=army", HTTP_IF_NONE_MATCH=etag)
+
+        # after the search, before the page renders
+        self.assertEqual(response.status_code, HTTPStatus.NOT_MODIFIED)
+        self.assertEqual(len(rosetta_calls("/search")), 2)
+
+    @responses.activate
+    def test_modified_when_results_change(self):
+        responses.add(
+            responses.GET,
+            f"{settings.ROSETTA_API_URL}/search",
+            json=search_response(),
+        )
+        etag = self.client.get("/catalogue/search/?q=army")["ETag"]
+        cache.clear()
+        responses.reset()
+        responses.add(
+            responses.GET,
+            f"{settings.ROSETTA_API_URL}/search",
+            json=search_response(total=101),
+        )
+
+        response = self.client.get("/catalogue/search/?q=army", HTTP_IF_NONE_MATCH=etag)
+
+        self.assertEqual(response.status_code, HTTPStatus.OK)
+        self.assertNotEqual(response["ETag"], etag)
+
+    def test_no_validators_for_invalid_search(self):
+        response = self.client.get("/catalogue/search/?group=invalid")
+
+        self.assertNotIn("ETag", response)
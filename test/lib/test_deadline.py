@@ -0,0 +1,162 @@
+import time
+from unittest.mock import patch
+
+import responses
+from django.conf import settings
+from django.test import SimpleTestCase, TestCase, override_settings
+
+from app.lib.api import JSONAPIClient
+from app.lib.deadline import (
+    cap_timeout,
+    deadline_exceeded,
+    remaining_time,
+    reset_deadline,
+    set_deadline,
+)
+from app.lib.exceptions import APIDeadlineExceededError
+from app.main.cache import build_subject_picker
+from app.records.enrichment import RecordEnrichmentHelper
+from app.records.models import Record
+from test.utils import json_response
+
+
+class DeadlineTests(SimpleTestCase):
+    def test_no_deadline(self):
+        self.assertIsNone(remaining_time())
+        self.assertFalse(deadline_exceeded())
+        self.assertEqual(cap_timeout(5), 5)
+        self.assertIsNone(cap_timeout(None))
+
+    def test_timeouts_capped_at_remaining_time(self):
+        token = set_deadline(2)
+        try:
+            self.assertLessEqual(remaining_time(), 2)
+            self.assertEqual(cap_timeout(1), 1)
+            self.assertLessEqual(cap_timeout(5), 2)
+            self.assertLessEqual(cap_timeout(None), 2)
+        finally:
+            reset_deadline(token)
+        self.assertIsNone(remaining_time())
+
+    def test_deadline_exceeded(self):
+        token = set_deadline(0)
+        try:
+            self.assertTrue(deadline_exceeded())
+            self.assertEqual(cap_timeout(5), 0)
+        finally:
+            reset_deadline(token)
+
+
+class JSONAPIClientDeadlineTests(SimpleTestCase):
+    @responses.activate
+    def test_no_call_after_deadline(self):
+        client = JSONAPIClient(settings.ROSETTA_API_URL)
+        token = set_deadline(0)
+        try:
+            with self.assertRaises(APIDeadlineExceededError):
+                client.get("get")
+        finally:
+            reset_deadline(token)
+
+        self.assertEqual(len(responses.calls), 0)
+
+    @patch("app.lib.api.get")
+    def test_timeout_capped(self, mock_get):
+        mock_get.return_value = json_response({})
+        client = JSONAPIClient(settings.ROSETTA_API_URL)
+        token = set_deadline(2)
+        try:
+            client.get("get", timeout=10)
+        finally:
+            reset_deadline(token)
+
+        self.assertLessEqual(mock_get.call_args.kwargs["timeout"], 2)
+
+    @patch("app.lib.api.deadline_exceeded", side_effect=[False, True])
+    @patch("app.lib.api.get")
+    def test_body_not_read_after_deadline(self, mock_get, mock_exceeded):
+        mock_get.return_value = json_response({"data": []})
+        client = JSONAPIClient(settings.ROSETTA_API_URL)
+
+        with self.assertRaises(APIDeadlineExceededError):
+            client.get("get")
+
+
+@override_settings(ENABLE_PARALLEL_API_CALLS=True)
+class EnrichmentDeadlineTests(SimpleTestCase):
+    def setUp(self):
+        self.record = Record(
+            {"id": "C123456", "subjects": ["Army"], "groupArray": [{"value": "tna"}]}
+        )
+
+    @patch("app.records.enrichment.get_tna_related_records_by_subjects")
+    @patch("app.records.enrichment.get_related_records_by_series")
+    @patch("app.records.enrichment.get_subjects_enrichment")
+    def test_slow_enrichment_skipped_at_deadline(
+        self, mock_subjects, mock_series, mock_related
+    ):
+        mock_subjects.return_value = {"items": ["article"]}
+        mock_series.return_value = []
+
+        def slow_related(*args, **kwargs):
+            time.sleep(0.5)
+            return ["related"]
+
+        mock_related.side_effect = slow_related
+
+        start = time.monotonic()
+        token = set_deadline(0.1)
+        try:
+            results = RecordEnrichmentHelper(self.record).fetch_all()
+        finally:
+            reset_deadline(token)
+
+        self.assertEqual(results["subjects_enrichment"], {"items": ["article"]})
+        self.assertEqual(results["related_records"], [])
+        # not waiting for the slow task
+        self.assertLess(time.monotonic() - start, 0.4)
+
+    @patch("app.records.enrichment.get_subjects_enrichment")
+    def test_enrichment_skipped_after_deadline(self, mock_subjects):
+        token = set_deadline(0)
+        try:
+            self.assertEqual(RecordEnrichmentHelper(self.record)._fetch_subjects(), {})
+        finally:
+            reset_deadline(token)
+
+        mock_subjects.assert_not_called()
+
+
+class RequestDeadlineMiddlewareTests(TestCase):
+    @override_settings(REQUEST_DEADLINE=10)
+    @patch(
+        "app.main.views.get_subject_picker",
+        side_effect=lambda: build_subject_picker([]),
+    )
+    @patch("app.main.views.fetch_global_notifications", return_value=None)
+    @patch("app.main.views.get_explore_the_collection")
+    def test_deadline_set_for_request(self, mock_explore, *mocks):
+        remaining = []
+        mock_explore.side_effect = lambda: remaining.append(remaining_time()) or {}
+
+        self.client.get("/catalogue/")
+
+        self.assertGreater(remaining[0], 9)
+        self.assertLessEqual(remaining[0], 10)
+        # reset after the request
+        self.assertIsNone(remaining_time())
+
+    @override_settings(REQUEST_DEADLINE=0)
+    @patch(
+        "app.main.views.get_subject_picker",
+        side_effect=lambda: build_subject_picker([]),
+    )
+    @patch("app.main.views.fetch_global_notifications", return_value=None)
+    @patch("app.main.views.get_explore_the_collection")
+    def test_no_deadline_when_disabled(self, mock_explore, *mocks):
+        remaining = []
+        mock_explore.side_effect = lambda: remaining.append(remaining_time()) or {}
+
+        self.client.get("/catalogue/")
+
+        self.assertEqual(remaining, [None])
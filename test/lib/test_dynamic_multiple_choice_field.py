@@ -1,7 +1,7 @@
 from django.http import QueryDict
 from django.test import TestCase
 
-from app.lib.fields import DynamicMultipleChoiceField
+from app.lib.fields import ChoiceIndex, DynamicMultipleChoiceField
 from app.lib.forms import BaseForm
 
 
@@ -342,3 +342,75 @@ class BaseFormWithDMCFieldValidateInputFalseTest(TestCase):
             ],
         )
         self.assertEqual(dmc_field.error, {})
+
+
+class DMCFieldWithChoiceIndexTest(TestCase):
+    def setUp(self):
+        self.choice_index = ChoiceIndex([("london", "London"), ("leeds", "Leeds")])
+
+    def test_choice_index_lookups(self):
+        self.assertIn("leeds", self.choice_index)
+        self.assertNotIn("york", self.choice_index)
+        self.assertTrue(self.choice_index.has_all(["london", "leeds"]))
+        self.assertFalse(self.choice_index.has_all(["london", "york"]))
+        self.assertEqual(self.choice_index.labels["london"], "London")
+        self.assertEqual(self.choice_index.values, ("london", "leeds"))
+        with self.assertRaises(TypeError):
+            self.choice_index.labels["york"] = "York"
+
+    def test_fields_share_choice_index(self):
+        field_1 = DynamicMultipleChoiceField(
+            choices=self.choice_index, validate_input=True
+        )
+        field_2 = DynamicMultipleChoiceField(
+            choices=self.choice_index, validate_input=True
+        )
+
+        self.assertIs(field_1.configured_choice_labels, self.choice_index.labels)
+        self.assertIs(field_2.configured_choice_labels, self.choice_index.labels)
+        self.assertEqual(field_1.choices, (("london", "London"), ("leeds", "Leeds")))
+
+    def test_validate_and_labels_from_choice_index(self):
+        field = DynamicMultipleChoiceField(
+            choices=self.choice_index, validate_input=True
+        )
+        field.bind("dmc_field", ["leeds", "york"])
+
+        self.assertFalse(field.is_valid())
+        self.assertEqual(
+            field.error,
+            {
+                "text": (
+                    "Enter a valid choice. Value(s) [leeds, york] do not belong "
+                    "to the available choices. Valid choices are [london, leeds]"
+                )
+            },
+        )
+
+        field.update_choices([{"value": "leeds", "doc_count": 1000}], ["london"])
+        self.assertEqual(
+            field.choices, [("leeds", "Leeds (1,000)"), ("london", "London (0)")]
+        )
+
+
+class DMCFieldUpdateChoicesTest(TestCase):
+    def test_update_choices_with_long_filter_entries(self):
+        field = DynamicMultipleChoiceField(
+            choices=[("s1", "Subject one")], validate_input=False
+        )
+        field.bind("subject", ["s2", "missing", "s1"])
+        field.is_valid()
+
+        field.update_choices(
+            [{"value": f"s{i}", "doc_count": i * 1000} for i in range(1, 5001)],
+            field.value,
+        )
+
+        self.assertEqual(len(field.choices), 5001)
+        self.assertEqual(field.choices[0], ("s1", "Subject one (1,000)"))
+        self.assertEqual(field.choices[1], ("s2", "s2 (2,000)"))
+        self.assertEqual(field.choices[-1], ("missing", "missing (0)"))
+        self.assertEqual(
+            [item["value"] for item in field.items if item.get("checked")],
+            ["s1", "s2", "missing"],
+        )
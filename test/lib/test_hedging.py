@@ -0,0 +1,192 @@
+import threading
+import time
+from unittest.mock import patch
+
+import responses
+from django.conf import settings
+from django.test import SimpleTestCase, override_settings
+
+from app.lib import hedging
+from app.lib.api import rosetta_request_handler
+from app.lib.constants import HEDGE_MIN_SAMPLES
+from app.lib.exceptions import APIRequestFailedError
+from app.lib.hedging import HedgeBudget, LatencyTracker, hedged_call
+
+
+def learn_latency(name: str, latency: float):
+    tracker = hedging.get_latency_tracker(name)
+    for _ in range(HEDGE_MIN_SAMPLES):
+        tracker.record(latency)
+
+
+class LatencyTrackerTests(SimpleTestCase):
+    def test_percentile(self):
+        tracker = LatencyTracker()
+        self.assertIsNone(tracker.percentile(95))
+
+        for latency in range(1, 101):
+            tracker.record(latency / 100)
+
+        self.assertEqual(tracker.percentile(95), 0.95)
+        self.assertEqual(tracker.percentile(50), 0.5)
+        self.assertEqual(tracker.percentile(100), 1)
+
+    def test_window(self):
+        tracker = LatencyTracker(window=HEDGE_MIN_SAMPLES)
+        for latency in (10, 1):
+            for _ in range(HEDGE_MIN_SAMPLES):
+                tracker.record(latency)
+
+        self.assertEqual(tracker.percentile(95), 1)
+
+
+class HedgeBudgetTests(SimpleTestCase):
+    def test_spend(self):
+        budget = HedgeBudget(max_tokens=2)
+        self.assertFalse(budget.spend())
+
+        for _ in range(19):
+            budget.earn(5)
+        self.assertFalse(budget.spend())
+        budget.earn(5)
+        self.assertTrue(budget.spend())
+        self.assertFalse(budget.spend())
+
+        # capped
+        for _ in range(100):
+            budget.earn(5)
+        self.assertTrue(budget.spend())
+        self.assertTrue(budget.spend())
+        self.assertFalse(budget.spend())
+
+
+@override_settings(ROSETTA_HEDGE_PERCENTILE=95, ROSETTA_HEDGE_MAX_PERCENT=100)
+class HedgedCallTests(SimpleTestCase):
+    def setUp(self):
+        hedging._trackers.clear()
+        hedging.budget = HedgeBudget()
+
+    def tearDown(self):
+        hedging._trackers.clear()
+        hedging.budget = HedgeBudget()
+
+    def test_not_hedged_while_learning(self):
+        calls = []
+
+        result = hedged_call("test", lambda: calls.append(1) or "result")
+
+        self.assertEqual(result, "result")
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(len(hedging.get_latency_tracker("test").latencies), 1)
+
+    def test_not_hedged_when_fast(self):
+        learn_latency("test", 1)
+        calls = []
+
+        result = hedged_call("test", lambda: calls.append(1) or "result")
+
+        self.assertEqual(result, "result")
+        self.assertEqual(len(calls), 1)
+
+    def test_hedge_beats_slow_call(self):
+        learn_latency("test", 0.01)
+        hedge_answered = threading.Event()
+        calls = []
+
+        def call():
+            calls.append(1)
+            if len(calls) == 1:
+                # succeeds, but only after the hedge
+                hedge_answered.wait(timeout=5)
+                return "primary"
+            return "hedge"
+
+        start = time.monotonic()
+        self.assertEqual(hedged_call("test", call), "hedge")
+        hedge_answered.set()
+        self.assertEqual(len(calls), 2)
+        self.assertLess(time.monotonic() - start, 1)
+
+    def test_not_hedged_when_saturated(self):
+        learn_latency("test", 0.01)
+        calls = []
+
+        def call():
+            calls.append(threading.current_thread())
+            time.sleep(0.05)
+            return "result"
+
+        with patch("app.lib.hedging.hedging_saturated", return_value=True):
+            self.assertEqual(hedged_call("test", call), "result")
+        # in the caller's thread
+        self.assertEqual(calls, [threading.current_thread()])
+
+    @override_settings(ROSETTA_HEDGE_MAX_PERCENT=0)
+    def test_not_hedged_without_budget(self):
+        learn_latency("test", 0.01)
+        calls = []
+
+        def call():
+            calls.append(1)
+            time.sleep(0.05)
+            return "result"
+
+        self.assertEqual(hedged_call("test", call), "result")
+        self.assertEqual(len(calls), 1)
+
+    def test_failed_call_answered_by_hedge(self):
+        learn_latency("test", 0.01)
+        calls = []
+
+        def call():
+            calls.append(1)
+            if len(calls) == 1:
+                time.sleep(0.05)
+                raise APIRequestFailedError("Request failed")
+            time.sleep(0.1)
+            return "hedge"
+
+        self.assertEqual(hedged_call("test", call), "hedge")
+
+    def test_both_calls_fail(self):
+        learn_latency("test", 0.01)
+
+        def call():
+            time.sleep(0.05)
+            raise APIRequestFailedError("Request failed")
+
+        with self.assertRaises(APIRequestFailedError):
+            hedged_call("test", call)
+
+
+class RosettaRequestHandlerHedgingTests(SimpleTestCase):
+    @responses.activate
+    @override_settings(ENABLE_ROSETTA_HEDGING=True)
+    def test_only_reads_are_hedged(self):
+        responses.add(
+            responses.GET, f"{settings.ROSETTA_API_URL}/get", json={"data": []}
+        )
+        responses.add(
+            responses.GET, f"{settings.ROSETTA_API_URL}/other", json={"data": []}
+        )
+
+        with patch(
+            "app.lib.api.hedged_call", side_effect=lambda name, call: call()
+        ) as mock_hedged_call:
+            self.assertEqual(rosetta_request_handler("get"), {"data": []})
+            self.assertEqual(rosetta_request_handler("other"), {"data": []})
+
+        mock_hedged_call.assert_called_once()
+        self.assertEqual(mock_hedged_call.call_args.args[0], "rosetta:get")
+
+    @responses.activate
+    @override_settings(ENABLE_ROSETTA_HEDGING=False)
+    def test_not_hedged_when_disabled(self):
+        responses.add(
+            responses.GET, f"{settings.ROSETTA_API_URL}/get", json={"data": []}
+        )
+
+        with patch("app.lib.api.hedged_call") as mock_hedged_call:
+            rosetta_request_handler("get")
+
+        mock_hedged_call.assert_not_called()
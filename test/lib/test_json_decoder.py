@@ -0,0 +1,97 @@
+from unittest.mock import patch
+
+import responses
+from django.conf import settings
+from django.core.exceptions import ImproperlyConfigured
+from django.test import SimpleTestCase, override_settings
+
+from app.lib import json_decoder
+from app.lib.api import JSONAPIClient
+from app.lib.exceptions import APINonJSONResponseError
+from app.lib.json_decoder import content_charset, decode_json, get_decoder
+
+
+class GetDecoderTests(SimpleTestCase):
+    def test_stdlib(self):
+        self.assertIs(get_decoder("stdlib"), json_decoder.json.loads)
+
+    @override_settings(JSON_DECODER="stdlib")
+    def test_setting(self):
+        self.assertIs(get_decoder(), json_decoder.json.loads)
+
+    def test_auto(self):
+        fast_loads = object()
+        with patch.dict(json_decoder.DECODERS, {"orjson": fast_loads}):
+            self.assertIs(get_decoder("auto"), fast_loads)
+
+        with patch.dict(json_decoder.DECODERS, clear=True) as decoders:
+            decoders["stdlib"] = json_decoder.json.loads
+            self.assertIs(get_decoder("auto"), json_decoder.json.loads)
+
+    def test_unavailable(self):
+        with patch.dict(json_decoder.DECODERS, clear=True):
+            with self.assertRaises(ImproperlyConfigured):
+                get_decoder("orjson")
+
+
+class DecodeJSONTests(SimpleTestCase):
+    def test_decode_json(self):
+        for decoder in json_decoder.DECODERS:
+            with self.subTest(decoder=decoder):
+                self.assertEqual(
+                    decode_json('{"title": "Café"}'.encode(), decoder=decoder),
+                    {"title": "Café"},
+                )
+                self.assertEqual(
+                    decode_json(
+                        '{"title": "Café"}'.encode("latin-1"),
+                        charset="ISO-8859-1",
+                        decoder=decoder,
+                    ),
+                    {"title": "Café"},
+                )
+                with self.assertRaises(ValueError):
+                    decode_json(b"<html></html>", decoder=decoder)
+
+    def test_content_charset(self):
+        for content_type, expected in (
+            (None, None),
+            ("application/json", None),
+            ("application/json; charset=utf-8", "utf-8"),
+            ("text/plain; charset=ISO-8859-1", "ISO-8859-1"),
+        ):
+            with self.subTest(content_type=content_type):
+                self.assertEqual(content_charset(content_type), expected)
+
+
+class JSONAPIClientDecodingTests(SimpleTestCase):
+    @responses.activate
+    def test_decodes_from_bytes(self):
+        responses.add(
+            responses.GET,
+            f"{settings.ROSETTA_API_URL}/get",
+            json={"data": [{"title": "Café"}]},
+        )
+
+        with patch("app.lib.api.decode_json", wraps=decode_json) as mock_decode_json:
+            data = JSONAPIClient(settings.ROSETTA_API_URL).get("get")
+
+        self.assertEqual(data, {"data": [{"title": "Café"}]})
+        self.assertIsInstance(mock_decode_json.call_args.args[0], bytes)
+
+    @responses.activate
+    def test_non_json_response(self):
+        for body, content_type in (
+            ("<html></html>", "text/html"),
+            ("{}", "application/json; charset=unknown"),
+        ):
+            with self.subTest(content_type=content_type):
+                responses.add(
+                    responses.GET,
+                    f"{settings.ROSETTA_API_URL}/get",
+                    body=body,
+                    content_type=content_type,
+                )
+                with self.assertRaises(APINonJSONResponseError):
+                    JSONAPIClient(settings.ROSETTA_API_URL).get("get")
+                responses.reset()
@@ -0,0 +1,181 @@
+from http import HTTPStatus
+from io import StringIO
+
+import responses
+from django.conf import settings
+from django.core.cache import cache
+from django.core.management import call_command
+from django.test import SimpleTestCase, TestCase, override_settings
+
+from app.lib import negative_cache
+from app.lib.exceptions import APIResourceNotFound, NoResultsFound, RecordNotFound
+from app.lib.negative_cache import flush_negative_cache_stats, negative_cache_stats
+from app.records.api import record_details_by_id
+from app.search.api import search_records
+
+
+def empty_search_response() -> dict:
+    return {
+        "data": [],
+        "aggregations": [],
+        "buckets": [{"name": "group", "entries": [{"value": "tna", "count": 0}]}],
+        "stats": {"total": 0, "results": 0},
+    }
+
+
+@override_settings(NEGATIVE_CACHE_TIMEOUT=60)
+class NegativeCacheTests(SimpleTestCase):
+    def setUp(self):
+        flush_negative_cache_stats()
+        cache.clear()
+
+    def tearDown(self):
+        flush_negative_cache_stats()
+        cache.clear()
+
+    @responses.activate
+    def test_missing_record_is_cached(self):
+        responses.add(
+            responses.GET,
+            f"{settings.ROSETTA_API_URL}/get",
+            json={"data": []},
+        )
+
+        for _ in range(3):
+            with self.assertRaisesMessage(RecordNotFound, "id C999 does not exist"):
+                record_details_by_id("C999")
+
+        self.assertEqual(len(responses.calls), 1)
+        flush_negative_cache_stats()
+        self.assertEqual(negative_cache_stats()["record"], {"hit": 2, "store": 1})
+
+    @responses.activate
+    def test_resource_not_found_is_cached(self):
+        responses.add(
+            responses.GET,
+            f"{settings.ROSETTA_API_URL}/get",
+            status=HTTPStatus.NOT_FOUND,
+        )
+
+        for _ in range(2):
+            with self.assertRaises(APIResourceNotFound):
+                record_details_by_id("C999")
+
+        self.assertEqual(len(responses.calls), 1)
+
+    @responses.activate
+    def test_other_records_and_errors_not_cached(self):
+        responses.add(
+            responses.GET,
+            f"{settings.ROSETTA_API_URL}/get",
+            json={"data": []},
+        )
+        with self.assertRaises(RecordNotFound):
+            record_details_by_id("C999")
+        responses.reset()
+        responses.add(
+            responses.GET,
+            f"{settings.ROSETTA_API_URL}/get",
+            status=HTTPStatus.INTERNAL_SERVER_ERROR,
+        )
+
+        for _ in range(2):
+            with self.assertRaises(Exception) as context:
+                record_details_by_id("C1000")
+            self.assertNotIsInstance(context.exception, RecordNotFound)
+
+        self.assertEqual(len(responses.calls), 2)
+
+    @responses.activate
+    def test_empty_search_is_cached(self):
+        responses.add(
+            responses.GET,
+            f"{settings.ROSETTA_API_URL}/search",
+            json=empty_search_response(),
+        )
+
+        for _ in range(2):
+            with self.assertRaises(NoResultsFound):
+                search_records("zzzz", results_per_page=20)
+        # a different search
+        with self.assertRaises(NoResultsFound):
+            search_records("yyyy", results_per_page=20)
+
+        self.assertEqual(len(responses.calls), 2)
+        flush_negative_cache_stats()
+        self.assertEqual(negative_cache_stats()["search"], {"hit": 1, "store": 2})
+
+    @responses.activate
+    def test_counts_flushed_in_batches(self):
+        responses.add(
+            responses.GET,
+            f"{settings.ROSETTA_API_URL}/get",
+            json={"data": []},
+        )
+
+        for _ in range(negative_cache.NEGATIVE_CACHE_STATS_FLUSH_EVERY - 1):
+            with self.assertRaises(RecordNotFound):
+                record_details_by_id("C999")
+        self.assertEqual(negative_cache_stats()["record"], {"hit": 0, "store": 0})
+
+        with self.assertRaises(RecordNotFound):
+            record_details_by_id("C999")
+        self.assertEqual(
+            negative_cache_stats()["record"],
+            {"hit": negative_cache.NEGATIVE_CACHE_STATS_FLUSH_EVERY - 1, "store": 1},
+        )
+
+    @override_settings(NEGATIVE_CACHE_TIMEOUT=0)
+    @responses.activate
+    def test_disabled(self):
+        responses.add(
+            responses.GET,
+            f"{settings.ROSETTA_API_URL}/get",
+            json={"data": []},
+        )
+
+        for _ in range(2):
+            with self.assertRaises(RecordNotFound):
+                record_details_by_id("C999")
+
+        self.assertEqual(len(responses.calls), 2)
+
+
+@override_settings(NEGATIVE_CACHE_TIMEOUT=60)
+class NegativeCacheViewTests(TestCase):
+    def setUp(self):
+        cache.clear()
+
+    def tearDown(self):
+        cache.clear()
+
+    @responses.activate
+    def test_missing_record_page(self):
+        responses.add(
+            responses.GET,
+            f"{settings.ROSETTA_API_URL}/get",
+            json={"data": []},
+        )
+
+        for _ in range(2):
+            response = self.client.get("/catalogue/id/C999/")
+            self.assertEqual(response.status_code, HTTPStatus.NOT_FOUND)
+
+        self.assertEqual(
+            len(
+                [
+                    call
+                    for call in responses.calls
+                    if call.request.url.startswith(settings.ROSETTA_API_URL)
+                ]
+            ),
+            1,
+        )
+
+    def test_stats_command(self):
+        out = StringIO()
+
+        call_command("negativecachestats", stdout=out)
+
+        self.assertIn("record: 0 hits, 0 stores", out.getvalue())
+        self.assertIn("search: 0 hits, 0 stores", out.getvalue())
@@ -0,0 +1,178 @@
+import gzip
+import json
+from io import StringIO
+from unittest.mock import patch
+
+import responses
+from django.conf import settings
+from django.core.cache import cache
+from django.core.management import call_command
+from django.test import SimpleTestCase, override_settings
+from urllib3.util.request import ACCEPT_ENCODING
+
+from app.lib import transfer_stats
+from app.lib.api import JSONAPIClient
+from app.lib.exceptions import APIResponseTooLargeError
+from app.lib.transfer_stats import (
+    flush_transfer_stats,
+    record_transfer,
+    reset_transfer_stats,
+)
+from test.utils import json_response
+
+ROSETTA_UPSTREAM = transfer_stats.upstream_name(settings.ROSETTA_API_URL)
+
+
+def large_response() -> dict:
+    return {"data": [{"title": "Papers relating to item"} for _ in range(1000)]}
+
+
+class TransferStatsTests(SimpleTestCase):
+    def setUp(self):
+        flush_transfer_stats()
+        cache.clear()
+
+    def tearDown(self):
+        flush_transfer_stats()
+        cache.clear()
+
+    def test_counts_flushed_in_batches(self):
+        for _ in range(transfer_stats.TRANSFER_STATS_FLUSH_EVERY - 1):
+            record_transfer("https://rosetta.test/data", 10, 40)
+        self.assertEqual(transfer_stats.transfer_stats(), {})
+
+        record_transfer("https://rosetta.test/data", 10, 40)
+        record_transfer("https://wagtail.test/api/v2", 5, 5)
+        flush_transfer_stats()
+
+        self.assertEqual(
+            transfer_stats.transfer_stats(),
+            {
+                "rosetta.test": {
+                    "responses": transfer_stats.TRANSFER_STATS_FLUSH_EVERY,
+                    "compressed_bytes": 10 * transfer_stats.TRANSFER_STATS_FLUSH_EVERY,
+                    "bytes": 40 * transfer_stats.TRANSFER_STATS_FLUSH_EVERY,
+                },
+                "wagtail.test": {
+                    "responses": 1,
+                    "compressed_bytes": 5,
+                    "bytes": 5,
+                },
+            },
+        )
+
+        reset_transfer_stats()
+        self.assertEqual(transfer_stats.transfer_stats(), {})
+
+    def test_stats_command(self):
+        record_transfer("https://rosetta.test/data", 25, 100)
+        flush_transfer_stats()
+        out = StringIO()
+
+        call_command("transferstats", "--reset", stdout=out)
+
+        self.assertIn(
+            "rosetta.test: 1 responses, 25 bytes transferred, 100 bytes decoded (25%)",
+            out.getvalue(),
+        )
+        self.assertEqual(transfer_stats.transfer_stats(), {})
+
+
+class JSONAPIClientTransferTests(SimpleTestCase):
+    def setUp(self):
+        flush_transfer_stats()
+        cache.clear()
+
+    def tearDown(self):
+        flush_transfer_stats()
+        cache.clear()
+
+    @responses.activate
+    def test_accept_encoding(self):
+        responses.add(
+            responses.GET, f"{settings.ROSETTA_API_URL}/get", json={"data": []}
+        )
+
+        JSONAPIClient(settings.ROSETTA_API_URL).get("get")
+
+        self.assertEqual(
+            responses.calls[0].request.headers["Accept-Encoding"], ACCEPT_ENCODING
+        )
+        self.assertIn("gzip", ACCEPT_ENCODING)
+
+    @responses.activate
+    def test_compressed_response_counted(self):
+        content = json.dumps(large_response()).encode()
+        compressed_content = gzip.compress(content)
+        responses.add(
+            responses.GET,
+            f"{settings.ROSETTA_API_URL}/search",
+            body=compressed_content,
+            content_type="application/json",
+            headers={"Content-Encoding": "gzip"},
+        )
+
+        data = JSONAPIClient(settings.ROSETTA_API_URL).get("search")
+        flush_transfer_stats()
+
+        self.assertEqual(data, large_response())
+        self.assertEqual(
+            transfer_stats.transfer_stats()[ROSETTA_UPSTREAM],
+            {
+                "responses": 1,
+                "compressed_bytes": len(compressed_content),
+                "bytes": len(content),
+            },
+        )
+
+    @responses.activate
+    @override_settings(API_MAX_RESPONSE_SIZE=1000)
+    def test_response_too_large(self):
+        content = json.dumps(large_response()).encode()
+        for headers in (
+            # rejected from the Content-Length
+            {},
+            # rejected while decompressing
+            {"Content-Encoding": "gzip"},
+        ):
+            with self.subTest(headers=headers):
+                responses.add(
+                    responses.GET,
+                    f"{settings.ROSETTA_API_URL}/search",
+                    body=gzip.compress(content) if headers else content,
+                    content_type="application/json",
+                    headers=headers,
+                )
+                with self.assertRaises(APIResponseTooLargeError):
+                    JSONAPIClient(settings.ROSETTA_API_URL).get("search")
+                responses.reset()
+
+    @override_settings(API_MAX_RESPONSE_SIZE=1000)
+    @patch("app.lib.api.get")
+    def test_malformed_content_length(self, mock_get):
+        for data, error in (({"data": []}, None), (large_response(), True)):
+            with self.subTest(error=error):
+                response = json_response(data)
+                response.headers["Content-Length"] = "invalid"
+                mock_get.return_value = response
+                client = JSONAPIClient(settings.ROSETTA_API_URL)
+
+                if error:
+                    # rejected while reading
+                    with self.assertRaises(APIResponseTooLargeError):
+                        client.get("search")
+                else:
+                    self.assertEqual(client.get("search"), data)
+
+    @responses.activate
+    @override_settings(API_MAX_RESPONSE_SIZE=0)
+    def test_no_size_limit(self):
+        responses.add(
+            responses.GET,
+            f"{settings.ROSETTA_API_URL}/search",
+            json=large_response(),
+        )
+
+        self.assertEqual(
+            JSONAPIClient(settings.ROSETTA_API_URL).get("search"), large_response()
+        )
@@ -0,0 +1,153 @@
+from http import HTTPStatus
+from unittest.mock import patch
+
+import responses
+from django.conf import settings
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+
+from app.main.cache import (
+    build_subject_picker,
+    get_subject_picker,
+    get_subjects_grouped_by_letter,
+    subject_picker_cache_key,
+)
+from app.main.constants import SUBJECTS_CACHE_KEY
+
+
+def subjects_response() -> dict:
+    return {
+        "data": [],
+        "aggregations": [
+            {
+                "name": "longSubject",
+                "entries": [
+                    {"value": "NAVY", "doc_count": 100},
+                    {"value": "Crime and punishment", "doc_count": 200},
+                    {"value": "CONFLICT", "doc_count": 50},
+                ],
+            }
+        ],
+        "buckets": [{"name": "group", "entries": [{"value": "tna", "count": 350}]}],
+        "stats": {"total": 350, "results": 0},
+    }
+
+
+class BuildSubjectPickerTests(TestCase):
+    def test_build_subject_picker(self):
+        picker = build_subject_picker(subjects_response()["aggregations"][0]["entries"])
+
+        self.assertEqual(len(picker["letters"]), 26)
+        self.assertEqual(picker["count"], 3)
+        self.assertEqual(len(picker["disabled_letters"]), 24)
+        self.assertNotIn("C", picker["disabled_letters"])
+        self.assertEqual(
+            picker["subjects_grouped_by_letter"]["C"],
+            ["CONFLICT", "Crime and punishment"],
+        )
+
+        letter_c = picker["letters"][2]
+        self.assertEqual(letter_c["id"], "c")
+        self.assertEqual(letter_c["count"], 2)
+        self.assertFalse(letter_c["disabled"])
+        self.assertEqual(
+            letter_c["subjects"][1],
+            {
+                "name": "Crime and punishment",
+                "href": "/catalogue/search/?subject=Crime+and+punishment",
+                "count": 200,
+            },
+        )
+        self.assertTrue(picker["letters"][0]["disabled"])
+
+    def test_html(self):
+        picker = build_subject_picker(subjects_response()["aggregations"][0]["entries"])
+
+        self.assertIn('id="tab-c"', picker["html"])
+        self.assertIn('id="subject-picker-n"', picker["html"])
+        self.assertNotIn('id="subject-picker-a"', picker["html"])
+        self.assertIn(
+            'href="/catalogue/search/?subject=Crime+and+punishment"', picker["html"]
+        )
+        self.assertIn("<span>A</span>", picker["html"])
+
+    def test_html_is_escaped(self):
+        picker = build_subject_picker([{"value": "B<script>", "doc_count": 1}])
+
+        self.assertNotIn("<script>", picker["html"])
+        self.assertIn("B&lt;script&gt;", picker["html"])
+
+
+class SubjectPickerCacheTests(TestCase):
+    def setUp(self):
+        cache.clear()
+
+    def tearDown(self):
+        cache.clear()
+
+    @responses.activate
+    def test_built_once_with_the_subjects(self):
+        responses.add(
+            responses.GET,
+            f"{settings.ROSETTA_API_URL}/search",
+            json=subjects_response(),
+        )
+
+        picker = get_subject_picker()
+
+        self.assertEqual(cache.get(subject_picker_cache_key()), picker)
+        self.assertEqual(
+            cache.get(SUBJECTS_CACHE_KEY), picker["subjects_grouped_by_letter"]
+        )
+        with patch("app.main.cache.build_subject_picker") as mock_build:
+            self.assertEqual(get_subject_picker(), picker)
+            self.assertEqual(
+                get_subjects_grouped_by_letter(), picker["subjects_grouped_by_letter"]
+            )
+        mock_build.assert_not_called()
+        self.assertEqual(len(responses.calls), 1)
+
+    @responses.activate
+    def test_rebuilt_for_a_new_build(self):
+        responses.add(
+            responses.GET,
+            f"{settings.ROSETTA_API_URL}/search",
+            json=subjects_response(),
+        )
+        get_subject_picker()
+
+        with override_settings(BUILD_VERSION="v2"):
+            get_subject_picker()
+            get_subject_picker()
+
+        self.assertEqual(len(responses.calls), 2)
+
+    @responses.activate
+    def test_failure_is_not_cached(self):
+        responses.add(
+            responses.GET,
+            f"{settings.ROSETTA_API_URL}/search",
+            status=HTTPStatus.INTERNAL_SERVER_ERROR,
+        )
+
+        with self.assertLogs("app.main.cache", level="ERROR"):
+            picker = get_subject_picker()
+
+        self.assertEqual(picker["count"], 0)
+        self.assertEqual(len(picker["disabled_letters"]), 26)
+        self.assertIsNone(cache.get(subject_picker_cache_key()))
+        self.assertIsNone(cache.get(SUBJECTS_CACHE_KEY))
+
+    @patch("app.main.views.fetch_global_notifications", return_value=None)
+    @patch("app.main.views.get_explore_the_collection", return_value={})
+    def test_catalogue_view_shows_cached_picker(self, *mocks):
+        picker = build_subject_picker([{"value": "NAVY", "doc_count": 100}])
+        cache.set(subject_picker_cache_key(), picker)
+
+        with patch("app.main.cache.fetch_all_subjects") as mock_fetch:
+            response = self.client.get("/catalogue/")
+
+        mock_fetch.assert_not_called()
+        self.assertEqual(response.status_code, HTTPStatus.OK)
+        self.assertContains(response, 'href="/catalogue/search/?subject=NAVY"')
+        self.assertContains(response, 'id="subject-picker-n"')
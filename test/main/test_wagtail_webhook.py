@@ -0,0 +1,134 @@
+from http import HTTPStatus
+from unittest.mock import patch
+
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+
+from app.main.cache import (
+    get_wagtail_content_version,
+    global_notifications_version,
+    invalidate_wagtail_content,
+)
+from app.main.constants import GLOBAL_NOTIFICATIONS_CACHE_KEY, LANDING_PAGE_CACHE_KEY
+
+NOTIFICATIONS = {"global_alert": {"title": "Alert"}, "mourning_notice": None}
+LANDING_PAGE = {"explore_the_collection": {}}
+
+
+class InvalidateWagtailContentTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        cache.set(GLOBAL_NOTIFICATIONS_CACHE_KEY, NOTIFICATIONS)
+        cache.set(LANDING_PAGE_CACHE_KEY, LANDING_PAGE)
+
+    def tearDown(self):
+        cache.clear()
+
+    def test_evicts_content_and_bumps_version(self):
+        self.assertEqual(get_wagtail_content_version(), 0)
+
+        result = invalidate_wagtail_content(["notifications"])
+
+        self.assertEqual(
+            result, {"version": 1, "surrogate_keys": ["global-notifications"]}
+        )
+        self.assertIsNone(cache.get(GLOBAL_NOTIFICATIONS_CACHE_KEY))
+        self.assertEqual(cache.get(LANDING_PAGE_CACHE_KEY), LANDING_PAGE)
+
+        result = invalidate_wagtail_content(["notifications", "landing_page"])
+
+        self.assertEqual(result["version"], 2)
+        self.assertIsNone(cache.get(LANDING_PAGE_CACHE_KEY))
+
+    @patch("app.main.cache.wagtail_request_handler")
+    def test_refresh(self, mock_handler):
+        mock_handler.return_value = {
+            "global_alert": {"title": "New alert"},
+            "mourning_notice": None,
+        }
+
+        invalidate_wagtail_content(["notifications"], refresh=True)
+
+        mock_handler.assert_called_once_with("/globals/notifications/")
+        self.assertEqual(
+            cache.get(GLOBAL_NOTIFICATIONS_CACHE_KEY)["global_alert"]["title"],
+            "New alert",
+        )
+
+    def test_notifications_version_changes(self):
+        version = global_notifications_version()
+
+        invalidate_wagtail_content(["landing_page"])
+
+        # the same notifications, a new content version
+        self.assertNotEqual(global_notifications_version(), version)
+        cache.delete(GLOBAL_NOTIFICATIONS_CACHE_KEY)
+        self.assertEqual(global_notifications_version(), "")
+
+
+@override_settings(WAGTAIL_WEBHOOK_SECRET="s3cret")
+class WagtailWebhookViewTests(TestCase):
+    url = "/catalogue/webhooks/wagtail/"
+
+    def setUp(self):
+        cache.clear()
+        cache.set(GLOBAL_NOTIFICATIONS_CACHE_KEY, NOTIFICATIONS)
+        cache.set(LANDING_PAGE_CACHE_KEY, LANDING_PAGE)
+
+    def tearDown(self):
+        cache.clear()
+
+    def post(self, data=None, authorization="Bearer s3cret"):
+        return self.client.post(
+            self.url,
+            data=data,
+            content_type="application/json",
+            HTTP_AUTHORIZATION=authorization,
+        )
+
+    def test_invalidates_all_content(self):
+        response = self.post()
+
+        self.assertEqual(response.status_code, HTTPStatus.OK)
+        self.assertEqual(
+            response.json(),
+            {
+                "content": ["notifications", "landing_page"],
+                "version": 1,
+                "surrogate_keys": ["global-notifications", "catalogue-landing"],
+            },
+        )
+        self.assertIsNone(cache.get(GLOBAL_NOTIFICATIONS_CACHE_KEY))
+        self.assertIsNone(cache.get(LANDING_PAGE_CACHE_KEY))
+
+    def test_invalidates_named_content(self):
+        response = self.post({"content": "landing_page"})
+
+        self.assertEqual(response.json()["content"], ["landing_page"])
+        self.assertEqual(cache.get(GLOBAL_NOTIFICATIONS_CACHE_KEY), NOTIFICATIONS)
+        self.assertIsNone(cache.get(LANDING_PAGE_CACHE_KEY))
+
+    def test_unauthorized(self):
+        for authorization in ("", "Bearer wrong", "s3cret"):
+            with self.subTest(authorization=authorization):
+                response = self.post(authorization=authorization)
+                self.assertEqual(response.status_code, HTTPStatus.UNAUTHORIZED)
+        self.assertEqual(cache.get(GLOBAL_NOTIFICATIONS_CACHE_KEY), NOTIFICATIONS)
+        self.assertEqual(get_wagtail_content_version(), 0)
+
+    @override_settings(WAGTAIL_WEBHOOK_SECRET="")
+    def test_disabled_without_secret(self):
+        response = self.post(authorization="Bearer ")
+
+        self.assertEqual(response.status_code, HTTPStatus.UNAUTHORIZED)
+
+    def test_bad_request(self):
+        for data in ("not json", ["notifications"], {"content": ["pages"]}):
+            with self.subTest(data=data):
+                response = self.post(data)
+                self.assertEqual(response.status_code, HTTPStatus.BAD_REQUEST)
+
+    def test_get_not_allowed(self):
+        response = self.client.get(self.url, HTTP_AUTHORIZATION="Bearer s3cret")
+
+        self.assertEqual(response.status_code, HTTPStatus.METHOD_NOT_ALLOWED)
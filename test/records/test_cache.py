@@ -0,0 +1,299 @@
+import time
+from http import HTTPStatus
+from unittest.mock import Mock, patch
+
+import responses
+from django.conf import settings
+from django.core.cache import cache
+from django.test import SimpleTestCase, override_settings
+
+from app.lib.exceptions import APIResourceNotFound, NoResultsFound, RecordNotFound
+from app.records import cache as records_cache
+from app.records.cache import (
+    SERIES_POOL,
+    SUBJECT_POOL,
+    get_cached_record,
+    get_related_pool,
+    get_related_records_from_pools,
+    record_cache_key,
+    records_details_by_ids,
+    refresh_related_pool,
+    related_pool_cache_key,
+)
+from app.records.enrichment import RecordEnrichmentHelper
+from app.records.models import Record
+
+
+def records(*ids) -> list[Record]:
+    return [Record({"id": id}) for id in ids]
+
+
+def tna_record(subjects=("Army", "Navy"), series_ref="WO 95") -> Mock:
+    record = Mock(spec=Record)
+    record.id = "C123456"
+    record.is_tna = True
+    record.subjects = list(subjects)
+    record.hierarchy_series = Mock(reference_number=series_ref) if series_ref else None
+    return record
+
+
+def cache_pool(kind: str, name: str, pool: list, age: int = 0):
+    cache.set(
+        related_pool_cache_key(kind, name),
+        {"records": pool, "refreshed": time.time() - age},
+    )
+
+
+@override_settings(RELATED_RECORD_POOL_REFRESH=3600)
+class RelatedPoolTests(SimpleTestCase):
+    def setUp(self):
+        cache.clear()
+
+    def tearDown(self):
+        cache.clear()
+        records_cache._refreshing.clear()
+
+    @patch("app.records.cache.refresh_related_pool_in_background")
+    def test_get_related_pool(self, mock_refresh):
+        with self.subTest("missing"):
+            self.assertIsNone(get_related_pool(SUBJECT_POOL, "Army"))
+            mock_refresh.assert_called_once_with(SUBJECT_POOL, "Army")
+
+        with self.subTest("fresh"):
+            mock_refresh.reset_mock()
+            pool = records("C1", "C2")
+            cache_pool(SUBJECT_POOL, "Army", pool)
+            self.assertEqual(
+                [record.id for record in get_related_pool(SUBJECT_POOL, "Army")],
+                ["C1", "C2"],
+            )
+            mock_refresh.assert_not_called()
+
+        with self.subTest("stale"):
+            cache_pool(SUBJECT_POOL, "Army", pool, age=3601)
+            self.assertEqual(len(get_related_pool(SUBJECT_POOL, "Army")), 2)
+            mock_refresh.assert_called_once_with(SUBJECT_POOL, "Army")
+
+    @patch("app.records.related.search_records")
+    def test_refresh_related_pool(self, mock_search):
+        mock_search.return_value = Mock(records=records("C1", "C2"))
+
+        refresh_related_pool(SERIES_POOL, "WO 95")
+
+        self.assertEqual(mock_search.call_args.kwargs["query"], "WO 95")
+        self.assertEqual(
+            mock_search.call_args.kwargs["results_per_page"],
+            records_cache.RELATED_POOL_SIZE,
+        )
+        self.assertEqual(len(get_related_pool(SERIES_POOL, "WO 95")), 2)
+
+    @patch("app.records.related.search_records")
+    def test_refresh_related_pool_without_results(self, mock_search):
+        mock_search.side_effect = NoResultsFound("No results found")
+
+        self.assertEqual(refresh_related_pool(SUBJECT_POOL, "Army"), [])
+        self.assertEqual(get_related_pool(SUBJECT_POOL, "Army"), [])
+
+    @patch("app.records.cache.refresh_related_pool_in_background")
+    @patch("app.records.related.search_records")
+    def test_refresh_related_pool_failure_cached(self, mock_search, mock_refresh):
+        mock_search.side_effect = Exception("API Error")
+
+        with self.subTest("missing"):
+            self.assertIsNone(refresh_related_pool(SUBJECT_POOL, "Army"))
+            # not refreshed again until the retry timeout
+            self.assertEqual(get_related_pool(SUBJECT_POOL, "Army"), [])
+            mock_refresh.assert_not_called()
+
+        with self.subTest("stale"):
+            cache_pool(SERIES_POOL, "WO 95", records("C1"), age=3601)
+            self.assertIsNone(refresh_related_pool(SERIES_POOL, "WO 95"))
+            self.assertEqual(len(get_related_pool(SERIES_POOL, "WO 95")), 1)
+            mock_refresh.assert_not_called()
+
+        with self.subTest("retried"):
+            later = time.time() + records_cache.RELATED_POOL_RETRY_TIMEOUT + 1
+            with patch("app.records.cache.time.time", return_value=later):
+                get_related_pool(SUBJECT_POOL, "Army")
+            mock_refresh.assert_called_once_with(SUBJECT_POOL, "Army")
+
+    @patch("app.records.related.search_records")
+    def test_missing_pool_refreshed_in_background(self, mock_search):
+        mock_search.return_value = Mock(records=records("C1"))
+
+        self.assertIsNone(get_related_pool(SUBJECT_POOL, "Army"))
+
+        for _ in range(50):
+            if cache.get(related_pool_cache_key(SUBJECT_POOL, "Army")):
+                break
+            time.sleep(0.01)
+        self.assertEqual(len(get_related_pool(SUBJECT_POOL, "Army")), 1)
+        self.assertEqual(records_cache._refreshing, set())
+
+
+@override_settings(RELATED_RECORD_POOL_REFRESH=3600)
+class RelatedRecordsFromPoolsTests(SimpleTestCase):
+    def setUp(self):
+        cache.clear()
+
+    def tearDown(self):
+        cache.clear()
+
+    @patch("app.records.cache.refresh_related_pool_in_background")
+    def test_none_until_pools_cached(self, mock_refresh):
+        self.assertIsNone(get_related_records_from_pools(tna_record(), limit=3))
+        self.assertEqual(
+            sorted(call.args for call in mock_refresh.call_args_list),
+            [(SERIES_POOL, "WO 95"), (SUBJECT_POOL, "Army"), (SUBJECT_POOL, "Navy")],
+        )
+
+    @patch("app.records.cache.refresh_related_pool_in_background")
+    def test_cached_pools_used(self, mock_refresh):
+        cache_pool(SUBJECT_POOL, "Army", records("C1", "C2"))
+
+        related = get_related_records_from_pools(tna_record(), limit=3)
+
+        self.assertEqual(sorted(record.id for record in related), ["C1", "C2"])
+        self.assertEqual(
+            sorted(call.args for call in mock_refresh.call_args_list),
+            [(SERIES_POOL, "WO 95"), (SUBJECT_POOL, "Navy")],
+        )
+
+    @patch("app.records.cache.refresh_related_pool_in_background")
+    def test_refreshes_capped(self, mock_refresh):
+        subjects = [f"Subject {i}" for i in range(10)]
+        cache_pool(SUBJECT_POOL, "Subject 0", records("C1"), age=3601)
+
+        get_related_records_from_pools(tna_record(subjects=subjects), limit=3)
+
+        self.assertEqual(
+            mock_refresh.call_count, records_cache.RELATED_POOL_MAX_REFRESHES
+        )
+        # missing pools first
+        self.assertNotIn(
+            (SUBJECT_POOL, "Subject 0"),
+            [call.args for call in mock_refresh.call_args_list],
+        )
+
+    @patch("app.records.cache.refresh_related_pool_in_background")
+    def test_sampled_from_subject_pools(self, mock_refresh):
+        cache_pool(SUBJECT_POOL, "Army", records("C123456", "C1", "C2", "C3"))
+        cache_pool(SUBJECT_POOL, "Navy", records("C3", "C4", "C5"))
+        cache_pool(SERIES_POOL, "WO 95", records("C6"))
+
+        seen = set()
+        for _ in range(20):
+            related = get_related_records_from_pools(tna_record(), limit=3)
+            ids = [record.id for record in related]
+            self.assertEqual(len(set(ids)), 3)
+            self.assertNotIn("C123456", ids)
+            self.assertNotIn("C6", ids)
+            seen.update(ids)
+
+        # varies between views
+        self.assertGreater(len(seen), 3)
+        mock_refresh.assert_not_called()
+
+    @patch("app.records.cache.refresh_related_pool_in_background")
+    def test_backfilled_from_series_pool(self, mock_refresh):
+        cache_pool(SUBJECT_POOL, "Army", records("C1"))
+        cache_pool(SERIES_POOL, "WO 95", records("C123456", "C1", "C2"))
+
+        related = get_related_records_from_pools(tna_record(subjects=["Army"]), limit=3)
+
+        self.assertEqual(sorted(record.id for record in related), ["C1", "C2"])
+
+    def test_non_tna_record(self):
+        record = tna_record()
+        record.is_tna = False
+
+        self.assertEqual(get_related_records_from_pools(record), [])
+
+
+@override_settings(ENABLE_RELATED_RECORD_POOLS=True)
+class RecordEnrichmentHelperPoolTests(SimpleTestCase):
+    @patch("app.records.enrichment.get_tna_related_records_by_subjects")
+    @patch("app.records.enrichment.get_related_records_from_pools")
+    def test_fetch_related_from_pools(self, mock_pools, mock_subjects):
+        mock_pools.return_value = records("C1", "C2", "C3")
+
+        result = RecordEnrichmentHelper(tna_record(), related_limit=3)._fetch_related()
+
+        self.assertEqual([record.id for record in result], ["C1", "C2", "C3"])
+        mock_subjects.assert_not_called()
+
+    @override_settings(ENABLE_PARALLEL_API_CALLS=False)
+    @patch("app.records.enrichment.get_related_records_by_series", return_value=[])
+    @patch("app.records.enrichment.get_tna_related_records_by_subjects")
+    @patch("app.records.enrichment.get_related_records_from_pools", return_value=None)
+    def test_fetch_related_searched_until_pools_cached(
+        self, mock_pools, mock_subjects, mock_series
+    ):
+        mock_subjects.return_value = records("C1", "C2", "C3")
+
+        result = RecordEnrichmentHelper(tna_record(), related_limit=3)._fetch_related()
+
+        self.assertEqual(len(result), 3)
+        mock_subjects.assert_called_once()
+
+
+def record_response(id: str) -> dict:
+    return {"data": [{"@template": {"details": {"id": id, "source": "CAT"}}}]}
+
+
+class RecordsDetailsByIdsTests(SimpleTestCase):
+    def setUp(self):
+        cache.clear()
+
+    def tearDown(self):
+        cache.clear()
+
+    def add_record_response(self, id: str, **kwargs):
+        responses.add(
+            responses.GET,
+            f"{settings.ROSETTA_API_URL}/get",
+            match=[responses.matchers.query_param_matcher({"id": id})],
+            **({"json": record_response(id)} | kwargs),
+        )
+
+    @responses.activate
+    def test_records_keyed_by_id(self):
+        for id in ("C1", "C2", "C3"):
+            self.add_record_response(id)
+
+        results = records_details_by_ids(["C3", "C1", "C3", "", "C2"])
+
+        self.assertEqual(list(results), ["C3", "C1", "C2"])
+        for id, record in results.items():
+            with self.subTest(id=id):
+                self.assertIsInstance(record, Record)
+                self.assertEqual(record.id, id)
+        # deduplicated
+        self.assertEqual(len(responses.calls), 3)
+
+    @responses.activate
+    def test_per_id_errors(self):
+        self.add_record_response("C1")
+        self.add_record_response("C2", status=HTTPStatus.NOT_FOUND)
+        self.add_record_response("C3", json={"data": []})
+
+        results = records_details_by_ids(["C1", "C2", "C3"])
+
+        self.assertEqual(results["C1"].id, "C1")
+        self.assertIsInstance(results["C2"], APIResourceNotFound)
+        self.assertIsInstance(results["C3"], RecordNotFound)
+
+    @responses.activate
+    def test_read_from_and_written_to_record_cache(self):
+        self.add_record_response("C2")
+        self.add_record_response("C3", status=HTTPStatus.NOT_FOUND)
+        cache.set(record_cache_key("C1"), Record({"id": "C1"}))
+
+        records_details_by_ids(["C1", "C2", "C3"])
+        results = records_details_by_ids(["C1", "C2"])
+
+        self.assertEqual([record.id for record in results.values()], ["C1", "C2"])
+        self.assertEqual(get_cached_record(record_cache_key("C2")).id, "C2")
+        self.assertIsNone(get_cached_record(record_cache_key("C3")))
+        # C2 and C3 once
+        self.assertEqual(len(responses.calls), 2)
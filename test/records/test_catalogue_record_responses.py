@@ -4,7 +4,7 @@ from copy import deepcopy
 from django.conf import settings
 from django.test import SimpleTestCase
 
-from app.records.models import APIResponse, Record
+from app.records.models import APIResponse, Record, RecordSummary
 
 
 class CatalogueRecordResponseTests(SimpleTestCase):
@@ -136,9 +136,9 @@ class CatalogueRecordResponseTests(SimpleTestCase):
         self.assertEqual(self.record.separated_materials, ())
         self.assertEqual(self.record.unpublished_finding_aids, [])
         self.assertEqual(len(self.record.hierarchy), 1)
-        self.assertIsInstance(self.record.next, Record)
-        self.assertIsInstance(self.record.previous, Record)
-        self.assertIsInstance(self.record.parent, Record)
+        self.assertIsInstance(self.record.next, RecordSummary)
+        self.assertIsInstance(self.record.previous, RecordSummary)
+        self.assertIsInstance(self.record.parent, RecordSummary)
         self.assertEqual(self.record.is_tna, True)
         self.assertEqual(self.record.is_digitised, False)
 
@@ -162,7 +162,7 @@ class CatalogueRecordResponseTests(SimpleTestCase):
         ):
             with self.subTest(i):
                 hierarchy_record, expected = r[0], r[1]
-                self.assertIsInstance(hierarchy_record, Record)
+                self.assertIsInstance(hierarchy_record, RecordSummary)
                 self.assertEqual(
                     (
                         hierarchy_record.is_tna,
@@ -258,9 +258,9 @@ class CatalogueRecordResponseTests(SimpleTestCase):
         self.assertEqual(self.record.separated_materials, ())
         self.assertEqual(self.record.unpublished_finding_aids, [])
         self.assertEqual(len(self.record.hierarchy), 2)
-        self.assertIsInstance(self.record.next, Record)
-        self.assertIsInstance(self.record.previous, Record)
-        self.assertIsInstance(self.record.parent, Record)
+        self.assertIsInstance(self.record.next, RecordSummary)
+        self.assertIsInstance(self.record.previous, RecordSummary)
+        self.assertIsInstance(self.record.parent, RecordSummary)
         self.assertEqual(self.record.is_tna, True)
         self.assertEqual(self.record.is_digitised, True)
 
@@ -294,7 +294,7 @@ class CatalogueRecordResponseTests(SimpleTestCase):
         ):
             with self.subTest(i):
                 hierarchy_record, expected = r[0], r[1]
-                self.assertIsInstance(hierarchy_record, Record)
+                self.assertIsInstance(hierarchy_record, RecordSummary)
                 self.assertEqual(
                     (
                         hierarchy_record.is_tna,
@@ -121,8 +121,51 @@ class TestRecordEnrichmentHelper(TestCase):
 
         self.assertEqual(len(result), 3)
         mock_subjects.assert_called_once_with(self.test_record, limit=3, timeout=7)
+        # started alongside the subject searches, before the remaining is known
+        mock_series.assert_called_once_with(self.test_record, limit=3, timeout=7)
+
+    @override_settings(
+        ROSETTA_ENRICHMENT_API_TIMEOUT=7, ENABLE_PARALLEL_API_CALLS=False
+    )
+    @patch("app.records.enrichment.get_tna_related_records_by_subjects")
+    @patch("app.records.enrichment.get_related_records_by_series")
+    def test_fetch_related_backfills_from_series_sequentially(
+        self, mock_series: Mock, mock_subjects: Mock
+    ) -> None:
+        """Test that the series is searched for the remaining records after
+        the subjects when not parallel"""
+        mock_subjects.return_value = [Mock(spec=Record, id="C111")]
+        mock_series.return_value = [
+            Mock(spec=Record, id="C222"),
+            Mock(spec=Record, id="C333"),
+        ]
+
+        helper = RecordEnrichmentHelper(self.test_record, related_limit=3)
+        result = helper._fetch_related()
+
+        self.assertEqual([record.id for record in result], ["C111", "C222", "C333"])
         mock_series.assert_called_once_with(self.test_record, limit=2, timeout=7)
 
+    @patch("app.records.enrichment.get_tna_related_records_by_subjects")
+    @patch("app.records.enrichment.get_related_records_by_series")
+    def test_fetch_related_series_backfill_skips_duplicates(
+        self, mock_series: Mock, mock_subjects: Mock
+    ) -> None:
+        """Test that the speculative series search is trimmed to the remaining
+        records, without records already related by subject"""
+        mock_subjects.return_value = [Mock(spec=Record, id="C111")]
+        mock_series.return_value = [
+            Mock(spec=Record, id="C111"),
+            Mock(spec=Record, id="C222"),
+            Mock(spec=Record, id="C333"),
+            Mock(spec=Record, id="C444"),
+        ]
+
+        helper = RecordEnrichmentHelper(self.test_record, related_limit=3)
+        result = helper._fetch_related()
+
+        self.assertEqual([record.id for record in result], ["C111", "C222", "C333"])
+
     def test_should_include_delivery_for_archon(self) -> None:
         """Test that ARCHON records should not include delivery options"""
         self.test_record.custom_record_type = "ARCHON"
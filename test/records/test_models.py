@@ -3,7 +3,7 @@ from unittest.mock import patch
 
 from django.test import SimpleTestCase, override_settings
 
-from app.records.models import Record
+from app.records.models import Record, RecordSummary
 from config.utils.records import normalise_record_field
 
 
@@ -925,7 +925,7 @@ class RecordModelTests(SimpleTestCase):
         ):
             with self.subTest(i):
                 hierarchy_record, expected = r[0], r[1]
-                self.assertIsInstance(hierarchy_record, Record)
+                self.assertIsInstance(hierarchy_record, RecordSummary)
                 self.assertEqual(
                     (
                         hierarchy_record.is_tna,
@@ -955,7 +955,7 @@ class RecordModelTests(SimpleTestCase):
             "identifier": [{"reference_number": "AIR 79/962/107134"}],
         }
 
-        self.assertIsInstance(self.record.next, Record)
+        self.assertIsInstance(self.record.next, RecordSummary)
         self.assertEqual(
             (
                 self.record.next.id,
@@ -990,7 +990,7 @@ class RecordModelTests(SimpleTestCase):
             "identifier": [{"reference_number": "AIR 79/962/107132"}],
         }
 
-        self.assertIsInstance(self.record.previous, Record)
+        self.assertIsInstance(self.record.previous, RecordSummary)
 
         self.assertEqual(
             (
@@ -1026,7 +1026,7 @@ class RecordModelTests(SimpleTestCase):
             },
         }
 
-        self.assertIsInstance(self.record.parent, Record)
+        self.assertIsInstance(self.record.parent, RecordSummary)
         self.assertEqual(
             (
                 self.record.parent.id,
@@ -1226,3 +1226,103 @@ class CleanTitleOrCleanSummaryTitleTests(SimpleTestCase):
             self.record.clean_title_or_summary_title,
             "This   is   the   clean   title",
         )
+
+
+class RecordSummaryTests(SimpleTestCase):
+    def test_from_search_result(self):
+        summary = RecordSummary.from_search_result(
+            {
+                "id": "C123",
+                "referenceNumber": "ADM 1",
+                "summaryTitle": "Summary <mark>title</mark>",
+                "cleanDescription": "Clean description",
+                "heldBy": "The National Archives, Kew",
+                "dateCovering": "1939-1945",
+                "level": {"code": 7},
+                "groupArray": [{"value": "record"}, {"value": "tna"}],
+            }
+        )
+
+        self.assertEqual(summary.id, "C123")
+        self.assertEqual(summary.reference_number, "ADM 1")
+        self.assertEqual(summary.summary_title, "Summary <mark>title</mark>")
+        self.assertEqual(summary.clean_description, "Clean description")
+        self.assertEqual(summary.held_by, "The National Archives, Kew")
+        self.assertEqual(summary.date_covering, "1939-1945")
+        self.assertEqual(summary.level_code, 7)
+        self.assertIs(summary.is_tna, True)
+        self.assertEqual(summary.level, "Item")
+        self.assertEqual(summary.url, "/catalogue/id/C123/")
+        self.assertFalse(hasattr(summary, "__dict__"))
+
+    def test_empty_for_optional_attributes(self):
+        summary = RecordSummary({}, is_tna=False)
+
+        self.assertEqual(summary.id, "")
+        self.assertEqual(summary.reference_number, "")
+        self.assertEqual(summary.title, "")
+        self.assertEqual(summary.summary_title, "")
+        self.assertEqual(summary.clean_description, "")
+        self.assertEqual(summary.held_by, "")
+        self.assertEqual(summary.date_covering, "")
+        self.assertEqual(summary.level_code, None)
+        self.assertEqual(summary.level, "")
+        self.assertEqual(summary.url, "")
+
+    def test_values_from_other_places(self):
+        summary = RecordSummary(
+            {
+                "@admin": {"id": "C123"},
+                "identifier": [{"iaid": "C123"}, {"reference_number": "LO 1"}],
+                "summary": {"title": "Summary title"},
+                "count": 1234,
+            },
+            is_tna=True,
+        )
+
+        self.assertEqual(summary.id, "C123")
+        self.assertEqual(summary.reference_number, "LO 1")
+        self.assertEqual(summary.summary_title, "Summary title")
+        self.assertEqual(summary.hierarchy_count, "1,234")
+
+    def test_is_tna_is_carried_from_page_record(self):
+        record = Record(
+            {
+                "id": "C2",
+                "groupArray": [{"value": "tna"}],
+                "@hierarchy": [
+                    {"identifier": [{"iaid": "C1"}], "id": "C1", "level": {"code": 1}}
+                ],
+                "@next": {"id": "C3", "level": {"code": 7}},
+            }
+        )
+
+        self.assertIs(record.hierarchy[0].is_tna, True)
+        self.assertEqual(record.hierarchy[0].level, "Department")
+        self.assertIs(record.next.is_tna, True)
+        self.assertEqual(record.next.level, "Item")
+
+    def test_is_tna_from_own_group_for_non_tna_page_record(self):
+        record = Record(
+            {
+                "id": "C2",
+                "groupArray": [{"value": "nonTna"}],
+                "@hierarchy": [
+                    {
+                        "identifier": [{"iaid": "C1"}],
+                        "id": "C1",
+                        "level": {"code": 1},
+                        "groupArray": [{"value": "tna"}],
+                    },
+                    {"identifier": [{"iaid": "C3"}], "id": "C3", "level": {"code": 1}},
+                ],
+                "parent": {"id": "C1", "groupArray": [{"value": "tna"}]},
+                "@previous": {"id": "C4"},
+            }
+        )
+
+        self.assertIs(record.hierarchy[0].is_tna, True)
+        self.assertEqual(record.hierarchy[0].level, "Department")
+        self.assertIs(record.hierarchy[1].is_tna, False)
+        self.assertIs(record.parent.is_tna, True)
+        self.assertIs(record.previous.is_tna, False)
@@ -0,0 +1,192 @@
+from http import HTTPStatus
+from unittest.mock import patch
+
+import responses
+from django.conf import settings
+from django.core.cache import cache
+from django.test import SimpleTestCase, TestCase, override_settings
+
+from app.lib import prefetch
+from app.main.constants import GLOBAL_NOTIFICATIONS_CACHE_KEY
+from app.records.cache import (
+    cached_record_details_by_id,
+    get_cached_record,
+    record_cache_key,
+)
+from app.records.models import Record
+from app.records.prefetch import (
+    prefetch_hierarchy,
+    prefetch_record,
+    should_prefetch_records,
+)
+
+BROWSER_USER_AGENT = (
+    "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
+    "(KHTML, like Gecko) Chrome/126.0 Safari/537.36"
+)
+
+
+def record_details(id: str) -> dict:
+    return {
+        "id": id,
+        "title": f"Record {id}",
+        "source": "CAT",
+        "groupArray": [{"value": "tna"}],
+        "@next": {"@admin": {"id": "C2"}},
+        "@previous": {"@admin": {"id": "C0"}},
+        "parent": {"@admin": {"id": "C100"}},
+    }
+
+
+def record_response(id: str) -> dict:
+    return {"data": [{"@template": {"details": record_details(id)}}]}
+
+
+def add_record_responses():
+    for id in ("C0", "C1", "C2", "C100"):
+        responses.add(
+            responses.GET,
+            f"{settings.ROSETTA_API_URL}/get",
+            json=record_response(id),
+            match=[responses.matchers.query_param_matcher({"id": id})],
+        )
+
+
+def get_calls() -> list:
+    return [
+        call
+        for call in responses.calls
+        if call.request.url.startswith(f"{settings.ROSETTA_API_URL}/get")
+    ]
+
+
+class RecordCacheTests(SimpleTestCase):
+    def setUp(self):
+        cache.clear()
+
+    def tearDown(self):
+        cache.clear()
+
+    @responses.activate
+    def test_cached_record_details_by_id(self):
+        add_record_responses()
+
+        record = cached_record_details_by_id("C1")
+        cached_record = cached_record_details_by_id("C1")
+
+        self.assertEqual(len(get_calls()), 1)
+        self.assertEqual(record.id, "C1")
+        self.assertEqual(cached_record.id, "C1")
+        # the version is cached with the record
+        self.assertEqual(vars(cached_record)["version"], record.version)
+
+
+class ShouldPrefetchRecordsTests(SimpleTestCase):
+    @override_settings(ENABLE_RECORD_PREFETCH=True)
+    def test_should_prefetch_records(self):
+        self.assertTrue(should_prefetch_records(BROWSER_USER_AGENT))
+        self.assertFalse(should_prefetch_records("Googlebot/2.1"))
+
+    @override_settings(ENABLE_RECORD_PREFETCH=False)
+    def test_should_not_prefetch_when_disabled(self):
+        self.assertFalse(should_prefetch_records(BROWSER_USER_AGENT))
+
+
+class PrefetchHierarchyTests(SimpleTestCase):
+    def setUp(self):
+        cache.clear()
+
+    def tearDown(self):
+        cache.clear()
+        prefetch._in_flight.clear()
+
+    @responses.activate
+    def test_prefetch_warms_record_cache(self):
+        add_record_responses()
+
+        futures = prefetch_hierarchy(Record(record_details("C1")))
+        for future in futures:
+            future.result(timeout=5)
+
+        self.assertEqual(len(futures), 3)
+        for id in ("C2", "C0", "C100"):
+            with self.subTest(id=id):
+                self.assertEqual(get_cached_record(record_cache_key(id)).id, id)
+        self.assertEqual(prefetch._in_flight, set())
+        # already cached
+        self.assertEqual(prefetch_hierarchy(Record(record_details("C1"))), [])
+        self.assertEqual(len(get_calls()), 3)
+
+    @override_settings(SEARCH_PREFETCH_MAX_IN_FLIGHT=2)
+    def test_prefetch_skipped_when_budget_spent(self):
+        prefetch._in_flight.update({"search_result:other", "record:other"})
+
+        self.assertIsNone(prefetch_record("C2"))
+
+    @responses.activate
+    def test_prefetch_failure_is_not_cached(self):
+        responses.add(
+            responses.GET,
+            f"{settings.ROSETTA_API_URL}/get",
+            status=HTTPStatus.INTERNAL_SERVER_ERROR,
+        )
+
+        prefetch_record("C2").result(timeout=5)
+
+        self.assertIsNone(get_cached_record(record_cache_key("C2")))
+        self.assertEqual(prefetch._in_flight, set())
+
+
+@override_settings(ENABLE_RECORD_PREFETCH=True)
+class RecordDetailViewPrefetchTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        cache.set(
+            GLOBAL_NOTIFICATIONS_CACHE_KEY,
+            {"global_alert": None, "mourning_notice": None},
+        )
+        self.futures = []
+
+    def tearDown(self):
+        cache.clear()
+        prefetch._in_flight.clear()
+
+    def prefetch_hierarchy(self, record):
+        futures = prefetch_hierarchy(record)
+        self.futures.extend(futures)
+        return futures
+
+    @responses.activate
+    def test_next_record_is_served_from_prefetch(self):
+        add_record_responses()
+
+        with patch(
+            "app.records.views.prefetch_hierarchy",
+            side_effect=self.prefetch_hierarchy,
+        ) as mock_prefetch:
+            response = self.client.get(
+                "/catalogue/id/C1/", HTTP_USER_AGENT=BROWSER_USER_AGENT
+            )
+            self.assertEqual(response.status_code, HTTPStatus.OK)
+            mock_prefetch.assert_called_once()
+            for future in self.futures:
+                future.result(timeout=5)
+            self.assertEqual(len(get_calls()), 4)
+
+            response = self.client.get(
+                "/catalogue/id/C2/", HTTP_USER_AGENT=BROWSER_USER_AGENT
+            )
+
+        self.assertEqual(response.status_code, HTTPStatus.OK)
+        self.assertEqual(response.context_data["record"].id, "C2")
+        # C2 from the cache, its hierarchy already cached
+        self.assertEqual(len(get_calls()), 4)
+
+    @responses.activate
+    def test_no_prefetch_for_bots(self):
+        add_record_responses()
+
+        with patch("app.records.views.prefetch_hierarchy") as mock_prefetch:
+            self.client.get("/catalogue/id/C1/", HTTP_USER_AGENT="Googlebot/2.1")
+
+        mock_prefetch.assert_not_called()
@@ -1,8 +1,13 @@
+import threading
 from unittest.mock import Mock, patch
 
-from django.test import TestCase
+from django.test import TestCase, override_settings
 
-from app.records.constants import TnaLevels
+from app.records.constants import (
+    RELATED_SEARCH_FAN_OUT,
+    RELATED_SEARCH_MAX_WORKERS,
+    TnaLevels,
+)
 from app.records.models import Record
 from app.records.related import (
     _LEVEL_FILTERS_SERIES_TO_ITEM,
@@ -218,3 +223,133 @@ class TestSearchIndividualSubjects(TestCase):
         self.assertEqual(level_filters, expected)
         self.assertNotIn(f"level:{TnaLevels.DEPARTMENT.level}", level_filters)
         self.assertNotIn(f"level:{TnaLevels.DIVISION.level}", level_filters)
+
+    @patch("app.records.related.search_records")
+    def test_individual_subjects_searched_concurrently(self, mock_search):
+        """Test that subjects are searched at once, up to the fan-out."""
+        started = threading.Barrier(RELATED_SEARCH_FAN_OUT, timeout=5)
+
+        def search(**kwargs):
+            # each search waits for the others to start
+            started.wait()
+            subject = kwargs["params"]["filter"][1]
+            return Mock(records=[Mock(spec=Record, id=subject)])
+
+        mock_search.side_effect = search
+
+        mock_record = Mock(spec=Record)
+        mock_record.id = "C123"
+        mock_record.subjects = [f"Subject {i}" for i in range(RELATED_SEARCH_FAN_OUT)]
+
+        record_matches = _search_individual_subjects(
+            mock_record, fetch_limit=10, record_matches={}
+        )
+
+        self.assertEqual(len(record_matches), RELATED_SEARCH_FAN_OUT)
+        self.assertFalse(started.broken)
+
+    @patch("app.records.related.search_records")
+    def test_individual_subjects_stop_when_enough_matches(self, mock_search):
+        """Test that no more subjects are searched once there are enough
+        matches."""
+        mock_search.side_effect = lambda **kwargs: Mock(
+            records=[
+                Mock(spec=Record, id=f"{kwargs['params']['filter'][1]}-{i}")
+                for i in range(3)
+            ]
+        )
+
+        mock_record = Mock(spec=Record)
+        mock_record.id = "C123"
+        mock_record.subjects = [f"Subject {i}" for i in range(20)]
+
+        record_matches = _search_individual_subjects(
+            mock_record, fetch_limit=3, record_matches={"C1": Mock(spec=Record)}
+        )
+
+        self.assertGreaterEqual(len(record_matches), 4)
+        # the first searches are enough, later subjects are not searched
+        self.assertLessEqual(mock_search.call_count, RELATED_SEARCH_FAN_OUT)
+
+    @override_settings(ENABLE_PARALLEL_API_CALLS=False)
+    @patch("app.records.related.search_records")
+    def test_individual_subjects_searched_sequentially(self, mock_search):
+        """Test that subjects are searched one at a time when not parallel."""
+        mock_search.side_effect = lambda **kwargs: Mock(
+            records=[Mock(spec=Record, id=kwargs["params"]["filter"][1])]
+        )
+
+        mock_record = Mock(spec=Record)
+        mock_record.id = "C123"
+        mock_record.subjects = ["Army", "Navy", "Air Force"]
+
+        record_matches = _search_individual_subjects(
+            mock_record, fetch_limit=2, record_matches={}
+        )
+
+        self.assertEqual(len(record_matches), 2)
+        self.assertEqual(mock_search.call_count, 2)
+
+    @override_settings(ENABLE_PARALLEL_API_CALLS=False)
+    @patch("app.records.related.search_records")
+    def test_individual_subjects_stop_at_fetch_limit_in_total(self, mock_search):
+        """Test that existing matches count toward the fetch limit."""
+        mock_search.side_effect = lambda **kwargs: Mock(
+            records=[Mock(spec=Record, id=kwargs["params"]["filter"][1])]
+        )
+
+        mock_record = Mock(spec=Record)
+        mock_record.id = "C123"
+        mock_record.subjects = ["Army", "Navy", "Air Force"]
+
+        record_matches = _search_individual_subjects(
+            mock_record, fetch_limit=2, record_matches={"C1": Mock(spec=Record)}
+        )
+
+        self.assertEqual(len(record_matches), 2)
+        self.assertEqual(mock_search.call_count, 1)
+
+    @patch("app.records.related._in_flight", RELATED_SEARCH_MAX_WORKERS)
+    @patch("app.records.related.search_records")
+    def test_individual_subjects_searched_inline_when_saturated(self, mock_search):
+        """Test that subjects are searched in the request's thread while the
+        search threads are all busy."""
+        threads = []
+
+        def search(**kwargs):
+            threads.append(threading.current_thread())
+            return Mock(records=[Mock(spec=Record, id=kwargs["params"]["filter"][1])])
+
+        mock_search.side_effect = search
+
+        mock_record = Mock(spec=Record)
+        mock_record.id = "C123"
+        mock_record.subjects = ["Army", "Navy"]
+
+        record_matches = _search_individual_subjects(
+            mock_record, fetch_limit=2, record_matches={}
+        )
+
+        self.assertEqual(len(record_matches), 2)
+        self.assertEqual(threads, [threading.current_thread()] * 2)
+
+    @patch("app.records.related.RELATED_SEARCH_WAIT_TIMEOUT", 0.05)
+    @patch("app.records.related.search_records")
+    def test_individual_subjects_wait_is_bounded(self, mock_search):
+        """Test that a request without a deadline stops waiting for searches
+        queued or running too long."""
+        release = threading.Event()
+        mock_search.side_effect = lambda **kwargs: release.wait(timeout=5)
+
+        mock_record = Mock(spec=Record)
+        mock_record.id = "C123"
+        mock_record.subjects = ["Army"]
+
+        try:
+            record_matches = _search_individual_subjects(
+                mock_record, fetch_limit=2, record_matches={}
+            )
+        finally:
+            release.set()
+
+        self.assertEqual(record_matches, {})
@@ -1,7 +1,7 @@
 from django.test import SimpleTestCase
 
 from app.lib.xslt_transformations import SERIES_TRANSFORMATIONS
-from app.records.models import Record
+from app.records.models import Record, RecordSummary
 from config.utils.records import normalise_record_field
 
 
@@ -84,7 +84,7 @@ class SeriesTransformationTests(SimpleTestCase):
             },
         ]
 
-        self.assertIsInstance(self.record.hierarchy_series, Record)
+        self.assertIsInstance(self.record.hierarchy_series, RecordSummary)
         self.assertEqual(self.record.hierarchy_series.id, "C1948")
         self.assertEqual(self.record.hierarchy_series.level, "Series")
         self.assertEqual(self.record.hierarchy_series.level_code, 3)
@@ -200,7 +200,7 @@ class SeriesTransformationTests(SimpleTestCase):
             },
         ]
 
-        self.assertIsInstance(self.record.hierarchy_series, Record)
+        self.assertIsInstance(self.record.hierarchy_series, RecordSummary)
         self.assertEqual(self.record.hierarchy_series.id, "C1810")
         self.assertEqual(self.record.hierarchy_series.level, "Series")
         self.assertEqual(self.record.hierarchy_series.level_code, 3)
@@ -6,6 +6,7 @@ from app.records.utils import (
     change_discovery_record_details_links,
     extract,
     format_link,
+    get_path_accessor,
 )
 
 TODAY = date.today()
@@ -75,6 +76,31 @@ class TestExtract(SimpleTestCase):
                 )
 
 
+class TestGetPathAccessor(SimpleTestCase):
+    def test_accessor_is_compiled_once_per_key(self):
+        accessor = get_path_accessor("item.children.0.id")
+
+        self.assertIs(get_path_accessor("item.children.0.id"), accessor)
+        self.assertEqual(
+            accessor.steps,
+            (("item", None), ("children", None), ("0", 0), ("id", None)),
+        )
+
+    def test_accessor_is_reusable_across_sources(self):
+        accessor = get_path_accessor("level.code")
+
+        self.assertEqual(accessor({"level": {"code": 1}}), 1)
+        self.assertEqual(accessor({"level": {"code": 7}}), 7)
+        self.assertIsNone(accessor({"level": None}))
+        self.assertEqual(accessor({}, ""), "")
+
+    def test_numeric_key_is_looked_up_as_dict_key(self):
+        accessor = get_path_accessor("item.0")
+
+        self.assertEqual(accessor({"item": {"0": "key"}}), "key")
+        self.assertEqual(accessor({"item": ["index"]}), "index")
+
+
 class TestFormatLink(SimpleTestCase):
     def test_format_link(self):
         test_data = (
@@ -1,4 +1,4 @@
-import copy
+from dataclasses import FrozenInstanceError
 
 from django.test import TestCase
 
@@ -47,7 +47,6 @@ class TestBuckets(TestCase):
         }
 
         self.buckets = APISearchResponse(self.api_results).buckets
-        self.bucket_list = copy.deepcopy(CATALOGUE_BUCKETS)
 
     def test_bucket_items_without_query(self):
 
@@ -77,24 +76,24 @@ class TestBuckets(TestCase):
 
         for label, current_bucket_key, expected in test_data:
             with self.subTest(label):
-                self.bucket_list.update_buckets_for_display(
+                bucket_list = CATALOGUE_BUCKETS.for_display(
                     query=query,
                     buckets=self.buckets,
                     current_bucket_key=current_bucket_key,
                 )
 
-                self.assertListEqual(self.bucket_list.items, expected)
+                self.assertListEqual(bucket_list.items, expected)
 
     def test_bucket_items_with_query(self):
 
-        self.bucket_list.update_buckets_for_display(
+        bucket_list = CATALOGUE_BUCKETS.for_display(
             query="ufo",
             buckets=self.buckets,
             current_bucket_key=BucketKeys.TNA,
         )
 
         self.assertListEqual(
-            self.bucket_list.items,
+            bucket_list.items,
             [
                 {
                     "name": "Records at the National Archives (26,008,838)",
@@ -109,6 +108,37 @@ class TestBuckets(TestCase):
             ],
         )
 
+    def test_display_leaves_configured_buckets_unchanged(self):
+        first = CATALOGUE_BUCKETS.for_display(
+            query="ufo",
+            buckets=self.buckets,
+            current_bucket_key=BucketKeys.NON_TNA,
+        )
+        second = CATALOGUE_BUCKETS.for_display(
+            query="",
+            buckets={},
+            current_bucket_key=BucketKeys.TNA,
+        )
+
+        self.assertEqual(
+            [item["current"] for item in first.items],
+            [False, True],
+        )
+        self.assertEqual(
+            second.items[0],
+            {
+                "name": "Records at the National Archives (0)",
+                "href": "?group=tna",
+                "current": True,
+            },
+        )
+        for display in first:
+            self.assertIs(
+                display.bucket, CATALOGUE_BUCKETS.get_bucket(display.bucket.key)
+            )
+        with self.assertRaises(FrozenInstanceError):
+            CATALOGUE_BUCKETS.get_bucket(BucketKeys.TNA).label = "changed"
+
 
 class TestEnumChoices(TestCase):
     def test_bucket_keys_enum_choices(self):
@@ -0,0 +1,156 @@
+from django.core.cache import cache
+from django.test import SimpleTestCase
+
+from app.search.long_filters import (
+    LETTERS,
+    OTHER_LETTER,
+    LongFilterIndex,
+    LongFilterPage,
+    cache_long_filter,
+    get_cached_long_filter,
+    long_filter_cache_key,
+    normalise_value,
+)
+from app.search.models import APISearchResponse
+
+ENTRIES = [
+    {"value": "Navy", "doc_count": 90},
+    {"value": "Army", "doc_count": 80},
+    {"value": "Émigrés", "doc_count": 70},
+    {"value": "army chaplains", "doc_count": 60},
+    {"value": "18th century", "doc_count": 50},
+    {"value": "Aviation", "doc_count": 40},
+]
+
+
+class NormaliseValueTests(SimpleTestCase):
+    def test_normalise_value(self):
+        for value, expected in (
+            ("Army", "army"),
+            (" Émigrés ", "emigres"),
+            ("STRASSE", "strasse"),
+            ("", ""),
+        ):
+            with self.subTest(value=value):
+                self.assertEqual(normalise_value(value), expected)
+
+
+class LongFilterIndexTests(SimpleTestCase):
+    def setUp(self):
+        self.index = LongFilterIndex(ENTRIES)
+
+    def test_entries_keep_api_order(self):
+        self.assertEqual(len(self.index), 6)
+        self.assertEqual(self.index.entries[0]["value"], "Navy")
+
+    def test_letters(self):
+        self.assertEqual(tuple(self.index.letters), LETTERS)
+        self.assertEqual(
+            [entry["value"] for entry in self.index.for_letter("A")],
+            ["Army", "army chaplains", "Aviation"],
+        )
+        self.assertEqual(
+            [entry["value"] for entry in self.index.for_letter("E")], ["Émigrés"]
+        )
+        self.assertEqual(
+            [entry["value"] for entry in self.index.for_letter(OTHER_LETTER)],
+            ["18th century"],
+        )
+        self.assertEqual(self.index.for_letter("Z"), ())
+        self.assertEqual(self.index.letter_counts()["A"], 3)
+        self.assertEqual(self.index.letter_counts()["B"], 0)
+
+    def test_with_prefix(self):
+        for prefix, expected in (
+            ("ar", ["Army", "army chaplains"]),
+            ("ARMY ", ["Army", "army chaplains"]),
+            ("army c", ["army chaplains"]),
+            ("emi", ["Émigrés"]),
+            ("émi", ["Émigrés"]),
+            ("1", ["18th century"]),
+            ("x", []),
+        ):
+            with self.subTest(prefix=prefix):
+                self.assertEqual(
+                    [entry["value"] for entry in self.index.with_prefix(prefix)],
+                    expected,
+                )
+
+    def test_get(self):
+        self.assertEqual(self.index.get("Army"), {"value": "Army", "doc_count": 80})
+        self.assertIsNone(self.index.get("Unknown"))
+
+
+class LongFilterPageTests(SimpleTestCase):
+    def setUp(self):
+        self.index = LongFilterIndex(ENTRIES)
+
+    def test_all_entries_paginated_in_api_order(self):
+        page = LongFilterPage(self.index, page=2, per_page=4)
+        self.assertEqual(page.total, 6)
+        self.assertEqual(page.pages, 2)
+        self.assertEqual(
+            [entry["value"] for entry in page.entries], ["18th century", "Aviation"]
+        )
+
+    def test_letter(self):
+        page = LongFilterPage(self.index, letter="A", per_page=2)
+        self.assertEqual(page.letter, "A")
+        self.assertEqual(page.total, 3)
+        self.assertEqual(page.pages, 2)
+        self.assertEqual(
+            [entry["value"] for entry in page.entries], ["Army", "army chaplains"]
+        )
+
+    def test_prefix_takes_precedence_over_letter(self):
+        page = LongFilterPage(self.index, letter="N", prefix="av")
+        self.assertEqual(page.letter, "")
+        self.assertEqual([entry["value"] for entry in page.entries], ["Aviation"])
+
+    def test_no_entries(self):
+        page = LongFilterPage(self.index, letter="Z")
+        self.assertEqual(page.total, 0)
+        self.assertEqual(page.pages, 0)
+        self.assertEqual(page.entries, ())
+
+
+class LongFilterCacheTests(SimpleTestCase):
+    def setUp(self):
+        cache.clear()
+
+    def tearDown(self):
+        cache.clear()
+
+    def test_cache_key_depends_on_search(self):
+        params = {"filter": ["group:tna"], "aggs": "longSubject"}
+        key = long_filter_cache_key("", "", params)
+        self.assertTrue(key.startswith("long_filter_index:"))
+        self.assertEqual(
+            key,
+            long_filter_cache_key(
+                "", "", {"aggs": "longSubject", "filter": ["group:tna"]}
+            ),
+        )
+        self.assertNotEqual(key, long_filter_cache_key("ufo", "", params))
+
+    def test_cache_long_filter(self):
+        api_result = APISearchResponse(
+            {
+                "data": [],
+                "aggregations": [{"name": "longSubject", "entries": ENTRIES}],
+                "buckets": [],
+            }
+        )
+        self.assertIsNone(get_cached_long_filter("key"))
+
+        index = cache_long_filter("key", api_result, "longSubject")
+
+        self.assertEqual(len(index), 6)
+        cached_api_result, cached_index = get_cached_long_filter("key")
+        self.assertEqual(cached_api_result.aggregations, api_result.aggregations)
+        # the version is cached with the result
+        self.assertEqual(vars(cached_api_result)["version"], api_result.version)
+        self.assertEqual(
+            [entry["value"] for entry in cached_index.for_letter("A")],
+            ["Army", "army chaplains", "Aviation"],
+        )
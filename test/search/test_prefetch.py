@@ -0,0 +1,328 @@
+import threading
+import time
+from http import HTTPStatus
+from unittest.mock import patch
+
+import responses
+from django.conf import settings
+from django.core.cache import cache
+from django.test import SimpleTestCase, TestCase, override_settings
+
+from app.lib import prefetch
+from app.search.cache import (
+    cached_search_records,
+    get_cached_search_result,
+    search_cache_key,
+)
+from app.search.prefetch import is_bot, prefetch_search_page, should_prefetch
+
+BROWSER_USER_AGENT = (
+    "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
+    "(KHTML, like Gecko) Chrome/126.0 Safari/537.36"
+)
+
+
+def search_response(total: int = 100) -> dict:
+    return {
+        "data": [
+            {
+                "@template": {
+                    "details": {
+                        "id": "C123456",
+                        "source": "CAT",
+                    }
+                }
+            }
+        ],
+        "aggregations": [],
+        "buckets": [
+            {
+                "name": "group",
+                "entries": [
+                    {"value": "tna", "count": total},
+                ],
+            }
+        ],
+        "stats": {
+            "total": total,
+            "results": 20,
+        },
+    }
+
+
+def search_calls() -> list:
+    return [
+        call
+        for call in responses.calls
+        if call.request.url.startswith(f"{settings.ROSETTA_API_URL}/search")
+    ]
+
+
+class SearchCacheTests(SimpleTestCase):
+    def setUp(self):
+        cache.clear()
+
+    def tearDown(self):
+        cache.clear()
+
+    def test_search_cache_key_is_canonical(self):
+        key = search_cache_key(
+            "army", 20, 2, "", {"filter": ["group:tna", "level:Item"], "aggs": ["a"]}
+        )
+        self.assertTrue(key.startswith("search_result:"))
+        self.assertEqual(
+            key,
+            search_cache_key(
+                "army",
+                20,
+                2,
+                "",
+                {"aggs": ["a"], "filter": ["level:Item", "group:tna"]},
+            ),
+        )
+        for other_key in (
+            search_cache_key("navy", 20, 2, "", {"filter": ["group:tna"]}),
+            search_cache_key("army", 20, 3, "", {"filter": ["group:tna"]}),
+            search_cache_key("army", 20, 2, "title:asc", {"filter": ["group:tna"]}),
+        ):
+            with self.subTest(other_key=other_key):
+                self.assertNotEqual(key, other_key)
+
+    @responses.activate
+    def test_cached_search_records(self):
+        responses.add(
+            responses.GET,
+            f"{settings.ROSETTA_API_URL}/search",
+            json=search_response(),
+        )
+        params = {"filter": ["group:tna"]}
+
+        api_result = cached_search_records("army", 20, 2, "", params)
+        cached_api_result = cached_search_records("army", 20, 2, "", params)
+
+        self.assertEqual(len(responses.calls), 1)
+        self.assertEqual(api_result.stats_total, 100)
+        self.assertEqual(cached_api_result.stats_total, 100)
+        # the version is cached with the result
+        self.assertEqual(vars(cached_api_result)["version"], api_result.version)
+        # params are unchanged by the search
+        self.assertEqual(params, {"filter": ["group:tna"]})
+
+
+class ShouldPrefetchTests(SimpleTestCase):
+    def test_is_bot(self):
+        for user_agent, expected in (
+            (BROWSER_USER_AGENT, False),
+            ("Googlebot/2.1 (+http://www.google.com/bot.html)", True),
+            ("Mozilla/5.0 (compatible; bingbot/2.0)", True),
+            ("Mozilla/5.0 HeadlessChrome/126.0", True),
+            ("", True),
+        ):
+            with self.subTest(user_agent=user_agent):
+                self.assertEqual(is_bot(user_agent), expected)
+
+    @override_settings(ENABLE_SEARCH_PREFETCH=True, ENABLE_SEARCH_CACHE=True)
+    def test_should_prefetch(self):
+        for user_agent, next_page, pages, expected in (
+            (BROWSER_USER_AGENT, 2, 10, True),
+            (BROWSER_USER_AGENT, 11, 10, False),
+            (BROWSER_USER_AGENT, 495, 500, True),
+            (BROWSER_USER_AGENT, 496, 500, False),
+            ("Googlebot/2.1", 2, 10, False),
+        ):
+            with self.subTest(user_agent=user_agent, next_page=next_page):
+                self.assertEqual(
+                    should_prefetch(user_agent, next_page, pages), expected
+                )
+
+    @override_settings(ENABLE_SEARCH_PREFETCH=False)
+    def test_should_not_prefetch_when_disabled(self):
+        self.assertFalse(should_prefetch(BROWSER_USER_AGENT, 2, 10))
+
+    @override_settings(ENABLE_SEARCH_PREFETCH=True, ENABLE_SEARCH_CACHE=False)
+    def test_should_not_prefetch_without_search_cache(self):
+        self.assertFalse(should_prefetch(BROWSER_USER_AGENT, 2, 10))
+
+
+class PrefetchSearchPageTests(SimpleTestCase):
+    def setUp(self):
+        cache.clear()
+
+    def tearDown(self):
+        cache.clear()
+        prefetch._in_flight.clear()
+
+    @responses.activate
+    def test_prefetch_warms_search_cache(self):
+        responses.add(
+            responses.GET,
+            f"{settings.ROSETTA_API_URL}/search",
+            json=search_response(),
+        )
+        params = {"filter": ["group:tna"]}
+
+        future = prefetch_search_page("army", 20, 2, "", params)
+        future.result(timeout=5)
+
+        key = search_cache_key("army", 20, 2, "", params)
+        self.assertEqual(get_cached_search_result(key).stats_total, 100)
+        self.assertEqual(prefetch._in_flight, set())
+        # already cached
+        self.assertIsNone(prefetch_search_page("army", 20, 2, "", params))
+        self.assertEqual(len(responses.calls), 1)
+
+    @override_settings(SEARCH_PREFETCH_MAX_IN_FLIGHT=1)
+    def test_prefetch_skipped_when_budget_spent(self):
+        prefetch._in_flight.add("search_result:other")
+
+        self.assertIsNone(prefetch_search_page("army", 20, 2, "", {}))
+
+    @responses.activate
+    def test_prefetch_failure_is_not_cached(self):
+        responses.add(
+            responses.GET,
+            f"{settings.ROSETTA_API_URL}/search",
+            status=HTTPStatus.INTERNAL_SERVER_ERROR,
+        )
+
+        future = prefetch_search_page("army", 20, 2, "", {})
+        future.result(timeout=5)
+
+        self.assertIsNone(
+            get_cached_search_result(search_cache_key("army", 20, 2, "", {}))
+        )
+        self.assertEqual(prefetch._in_flight, set())
+
+    def test_one_executor_for_concurrent_requests(self):
+        def slow_executor(**kwargs):
+            time.sleep(0.01)
+            return object()
+
+        with (
+            patch.object(prefetch, "_executor", None),
+            patch(
+                "app.lib.prefetch.ThreadPoolExecutor", side_effect=slow_executor
+            ) as mock_executor,
+        ):
+            threads = [
+                threading.Thread(target=prefetch._get_executor) for _ in range(8)
+            ]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+
+        mock_executor.assert_called_once()
+
+
+@override_settings(ENABLE_SEARCH_PREFETCH=True, ENABLE_SEARCH_CACHE=True)
+class CatalogueSearchViewPrefetchTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.futures = []
+
+    def tearDown(self):
+        cache.clear()
+        prefetch._in_flight.clear()
+
+    def prefetch_search_page(self, **kwargs):
+        future = prefetch_search_page(**kwargs)
+        self.futures.append(future)
+        return future
+
+    @responses.activate
+    def test_next_page_is_served_from_prefetch(self):
+        responses.add(
+            responses.GET,
+            f"{settings.ROSETTA_API_URL}/search",
+            json=search_response(),
+        )
+
+        with patch(
+            "app.search.views.prefetch_search_page",
+            side_effect=self.prefetch_search_page,
+        ) as mock_prefetch:
+            response = self.client.get(
+                "/catalogue/search/?q=army", HTTP_USER_AGENT=BROWSER_USER_AGENT
+            )
+            self.assertEqual(response.status_code, HTTPStatus.OK)
+            mock_prefetch.assert_called_once()
+            self.assertEqual(mock_prefetch.call_args.kwargs["page"], 2)
+            self.futures[0].result(timeout=5)
+            self.assertEqual(len(search_calls()), 2)
+
+            response = self.client.get(
+                "/catalogue/search/?q=army&page=2", HTTP_USER_AGENT=BROWSER_USER_AGENT
+            )
+
+        self.assertEqual(response.status_code, HTTPStatus.OK)
+        self.assertEqual(response.context_data["results_range"], {"from": 21, "to": 40})
+        # page 2 from the cache, page 3 prefetched
+        self.assertEqual(mock_prefetch.call_args.kwargs["page"], 3)
+        self.futures[1].result(timeout=5)
+        self.assertEqual(len(search_calls()), 3)
+        self.assertEqual(
+            [call.request.params.get("from") for call in search_calls()],
+            ["0", "20", "40"],
+        )
+
+    @responses.activate
+    def test_no_prefetch_for_bots_or_last_page(self):
+        responses.add(
+            responses.GET,
+            f"{settings.ROSETTA_API_URL}/search",
+            json=search_response(total=30),
+        )
+
+        with patch("app.search.views.prefetch_search_page") as mock_prefetch:
+            self.client.get(
+                "/catalogue/search/?q=army", HTTP_USER_AGENT="Googlebot/2.1"
+            )
+            self.client.get(
+                "/catalogue/search/?q=army&page=2", HTTP_USER_AGENT=BROWSER_USER_AGENT
+            )
+
+        mock_prefetch.assert_not_called()
+
+    @responses.activate
+    def test_no_prefetch_for_long_filters(self):
+        responses.add(
+            responses.GET,
+            f"{settings.ROSETTA_API_URL}/search",
+            json=search_response(),
+        )
+
+        with patch("app.search.views.prefetch_search_page") as mock_prefetch:
+            self.client.get(
+                "/catalogue/search/?filter_list=longSubject",
+                HTTP_USER_AGENT=BROWSER_USER_AGENT,
+            )
+
+        mock_prefetch.assert_not_called()
+
+
+@override_settings(ENABLE_SEARCH_PREFETCH=False, ENABLE_SEARCH_CACHE=True)
+class CatalogueSearchViewCacheTests(TestCase):
+    def setUp(self):
+        cache.clear()
+
+    def tearDown(self):
+        cache.clear()
+
+    @responses.activate
+    def test_search_cache_without_prefetch(self):
+        responses.add(
+            responses.GET,
+            f"{settings.ROSETTA_API_URL}/search",
+            json=search_response(),
+        )
+
+        with patch("app.search.views.prefetch_search_page") as mock_prefetch:
+            for _ in range(2):
+                response = self.client.get(
+                    "/catalogue/search/?q=army", HTTP_USER_AGENT=BROWSER_USER_AGENT
+                )
+                self.assertEqual(response.status_code, HTTPStatus.OK)
+
+        mock_prefetch.assert_not_called()
+        self.assertEqual(len(search_calls()), 1)
@@ -0,0 +1,306 @@
+import threading
+from http import HTTPStatus
+from unittest.mock import patch
+
+import responses
+from django.conf import settings
+from django.core.cache import cache
+from django.test import SimpleTestCase, TestCase
+
+from app.main.cache import get_subject_picker
+from app.search import suggestions
+from app.search.constants import FieldsConstant
+from app.search.suggestions import (
+    Suggestion,
+    SuggestionIndex,
+    build_suggestion_index,
+    get_suggestion_index,
+)
+
+SOURCES = {
+    "version": "v1",
+    "subject": [
+        {"value": "Army", "doc_count": 500},
+        {"value": "British Army", "doc_count": 50},
+        {"value": "Armed forces", "doc_count": 900},
+        {"value": "Navy", "doc_count": 300},
+    ],
+    "collection": [
+        {"value": "ADM", "doc_count": 1000},
+        {"value": "WO", "doc_count": 2000},
+    ],
+    "held_by": [
+        {"value": "Armagh Observatory", "doc_count": 10},
+    ],
+}
+
+
+def long_aggregation_response(name: str, entries: list[dict]) -> dict:
+    return {
+        "data": [],
+        "aggregations": [{"name": name, "entries": entries, "other": 0}],
+        "buckets": [
+            {
+                "name": "group",
+                "entries": [
+                    {"value": "tna", "count": 1},
+                    {"value": "nonTna", "count": 1},
+                ],
+            }
+        ],
+        "stats": {"total": 2, "results": 0},
+    }
+
+
+class SuggestionIndexTests(SimpleTestCase):
+    def setUp(self):
+        self.index = SuggestionIndex(
+            [
+                Suggestion(
+                    "subject", entry["value"], entry["value"], entry["doc_count"]
+                )
+                for entry in SOURCES["subject"]
+            ]
+            + [Suggestion("held_by", "Armagh Observatory", "Armagh Observatory", 10)],
+            version="v1",
+        )
+
+    def suggested(self, query: str, limit: int = 10) -> list[str]:
+        return [
+            suggestion.value for suggestion in self.index.suggest(query, limit=limit)
+        ]
+
+    def test_suggestions_ranked_by_count(self):
+        for query, expected in (
+            # ranked when the index is built
+            ("ar", ["Armed forces", "Army", "British Army", "Armagh Observatory"]),
+            # ranked per query
+            ("arm", ["Armed forces", "Army", "British Army", "Armagh Observatory"]),
+            ("army", ["Army", "British Army"]),
+            ("ARMY ", ["Army", "British Army"]),
+            ("british a", ["British Army"]),
+            ("xyz", []),
+            ("", []),
+        ):
+            with self.subTest(query=query):
+                self.assertEqual(self.suggested(query), expected)
+
+    def test_limit(self):
+        self.assertEqual(self.suggested("ar", limit=2), ["Armed forces", "Army"])
+        self.assertEqual(self.suggested("arm", limit=2), ["Armed forces", "Army"])
+
+    def test_as_dict(self):
+        self.assertEqual(
+            self.index.suggest("navy")[0].as_dict(),
+            {
+                "text": "Navy",
+                "value": "Navy",
+                "type": "subject",
+                "count": 300,
+                "href": "/catalogue/search/?group=tna&subject=Navy",
+            },
+        )
+        self.assertEqual(
+            self.index.suggest("armagh")[0].href,
+            "/catalogue/search/?group=nonTna&held_by=Armagh+Observatory",
+        )
+
+    def test_version(self):
+        self.assertEqual(self.index.version, "v1")
+        self.assertEqual(len(self.index), 5)
+        self.assertEqual(len(SuggestionIndex([])), 0)
+
+
+class BuildSuggestionIndexTests(SimpleTestCase):
+    def setUp(self):
+        self.index = build_suggestion_index(SOURCES)
+
+    def test_sources(self):
+        self.assertEqual(self.index.version, "v1")
+        self.assertEqual(
+            [suggestion.value for suggestion in self.index.suggest("army")],
+            ["Army", "British Army"],
+        )
+        self.assertEqual(self.index.suggest("armagh")[0].field_name, "held_by")
+
+    def test_collections_by_code_and_name(self):
+        adm = self.index.suggest("adm")[0]
+        self.assertEqual(adm.value, "ADM")
+        self.assertEqual(adm.count, 1000)
+        self.assertEqual(
+            adm.text, "ADM - Admiralty, Navy, Royal Marines, and Coastguard"
+        )
+        self.assertEqual(self.index.suggest("admiralty")[0], adm)
+        # configured collections are suggested without records
+        air = self.index.suggest("air ministry")[0]
+        self.assertEqual((air.value, air.count), ("AIR", 0))
+
+
+class GetSuggestionIndexTests(SimpleTestCase):
+    def setUp(self):
+        cache.clear()
+        self.reset_index()
+
+    def tearDown(self):
+        cache.clear()
+        self.reset_index()
+
+    def reset_index(self):
+        suggestions._index = SuggestionIndex([])
+        suggestions._retry_after = 0.0
+        suggestions._refreshing = None
+
+    def add_search_responses(self, subjects: list[dict]):
+        for name, entries in (
+            ("longSubject", subjects),
+            ("longCollection", SOURCES["collection"]),
+            ("longHeldBy", SOURCES["held_by"]),
+        ):
+            responses.add(
+                responses.GET,
+                f"{settings.ROSETTA_API_URL}/search",
+                json=long_aggregation_response(name, entries),
+                match=[
+                    responses.matchers.query_param_matcher(
+                        {"aggs": name}, strict_match=False
+                    )
+                ],
+            )
+
+    def wait_for_refresh(self):
+        suggestions._refreshing.result(timeout=5)
+
+    @responses.activate
+    def test_index_is_built_once_and_rebuilt_for_new_version(self):
+        self.add_search_responses(SOURCES["subject"])
+
+        # answered from the empty index while it is built
+        self.assertEqual(len(get_suggestion_index()), 0)
+        self.wait_for_refresh()
+        index = get_suggestion_index()
+
+        self.assertEqual(len(responses.calls), 3)
+        self.assertEqual(index.suggest("army")[0].value, "Army")
+        # answered without calling the API
+        self.assertIs(get_suggestion_index(), index)
+        self.assertEqual(len(responses.calls), 3)
+
+        # sources refreshed, i.e. cache expired
+        responses.reset()
+        self.add_search_responses([{"value": "Nursing", "doc_count": 5}])
+        cache.clear()
+
+        self.assertIs(get_suggestion_index(), index)
+        self.wait_for_refresh()
+        new_index = get_suggestion_index()
+
+        self.assertIsNot(new_index, index)
+        self.assertNotEqual(new_index.version, index.version)
+        self.assertEqual(new_index.suggest("nurs")[0].value, "Nursing")
+        self.assertEqual(new_index.suggest("army"), [])
+
+    @responses.activate
+    def test_subjects_from_the_subject_picker(self):
+        self.add_search_responses(SOURCES["subject"])
+        get_subject_picker()
+        self.assertEqual(len(responses.calls), 1)
+
+        get_suggestion_index()
+        self.wait_for_refresh()
+
+        # only the collection and held by aggregations are fetched
+        self.assertEqual(len(responses.calls), 3)
+        self.assertEqual(
+            [
+                suggestion.field_name
+                for suggestion in get_suggestion_index().suggest("navy")
+                if suggestion.value == "Navy"
+            ],
+            [FieldsConstant.SUBJECT],
+        )
+
+    @responses.activate
+    def test_previous_index_kept_when_fetch_fails(self):
+        self.add_search_responses(SOURCES["subject"])
+        get_suggestion_index()
+        self.wait_for_refresh()
+        index = get_suggestion_index()
+        cache.clear()
+        responses.reset()
+        responses.add(
+            responses.GET,
+            f"{settings.ROSETTA_API_URL}/search",
+            status=HTTPStatus.INTERNAL_SERVER_ERROR,
+        )
+
+        with self.assertLogs("app.search.suggestions", level="ERROR"):
+            self.assertIs(get_suggestion_index(), index)
+            self.wait_for_refresh()
+        self.assertIs(suggestions._index, index)
+        # no retry until the retry timeout
+        self.assertIs(get_suggestion_index(), index)
+        self.wait_for_refresh()
+        self.assertEqual(len(responses.calls), 1)
+
+    def test_keystrokes_do_not_wait_for_the_build(self):
+        building = threading.Event()
+        release = threading.Event()
+
+        def fetch_suggestion_sources():
+            building.set()
+            release.wait(timeout=5)
+            return dict(SOURCES)
+
+        with patch(
+            "app.search.suggestions.fetch_suggestion_sources",
+            side_effect=fetch_suggestion_sources,
+        ):
+            get_suggestion_index()
+            self.assertTrue(building.wait(timeout=5))
+            # the build is running, keystrokes get the current index
+            self.assertEqual(len(get_suggestion_index()), 0)
+            release.set()
+            self.wait_for_refresh()
+
+        self.assertEqual(get_suggestion_index().version, "v1")
+
+
+class SuggestionsViewTests(TestCase):
+    @patch(
+        "app.search.views.get_suggestion_index",
+        return_value=build_suggestion_index(SOURCES),
+    )
+    def test_suggestions(self, mock_get_suggestion_index):
+        response = self.client.get("/catalogue/search/suggestions/?q=army")
+
+        self.assertEqual(response.status_code, HTTPStatus.OK)
+        self.assertEqual(response["Content-Type"], "application/json")
+        self.assertEqual(
+            response.json(),
+            {
+                "q": "army",
+                "suggestions": [
+                    {
+                        "text": "Army",
+                        "value": "Army",
+                        "type": "subject",
+                        "count": 500,
+                        "href": "/catalogue/search/?group=tna&subject=Army",
+                    },
+                    {
+                        "text": "British Army",
+                        "value": "British Army",
+                        "type": "subject",
+                        "count": 50,
+                        "href": "/catalogue/search/?group=tna&subject=British+Army",
+                    },
+                ],
+            },
+        )
+
+    @patch("app.search.views.get_suggestion_index")
+    def test_empty_query(self, mock_get_suggestion_index):
+        response = self.client.get("/catalogue/search/suggestions/?q=+")
+
+        self.assertEqual(response.json(), {"q": "", "suggestions": []})
+        mock_get_suggestion_index.assert_not_called()
@@ -4,7 +4,7 @@ import responses
 from django.conf import settings
 from django.test import TestCase
 
-from app.records.models import Record
+from app.records.models import Record, RecordSummary
 from app.search.buckets import BucketKeys
 from app.search.forms import (
     CatalogueSearchTnaForm,
@@ -101,7 +101,7 @@ class CatalogueSearchViewDefaultTests(TestCase):
 
         self.assertIsInstance(context_data.get("results"), list)
         self.assertEqual(len(context_data.get("results")), 1)
-        self.assertIsInstance(context_data.get("results")[0], Record)
+        self.assertIsInstance(context_data.get("results")[0], RecordSummary)
         self.assertEqual(
             context_data.get("stats"),
             {"total": 26008838, "results": 20},
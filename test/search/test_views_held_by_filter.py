@@ -2,7 +2,7 @@ import responses
 from django.conf import settings
 from django.test import TestCase
 
-from app.records.models import Record
+from app.records.models import Record, RecordSummary
 from app.search.constants import FieldsConstant
 
 
@@ -85,7 +85,7 @@ class CatalogueSearchViewHeldByFilterTests(TestCase):
 
         self.assertIsInstance(context_data.get("results"), list)
         self.assertEqual(len(context_data.get("results")), 2)
-        self.assertIsInstance(context_data.get("results")[0], Record)
+        self.assertIsInstance(context_data.get("results")[0], RecordSummary)
         self.assertEqual(
             context_data.get("stats"),
             {"total": 2, "results": 20},
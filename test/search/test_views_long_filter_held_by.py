@@ -2,6 +2,7 @@ from http import HTTPStatus
 
 import responses
 from django.conf import settings
+from django.core.cache import cache
 from django.test import TestCase
 from django.utils.encoding import force_str
 
@@ -12,6 +13,12 @@ from app.search.forms import DynamicMultipleChoiceField
 class CatalogueSearchViewHeldByMoreFilterChoicesTests(TestCase):
     """HeldBy filter is only available for Non Tna group."""
 
+    def setUp(self):
+        cache.clear()
+
+    def tearDown(self):
+        cache.clear()
+
     @responses.activate
     def test_search_for_more_filter_choices_attributes_without_filters(
         self,
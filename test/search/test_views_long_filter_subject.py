@@ -2,16 +2,23 @@ from http import HTTPStatus
 
 import responses
 from django.conf import settings
+from django.core.cache import cache
 from django.test import TestCase
 from django.utils.encoding import force_str
 
-from app.search.constants import FieldsConstant
+from app.search.constants import LONG_FILTER_CHOICES_PER_PAGE, FieldsConstant
 from app.search.forms import DynamicMultipleChoiceField
 
 
 class CatalogueSearchViewSubjectMoreFilterChoicesTests(TestCase):
     """Subject filter is only available for tna group."""
 
+    def setUp(self):
+        cache.clear()
+
+    def tearDown(self):
+        cache.clear()
+
     @responses.activate
     def test_search_for_more_filter_choices_attributes_without_filters(
         self,
@@ -293,4 +300,145 @@ class CatalogueSearchViewSubjectMoreFilterChoicesTests(TestCase):
         self.assertNotIn(
             """<input type="hidden" name="covering_date_from-day" """, html
         )
-        self.assertNotIn("""<input type="hidden" name="subject" """, html)
+        # selected subjects are checkboxes in the filters form, not hidden inputs
+        long_filters_form = html.split('id="long-filters-form"', 1)[1]
+        self.assertNotIn("""<input type="hidden" name="subject" """, long_filters_form)
+
+
+class CatalogueSearchViewSubjectFilterListBrowseTests(TestCase):
+    """Browsing long subject choices by letter, prefix and page."""
+
+    def setUp(self):
+        cache.clear()
+        responses.add(
+            responses.GET,
+            f"{settings.ROSETTA_API_URL}/search",
+            json={
+                "data": [],
+                "aggregations": [
+                    {
+                        "name": "longSubject",
+                        "entries": [
+                            {"value": "Navy", "doc_count": 90},
+                            {"value": "Army", "doc_count": 80},
+                            {"value": "Aviation", "doc_count": 70},
+                            *(
+                                {"value": f"Subject {number:03}", "doc_count": 1}
+                                for number in range(150)
+                            ),
+                        ],
+                        "total": 1000,
+                        "other": 0,
+                    }
+                ],
+                "buckets": [
+                    {
+                        "name": "group",
+                        "entries": [
+                            {"value": "tna", "count": 1},
+                        ],
+                    }
+                ],
+                "stats": {
+                    "total": 10000,
+                    "results": 0,
+                },
+            },
+            status=HTTPStatus.OK,
+        )
+
+    def tearDown(self):
+        cache.clear()
+
+    @responses.activate
+    def test_choices_are_paginated_and_served_from_cache(self):
+        response = self.client.get("/catalogue/search/?filter_list=longSubject")
+
+        mfc_field = response.context_data.get("mfc_field")
+        mfc_navigation = response.context_data.get("mfc_navigation")
+        self.assertEqual(len(mfc_field.items), LONG_FILTER_CHOICES_PER_PAGE)
+        self.assertEqual(mfc_field.items[0], {"text": "Navy (90)", "value": "Navy"})
+        self.assertEqual(mfc_navigation["total"], 153)
+        self.assertTrue(mfc_navigation["all"]["current"])
+        self.assertEqual(
+            mfc_navigation["pagination"]["next"]["href"],
+            "?filter_list=longSubject&filter_page=2",
+        )
+
+        response = self.client.get(
+            "/catalogue/search/?filter_list=longSubject&filter_page=2"
+        )
+
+        mfc_field = response.context_data.get("mfc_field")
+        self.assertEqual(len(mfc_field.items), 53)
+        self.assertEqual(
+            mfc_field.items[-1], {"text": "Subject 149 (1)", "value": "Subject 149"}
+        )
+        # second page built from the cached index
+        search_calls = [
+            call
+            for call in responses.calls
+            if call.request.url.startswith(f"{settings.ROSETTA_API_URL}/search")
+        ]
+        self.assertEqual(len(search_calls), 1)
+
+    @responses.activate
+    def test_letter(self):
+        response = self.client.get(
+            "/catalogue/search/?filter_list=longSubject&filter_letter=a"
+        )
+
+        mfc_field = response.context_data.get("mfc_field")
+        mfc_navigation = response.context_data.get("mfc_navigation")
+        self.assertEqual(
+            mfc_field.items,
+            [
+                {"text": "Army (80)", "value": "Army"},
+                {"text": "Aviation (70)", "value": "Aviation"},
+            ],
+        )
+        letters = {letter["text"]: letter for letter in mfc_navigation["letters"]}
+        self.assertTrue(letters["A"]["current"])
+        self.assertEqual(
+            letters["N"]["href"], "?filter_list=longSubject&filter_letter=N"
+        )
+        # no subjects for B
+        self.assertEqual(letters["B"]["href"], "")
+        self.assertEqual(mfc_navigation["all"]["href"], "?filter_list=longSubject")
+        self.assertNotIn("next", mfc_navigation["pagination"])
+
+    @responses.activate
+    def test_prefix_keeps_selected_choices(self):
+        response = self.client.get(
+            "/catalogue/search/?filter_list=longSubject&subject=Navy"
+            "&filter_prefix=subject+14"
+        )
+
+        mfc_field = response.context_data.get("mfc_field")
+        mfc_navigation = response.context_data.get("mfc_navigation")
+        html = force_str(response.content)
+        self.assertEqual(
+            [item["value"] for item in mfc_field.items],
+            ["Navy", *(f"Subject {number}" for number in range(140, 150))],
+        )
+        self.assertTrue(mfc_field.items[0]["checked"])
+        self.assertEqual(mfc_navigation["prefix"], "subject 14")
+        self.assertEqual(
+            mfc_navigation["hidden_params"],
+            [("filter_list", "longSubject"), ("subject", "Navy")],
+        )
+        self.assertEqual(
+            response.context_data.get("mfc_cancel_and_return_to_search_url"),
+            "?subject=Navy",
+        )
+        self.assertIn('id="long-filters-prefix-form"', html)
+
+    @responses.activate
+    def test_invalid_page(self):
+        for filter_page in ("0", "abc", "3"):
+            with self.subTest(filter_page=filter_page):
+                response = self.client.get(
+                    "/catalogue/search/?filter_list=longSubject"
+                    f"&filter_page={filter_page}"
+                )
+                self.assertEqual(response.status_code, HTTPStatus.NOT_FOUND)
@@ -3,12 +3,19 @@ from unittest.mock import patch
 
 import responses
 from django.conf import settings
+from django.core.cache import cache
 from django.test import TestCase
 
 
 class CatalogueSearchViewDebugAPINonTnaBucketTests(TestCase):
     """Tests API calls (url) made by the catalogue search view for for nonTna bucket/group."""
 
+    def setUp(self):
+        cache.clear()
+
+    def tearDown(self):
+        cache.clear()
+
     @patch("app.lib.api.logger")
     @responses.activate
     def test_catalogue_debug_api_non_tna(self, mock_logger):
@@ -1,6 +1,12 @@
 """Utils used to support running Tests"""
 
+import json
 import logging
+from http import HTTPStatus
+from io import BytesIO
+
+from requests import Response
+from urllib3 import HTTPResponse
 
 
 def prevent_request_warnings(original_function):
@@ -24,3 +30,16 @@ def prevent_request_warnings(original_function):
         logger.setLevel(previous_logging_level)
 
     return new_function
+
+
+def json_response(data, status_code: int = HTTPStatus.OK) -> Response:
+    """Returns a response with a JSON body, for mocking requests.get"""
+
+    content = json.dumps(data).encode()
+    response = Response()
+    response.status_code = status_code
+    response.headers["Content-Type"] = "application/json"
+    response.raw = HTTPResponse(
+        body=BytesIO(content), status=status_code, preload_content=False
+    )
+    return response